@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Signal namer benchmark: names synthetic hierarchies of stream pipelines (Endpoints in FIFOs in
+# stages in pipelines, as generated by LiteX cores) with the current namer and with the previous
+# (quadratic) implementation, checks that both produce the same names and reports the timings.
+
+import sys
+import time
+import argparse
+import contextlib
+from itertools import combinations, count
+
+from litex.gen.fhdl import namer
+
+# Synthetic Signals --------------------------------------------------------------------------------
+
+class BenchSignal:
+    """Lightweight stand-in for Signal, with the attributes used by the namer.
+
+    Creating real Signals goes through the tracer and would dominate the benchmark time."""
+    _duid = count()
+
+    def __init__(self, backtrace, related=None):
+        self.backtrace     = backtrace
+        self.related       = related
+        self.name_override = None
+        self.duid          = next(self._duid)
+
+def generate_signals(n):
+    """Generates n signals organized as: pipelines / stages / FIFOs / Endpoints / fields."""
+    signals = []
+    number  = count()
+    fields  = ["valid", "ready", "first", "last", "payload_data", "param_id"]
+    while len(signals) < n:
+        pipeline = [("soccore", 0), ("pipeline", next(number)), ("streampipeline", 0)]
+        for stage in range(8):
+            fifo = pipeline + [("stage", next(number)), ("syncfifo", 0), ("syncfifo", 0)]
+            for endpoint in ["sink", "source"]:
+                record = fifo + [(endpoint, next(number)), ("endpoint", next(number)), ("endpoint", 0)]
+                for field in fields:
+                    signal = BenchSignal(record + [(f"{endpoint}_{field}", next(number) % 7)])
+                    signals.append(signal)
+                    # Slices/Registers of the data, named relatively to their signal.
+                    if field == "payload_data":
+                        signals.append(BenchSignal([("d", next(number))], related=signal))
+    return signals[:n]
+
+# Previous Namer -----------------------------------------------------------------------------------
+
+def _update(self, name, number, use_number, current_base=None):
+    key   = (name, number) if use_number else name
+    child = self.children.setdefault(key, namer._HierarchyNode())
+    child.numbers.add(number)
+    child.signal_count += 1
+    if use_number and current_base:
+        child.all_numbers = sorted(current_base.numbers)
+    return child
+
+def _determine_name_usage(node, node_name=""):
+    required_names  = set()
+    child_name_sets = {
+        child_name: _determine_name_usage(child_node, child_name)
+        for child_name, child_node in node.children.items()
+    }
+    for (child1_name, names1), (child2_name, names2) in combinations(child_name_sets.items(), 2):
+        if names1 & names2:
+            node.children[child1_name].use_name = node.children[child2_name].use_name = True
+    for child_name, child_names in child_name_sets.items():
+        if node.children[child_name].use_name:
+            required_names.update((child_name,) + name for name in child_names)
+        else:
+            required_names.update(child_names)
+    if node.signal_count > sum(child.signal_count for child in node.children.values()):
+        node.use_name = True
+        required_names.add((node_name,))
+    return required_names
+
+def _build_signal_name_dict_from_tree(tree, signals):
+    name_dict = {}
+    for signal in signals:
+        elements = []
+        treepos  = tree
+        for step_name, step_n in signal.backtrace:
+            treepos    = treepos.children.get((step_name, step_n)) or treepos.children.get(step_name)
+            use_number = step_n in treepos.all_numbers
+            if treepos.use_name:
+                element_name = step_name if not use_number else f"{step_name}{treepos.all_numbers.index(step_n)}"
+                elements.append(element_name)
+        name_dict[signal] = "_".join(elements)
+    return name_dict
+
+@contextlib.contextmanager
+def previous_namer():
+    patches = [
+        (namer._HierarchyNode, "update",                            _update),
+        (namer,                "_determine_name_usage",             _determine_name_usage),
+        (namer,                "_build_signal_name_dict_from_tree", _build_signal_name_dict_from_tree),
+    ]
+    saved = [(obj, attr, getattr(obj, attr)) for obj, attr, _ in patches]
+    for obj, attr, value in patches:
+        setattr(obj, attr, value)
+    try:
+        yield
+    finally:
+        for obj, attr, value in saved:
+            setattr(obj, attr, value)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def run(signals):
+    start     = time.perf_counter()
+    name_dict = namer._build_signal_name_dict(signals)
+    return name_dict, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX signal namer benchmark.")
+    parser.add_argument("--signals",      default="10000,100000,1000000", help="Comma separated list of signal counts.")
+    parser.add_argument("--previous-max", default=100000, type=int,        help="Largest signal count named with the previous namer.")
+    args = parser.parse_args()
+
+    print(f"{'signals':>10} {'current (s)':>12} {'previous (s)':>13} {'speedup':>8}")
+    for n in [int(n) for n in args.signals.split(",")]:
+        signals = generate_signals(n)
+        name_dict, current = run(signals)
+        if len(set(name_dict.values())) != len(name_dict):
+            print("Names are not unique.")
+            sys.exit(1)
+        if n <= args.previous_max:
+            with previous_namer():
+                previous_name_dict, previous = run(signals)
+            if previous_name_dict != name_dict:
+                print("Names differ from the previous namer.")
+                sys.exit(1)
+            print(f"{n:>10} {current:>12.2f} {previous:>13.2f} {previous/current:>7.1f}x")
+        else:
+            print(f"{n:>10} {current:>12.2f} {'-':>13} {'-':>8}")
+
+if __name__ == "__main__":
+    main()
@@ -434,6 +434,82 @@ class LiteEthEtherboneWishboneMaster(LiteXModule):
             )
         )
 
+# Etherbone Wishbone Burst Master ------------------------------------------------------------------
+
+class LiteEthEtherboneWishboneBurstMaster(LiteXModule):
+    """Etherbone Wishbone Master with Incrementing Bursts.
+
+    Accesses are issued back-to-back, without waiting for the read data to be sent, and sequential
+    accesses are done with Incrementing Bursts (allowing bursting slaves to ack them on each cycle).
+    Read data are stored in a response FIFO from which the replies are streamed.
+    """
+    def __init__(self, fifo_depth=16):
+        self.sink   = sink   = stream.Endpoint(eth_etherbone_mmap_description(32))
+        self.source = source = stream.Endpoint(eth_etherbone_mmap_description(32))
+        self.bus    = bus    = wishbone.Interface(bursting=True)
+
+        # # #
+
+        assert fifo_depth >= 2
+
+        # Current access (registered) and next access (sink), used to decide burst continuation.
+        self.pipe = pipe = stream.PipeValid(eth_etherbone_mmap_description(32))
+        self.comb += sink.connect(pipe.sink)
+        current = pipe.source
+
+        # Response FIFO.
+        self.fifo = fifo = stream.SyncFIFO(eth_etherbone_mmap_description(32), fifo_depth)
+        self.comb += fifo.source.connect(source)
+
+        # Continue burst when the next access is available, sequential (without crossing a 4KB
+        # boundary, that could be a slave boundary) and when the response FIFO has room for it.
+        burst = Signal()
+        self.comb += burst.eq(
+            ~current.last &
+            sink.valid &
+            (sink.we == current.we) &
+            (sink.addr == (current.addr + 1)) &
+            (sink.addr[:10] != 0) &
+            (current.we | (fifo.level < (fifo_depth - 1)))
+        )
+
+        # Once presented, keep End-of-Burst until the access is acked (the slave may already be acking
+        # it as a single access).
+        burst_end = Signal()
+        self.sync += [
+            If(bus.stb & bus.ack,
+                burst_end.eq(0)
+            ).Elif(bus.stb & ~burst,
+                burst_end.eq(1)
+            )
+        ]
+
+        # Wishbone access.
+        self.comb += [
+            bus.stb.eq(current.valid & (current.we | fifo.sink.ready)),
+            bus.cyc.eq(bus.stb),
+            bus.we.eq(current.we),
+            bus.adr.eq(current.addr),
+            bus.dat_w.eq(current.data),
+            bus.sel.eq(current.be),
+            bus.cti.eq(Mux(burst & ~burst_end, wishbone.CTI_BURST_INCREMENTING, wishbone.CTI_BURST_END)),
+            bus.bte.eq(0b00),
+            current.ready.eq(bus.stb & bus.ack),
+        ]
+
+        # Read response.
+        self.comb += [
+            fifo.sink.valid.eq(bus.stb & bus.ack & ~current.we),
+            fifo.sink.last.eq(current.last),
+            fifo.sink.last_be.eq(current.last_be),
+            fifo.sink.base_addr.eq(current.base_addr),
+            fifo.sink.addr.eq(current.addr),
+            fifo.sink.count.eq(current.count),
+            fifo.sink.be.eq(current.be),
+            fifo.sink.we.eq(1),
+            fifo.sink.data.eq(bus.dat_r),
+        ]
+
 # Etherbone Wishbone Slave -------------------------------------------------------------------------
 
 class LiteEthEtherboneWishboneSlave(LiteXModule):
@@ -495,7 +571,7 @@ class LiteEthEtherboneWishboneSlave(LiteXModule):
 # Etherbone ----------------------------------------------------------------------------------------
 
 class LiteEthEtherbone(LiteXModule):
-    def __init__(self, udp, udp_port, mode="master", buffer_depth=4, cd="sys"):
+    def __init__(self, udp, udp_port, mode="master", buffer_depth=4, cd="sys", with_burst=False):
         # Encode/encode etherbone packets.
         self.packet = packet = LiteEthEtherbonePacket(udp, udp_port, cd)
 
@@ -509,11 +585,14 @@ class LiteEthEtherbone(LiteXModule):
         arbiter = Arbiter([probe.source, record.source], packet.sink)
         self.submodules += dispatcher, arbiter
 
-        # Create MMAP wishbone.
-        self.wishbone = {
-            "master": LiteEthEtherboneWishboneMaster(),
-            "slave":  LiteEthEtherboneWishboneSlave(),
-        }[mode]
+        # Create MMAP wishbone (Master with Incrementing Bursts when with_burst).
+        if mode == "master" and with_burst:
+            self.wishbone = LiteEthEtherboneWishboneBurstMaster(fifo_depth=max(buffer_depth, 2))
+        else:
+            self.wishbone = {
+                "master": LiteEthEtherboneWishboneMaster(),
+                "slave":  LiteEthEtherboneWishboneSlave(),
+            }[mode]
         self.comb += [
             record.receiver.source.connect(self.wishbone.sink),
             self.wishbone.source.connect(record.sender.sink)
@@ -25,7 +25,6 @@ easily a custom configuration of the core.
 import os
 import yaml
 import argparse
-import inspect
 
 from migen import *
 
@@ -42,7 +41,6 @@ from litex.soc.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 
 import litespi.modules
-from litespi.spi_nor_flash_module import SpiNorFlashModule
 from litespi.opcodes import SpiNorFlashOpCodes as Codes
 
 from litespi import LiteSPI
@@ -91,8 +89,7 @@ class LiteSPICore(SoCMini):
         # SPI Flash Module -------------------------------------------------------------------------
 
         # Get available modules.
-        modules_cls = inspect.getmembers(litespi.modules, inspect.isclass)
-        modules     = {name: cls for name, cls in modules_cls if issubclass(cls, SpiNorFlashModule)}
+        modules = dict(sorted(litespi.modules.get_modules().items()))
 
         # Check that selected module is supported.
         def print_supported_modules():
@@ -1,14 +1,93 @@
-from litespi.modules.generated_modules import *
 from litespi.modules.modules import *
 from litespi.modules.ram_modules import *
-from litespi.spi_nor_flash_module import MetaSizes
+from litespi.spi_nor_flash_module import SpiNorFlashModule, MetaSizes
+from litespi.opcodes import SpiNorFlashOpCodes
+from litespi.ids import SpiNorFlashManufacturerIDs
+
+# Generated Modules --------------------------------------------------------------------------------
+
+# The generated modules are stored as a table (see generated_modules.py) and their
+# SpiNorFlashModule subclasses are only created when accessed, either as attributes of this
+# package (from litespi.modules import W25Q128JV) or through find_modules/get_modules.
+
+_generated_rows = None
+_jedec_index    = None
+
+def _generated():
+    global _generated_rows
+    if _generated_rows is None:
+        from litespi.modules.generated_modules import modules
+        _generated_rows = {row[0]: row for row in modules}
+    return _generated_rows
+
+def _create_module(row):
+    cls_name, manufacturer, device_id, name, total_size, page_size, total_pages, \
+        opcodes, dummy_bits, dummy_cycles = row
+    attrs = {
+        "__module__"        : __name__,
+        "__qualname__"      : cls_name,
+        "manufacturer_id"   : getattr(SpiNorFlashManufacturerIDs, manufacturer),
+        "device_id"         : device_id,
+        "name"              : name,
+        "total_size"        : total_size,
+        "page_size"         : page_size,
+        "total_pages"       : total_pages,
+        "supported_opcodes" : [getattr(SpiNorFlashOpCodes, opcode) for opcode in opcodes],
+        "dummy_bits"        : dummy_bits,
+    }
+    if dummy_cycles is not None:
+        attrs["dummy_cycles"] = {getattr(SpiNorFlashOpCodes, opcode): cycles
+            for opcode, cycles in dummy_cycles}
+    cls = MetaSizes(cls_name, (SpiNorFlashModule,), attrs)
+    # Cache the class so that the next accesses don't go through __getattr__.
+    globals()[cls_name] = cls
+    return cls
+
+def __getattr__(name):
+    try:
+        row = _generated()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return _create_module(row)
+
+def __dir__():
+    return sorted(set(globals()) | set(_generated()))
+
+# Modules Lookup -----------------------------------------------------------------------------------
+
+def _is_module(obj):
+    return isinstance(obj, MetaSizes) and obj is not SpiNorFlashModule
+
+def get_modules():
+    """Return a {class name: class} dict of all the SPI NOR flash modules.
+
+    This creates all the generated modules, prefer attribute access or find_modules when only
+    a few modules are needed."""
+    modules = {name: globals().get(name) or _create_module(row) for name, row in _generated().items()}
+    modules.update({name: obj for name, obj in globals().items() if _is_module(obj)})
+    return modules
+
+def find_modules(manufacturer_id, device_id):
+    """Return the SPI NOR flash modules matching a JEDEC ID.
+
+    ``manufacturer_id`` is the first byte returned by the flash to the RDID (0x9f) command (or a
+    SpiNorFlashManufacturerIDs) and ``device_id`` the two following bytes. Since some parts share
+    the same JEDEC ID, a list of modules (possibly empty) is returned."""
+    global _jedec_index
+    if isinstance(manufacturer_id, SpiNorFlashManufacturerIDs):
+        manufacturer_id = manufacturer_id.value
+    if _jedec_index is None:
+        _jedec_index = {}
+        for name, row in _generated().items():
+            jedec_id = (getattr(SpiNorFlashManufacturerIDs, row[1]).value, row[2])
+            _jedec_index.setdefault(jedec_id, []).append(name)
+    modules = [obj for obj in globals().values() if _is_module(obj)
+        and obj.manufacturer_id.value == manufacturer_id and obj.device_id == device_id]
+    for name in _jedec_index.get((manufacturer_id, device_id), []):
+        if name not in globals():
+            modules.append(_create_module(_generated()[name]))
+    return modules
 
 def print_modules():
-    for name, obj in globals().items():
-        if not issubclass(type(obj), MetaSizes):
-            continue
-        if name == 'SpiNorFlashModule':
-            continue
-        if name == 'MetaSizes':
-            continue
+    for obj in get_modules().values():
         print(obj.table("page"))
@@ -1,8823 +1,484 @@
 # Generated using 'spi_nor_cfg_gen.py'
-from litespi.spi_nor_flash_module import SpiNorFlashModule
-from litespi.opcodes import SpiNorFlashOpCodes
-from litespi.ids import SpiNorFlashManufacturerIDs
-
-
-class X160S33B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8911
-    name = "160s33b"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class X25DF081A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4501
-    name = "25df081a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X25F160S33B8(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8911
-    name = "25f160s33b8"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X25F160S33T8(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8915
-    name = "25f160s33t8"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X25F320S33B8(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8912
-    name = "25f320s33b8"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X25F320S33T8(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8916
-    name = "25f320s33t8"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X25F640S33B8(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8913
-    name = "25f640s33b8"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X25F640S33T8(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8917
-    name = "25f640s33t8"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X320S33B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8912
-    name = "320s33b"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class X3S1400AN(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2600
-    name = "3S1400AN"
-
-    total_size  =    2162688   # bytes
-    page_size   =        528   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X3S200AN(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2400
-    name = "3S200AN"
-
-    total_size  =     540672   # bytes
-    page_size   =        264   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X3S400AN(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2400
-    name = "3S400AN"
-
-    total_size  =     540672   # bytes
-    page_size   =        264   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X3S50AN(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2200
-    name = "3S50AN"
-
-    total_size  =     135168   # bytes
-    page_size   =        264   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X3S700AN(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2500
-    name = "3S700AN"
-
-    total_size  =    1081344   # bytes
-    page_size   =        264   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class X640S33B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.INTEL
-    device_id = 0x8913
-    name = "640s33b"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class XM25QH128A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7018
-    name = "XM25QH128A"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class XM25QH64A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7017
-    name = "XM25QH64A"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class A25L010(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3011
-    name = "a25l010"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L016(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3015
-    name = "a25l016"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L020(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3012
-    name = "a25l020"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3016
-    name = "a25l032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L040(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3013
-    name = "a25l040"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L05PT(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2020
-    name = "a25l05pt"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L05PU(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2010
-    name = "a25l05pu"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L080(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3014
-    name = "a25l080"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L10PT(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2021
-    name = "a25l10pt"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L10PU(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2011
-    name = "a25l10pu"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L16PT(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2025
-    name = "a25l16pt"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L16PU(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2015
-    name = "a25l16pu"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L20PT(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2022
-    name = "a25l20pt"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L20PU(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2012
-    name = "a25l20pu"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L40PU(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2013
-    name = "a25l40pu"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x3010
-    name = "a25l512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25L80P(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x2014
-    name = "a25l80p"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25LQ032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x4016
-    name = "a25lq032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25LQ16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x4015
-    name = "a25lq16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25LQ32A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x4016
-    name = "a25lq32a"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class A25LQ64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.AMIC
-    device_id = 0x4017
-    name = "a25lq64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF021(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4300
-    name = "at25df021"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF021A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4301
-    name = "at25df021a"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF041A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4401
-    name = "at25df041a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF081A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4501
-    name = "at25df081a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF161(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4602
-    name = "at25df161"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF321(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4700
-    name = "at25df321"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF321A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4701
-    name = "at25df321a"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF641(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4800
-    name = "at25df641"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT25DF641A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4800
-    name = "at25df641a"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DL081(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4502
-    name = "at25dl081"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DL161(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4603
-    name = "at25dl161"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25DQ161(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x8600
-    name = "at25dq161"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F1024(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0060
-    name = "at25f1024"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F1024A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0060
-    name = "at25f1024a"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F2048(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0063
-    name = "at25f2048"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F4096(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0064
-    name = "at25f4096"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0060
-    name = "at25f512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F512A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0065
-    name = "at25f512a"
-
-    total_size  =      65536   # bytes
-    page_size   =        128   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25F512B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x6500
-    name = "at25f512b"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25FS010(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x6601
-    name = "at25fs010"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT25FS040(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x6604
-    name = "at25fs040"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT25SF041(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x8401
-    name = "at25sf041"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25SF081(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x8501
-    name = "at25sf081"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25SF161(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x8601
-    name = "at25sf161"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25SF321(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x8701
-    name = "at25sf321"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT25SL128A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4218
-    name = "at25sl128a"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class AT25SL321(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4216
-    name = "at25sl321"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class AT26DF041(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4400
-    name = "at26df041"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT26DF081A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4501
-    name = "at26df081a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT26DF161(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4600
-    name = "at26df161"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT26DF161A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4601
-    name = "at26df161a"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT26DF321(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x4700
-    name = "at26df321"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT26F004(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x0400
-    name = "at26f004"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB011D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2200
-    name = "at45db011d"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB021D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2300
-    name = "at45db021d"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB041D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2400
-    name = "at45db041d"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB081D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2500
-    name = "at45db081d"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB161D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2600
-    name = "at45db161d"
-
-    total_size  =    2097152   # bytes
-    page_size   =        512   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB321D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2701
-    name = "at45db321d"
-
-    total_size  =    4194304   # bytes
-    page_size   =        512   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB321E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2700
-    name = "at45db321e"
-
-    total_size  =    4194304   # bytes
-    page_size   =        512   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class AT45DB642D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ATMEL
-    device_id = 0x2800
-    name = "at45db642d"
-
-    total_size  =    8388608   # bytes
-    page_size   =       1024   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class CAT25128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "cat25128"
-
-    total_size  =      16384   # bytes
-    page_size   =         64   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class CAT25C03(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "cat25c03"
-
-    total_size  =        256   # bytes
-    page_size   =         16   # bytes
-    total_pages =         16
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class CAT25C09(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "cat25c09"
-
-    total_size  =       1024   # bytes
-    page_size   =         32   # bytes
-    total_pages =         32
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class CAT25C11(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "cat25c11"
-
-    total_size  =        128   # bytes
-    page_size   =         16   # bytes
-    total_pages =          8
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class CAT25C17(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "cat25c17"
-
-    total_size  =       2048   # bytes
-    page_size   =         32   # bytes
-    total_pages =         64
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class EN25F32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x3116
-    name = "en25f32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25P32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x2016
-    name = "en25p32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25P64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x2017
-    name = "en25p64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25Q32B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x3016
-    name = "en25q32b"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25Q64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x3017
-    name = "en25q64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25Q80A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x3014
-    name = "en25q80a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class EN25QH128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x7018
-    name = "en25qh128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25QH16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x7015
-    name = "en25qh16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class EN25QH256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x7019
-    name = "en25qh256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25QH32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x7016
-    name = "en25qh32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class EN25QH64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x7017
-    name = "en25qh64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class EN25S64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.EON
-    device_id = 0x3817
-    name = "en25s64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class F25L008A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ESMT
-    device_id = 0x2014
-    name = "f25l008a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class F25L32PA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ESMT
-    device_id = 0x2016
-    name = "f25l32pa"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class F25L32QA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ESMT
-    device_id = 0x4116
-    name = "f25l32qa"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class F25L64QA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ESMT
-    device_id = 0x4117
-    name = "f25l64qa"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ128C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6018
-    name = "gd25lq128c"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ128D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6018
-    name = "gd25lq128d"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6015
-    name = "gd25lq16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6016
-    name = "gd25lq32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6013
-    name = "gd25lq40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6017
-    name = "gd25lq64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ64B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6017
-    name = "gd25lq64b"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ64C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6017
-    name = "gd25lq64c"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25LQ80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6014
-    name = "gd25lq80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q10(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4011
-    name = "gd25q10"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q127C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4018
-    name = "gd25q127c"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4018
-    name = "gd25q128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q128C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4018
-    name = "gd25q128c"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4015
-    name = "gd25q16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q16B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4015
-    name = "gd25q16b"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q16C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4015
-    name = "gd25q16c"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q20(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4012
-    name = "gd25q20"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q20B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4012
-    name = "gd25q20b"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4019
-    name = "gd25q256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q256C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4019
-    name = "gd25q256c"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q256D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4019
-    name = "gd25q256d"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4016
-    name = "gd25q32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q32B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4016
-    name = "gd25q32b"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q32C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4016
-    name = "gd25q32c"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4013
-    name = "gd25q40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q40B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4013
-    name = "gd25q40b"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4010
-    name = "gd25q512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q512MC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4020
-    name = "gd25q512mc"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4017
-    name = "gd25q64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q64B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4017
-    name = "gd25q64b"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q64C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4017
-    name = "gd25q64c"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4014
-    name = "gd25q80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25Q80B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4014
-    name = "gd25q80b"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25T80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x3114
-    name = "gd25t80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class GD25VQ16C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4215
-    name = "gd25vq16c"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25VQ21B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4212
-    name = "gd25vq21b"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25VQ41B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4213
-    name = "gd25vq41b"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25VQ80C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x4214
-    name = "gd25vq80c"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class GD25WQ80E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.GIGADEVICE
-    device_id = 0x6514
-    name = "gd25wq80e"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class IS25CD512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0020
-    name = "is25cd512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP016D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6015
-    name = "is25lp016d"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6016
-    name = "is25lp032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP064(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6017
-    name = "is25lp064"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP080D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6014
-    name = "is25lp080d"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6018
-    name = "is25lp128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP128D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6018
-    name = "is25lp128d"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6019
-    name = "is25lp256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP256D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x6019
-    name = "is25lp256d"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class IS25LP512M(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x601a
-    name = "is25lp512m"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25LQ040B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x4013
-    name = "is25lq040b"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x7016
-    name = "is25wp032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP064(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x7017
-    name = "is25wp064"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x7018
-    name = "is25wp128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP128D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x7018
-    name = "is25wp128d"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x7019
-    name = "is25wp256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP256D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x7019
-    name = "is25wp256d"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class IS25WP512M(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x701a
-    name = "is25wp512m"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class LE25FU106B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x001d
-    name = "le25fu106b"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FU206(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0044
-    name = "le25fu206"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FU206A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0612
-    name = "le25fu206a"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FU406B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x001e
-    name = "le25fu406b"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FU406C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0613
-    name = "le25fu406c"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW106(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0015
-    name = "le25fw106"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW203A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x1600
-    name = "le25fw203a"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW403A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x1100
-    name = "le25fw403a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW406A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x001a
-    name = "le25fw406a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW418A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0010
-    name = "le25fw418a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW806(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0026
-    name = "le25fw806"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25FW808(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0020
-    name = "le25fw808"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class LE25U40CMC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x0613
-    name = "le25u40cmc"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25P05(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2010
-    name = "m25p05"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P05_A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2010
-    name = "m25p05-a"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25P05_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p05-nonjedec"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P10(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2011
-    name = "m25p10"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P10_A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2011
-    name = "m25p10-a"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25P10_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p10-nonjedec"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2018
-    name = "m25p128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P128_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p128-nonjedec"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2015
-    name = "m25p16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P16_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p16-nonjedec"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P20(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2012
-    name = "m25p20"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P20_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p20-nonjedec"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P20_OLD(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x0011
-    name = "m25p20-old"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25P32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2016
-    name = "m25p32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P32_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p32-nonjedec"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2013
-    name = "m25p40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P40_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p40-nonjedec"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P40_OLD(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x0012
-    name = "m25p40-old"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25P64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2017
-    name = "m25p64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P64_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p64-nonjedec"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x2014
-    name = "m25p80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25P80_NONJEDEC(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "m25p80-nonjedec"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PE10(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x8011
-    name = "m25pe10"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25PE16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x8015
-    name = "m25pe16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PE20(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x8012
-    name = "m25pe20"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PE40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x8013
-    name = "m25pe40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M25PE80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x8014
-    name = "m25pe80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PX16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7115
-    name = "m25px16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PX32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7116
-    name = "m25px32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PX32_S0(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7316
-    name = "m25px32-s0"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PX32_S1(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x6316
-    name = "m25px32-s1"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PX64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7117
-    name = "m25px64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M25PX80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x7114
-    name = "m25px80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M45PE10(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x4011
-    name = "m45pe10"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M45PE16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x4015
-    name = "m45pe16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M45PE20(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x4012
-    name = "m45pe20"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M45PE40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x4013
-    name = "m45pe40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class M45PE80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x4014
-    name = "m45pe80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class M95M02(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0x0012
-    name = "m95m02"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MB85RS1MT(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.FUJITSU
-    device_id = 0x7f27
-    name = "mb85rs1mt"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MR25H10(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "mr25h10"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MR25H128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "mr25h128"
-
-    total_size  =      16384   # bytes
-    page_size   =        256   # bytes
-    total_pages =         64
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MR25H256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "mr25h256"
-
-    total_size  =      32768   # bytes
-    page_size   =        256   # bytes
-    total_pages =        128
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MR25H40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "mr25h40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL01(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba21
-    name = "mt25ql01"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL01G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba21
-    name = "mt25ql01g"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL02(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba22
-    name = "mt25ql02"
-
-    total_size  =  268435456   # bytes
-    page_size   =        256   # bytes
-    total_pages =    1048576
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL02G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba22
-    name = "mt25ql02g"
-
-    total_size  =  268435456   # bytes
-    page_size   =        256   # bytes
-    total_pages =    1048576
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba18
-    name = "mt25ql128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba19
-    name = "mt25ql256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL256A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba19
-    name = "mt25ql256a"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba20
-    name = "mt25ql512"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QL512A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba20
-    name = "mt25ql512a"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU01G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb21
-    name = "mt25qu01g"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU02G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb22
-    name = "mt25qu02g"
-
-    total_size  =  268435456   # bytes
-    page_size   =        256   # bytes
-    total_pages =    1048576
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb18
-    name = "mt25qu128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb19
-    name = "mt25qu256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU256A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb19
-    name = "mt25qu256a"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb20
-    name = "mt25qu512"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT25QU512A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb20
-    name = "mt25qu512a"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT35XU02G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MICRON
-    device_id = 0x5b1c
-    name = "mt35xu02g"
-
-    total_size  =  268435456   # bytes
-    page_size   =        256   # bytes
-    total_pages =    1048576
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_8,
-        SpiNorFlashOpCodes.PP_1_1_8,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_8_4B,
-        SpiNorFlashOpCodes.PP_1_1_8_4B,
-    ]
-    dummy_bits = 8
-
-
-class MT35XU512ABA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MICRON
-    device_id = 0x5b1a
-    name = "mt35xu512aba"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_8,
-        SpiNorFlashOpCodes.PP_1_1_8,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_8_4B,
-        SpiNorFlashOpCodes.PP_1_1_8_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX23L12854(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x0518
-    name = "mx23l12854"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX23L1654(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x0515
-    name = "mx23l1654"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX23L3254(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x0516
-    name = "mx23l3254"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX23L6454(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x0517
-    name = "mx23l6454"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1005(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2011
-    name = "mx25l1005"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1005C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2011
-    name = "mx25l1005c"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1006E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2011
-    name = "mx25l1006e"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L12805D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2018
-    name = "mx25l12805d"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L12835F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2018
-    name = "mx25l12835f"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L12845(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2018
-    name = "mx25l12845"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L12845E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2018
-    name = "mx25l12845e"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L12855E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2618
-    name = "mx25l12855e"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L12865E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2018
-    name = "mx25l12865e"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1605(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2015
-    name = "mx25l1605"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1605D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2015
-    name = "mx25l1605d"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1606E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2015
-    name = "mx25l1606e"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1608D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2015
-    name = "mx25l1608d"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1635D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2415
-    name = "mx25l1635d"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1635E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2515
-    name = "mx25l1635e"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L1673E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2015
-    name = "mx25l1673e"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L2005(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2012
-    name = "mx25l2005"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L2005A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2012
-    name = "mx25l2005a"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L2005C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2012
-    name = "mx25l2005c"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L2006E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2012
-    name = "mx25l2006e"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L25635E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2019
-    name = "mx25l25635e"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25L25635F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2019
-    name = "mx25l25635f"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX25L25645(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2019
-    name = "mx25l25645"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L25645G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2019
-    name = "mx25l25645g"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX25L25655E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2619
-    name = "mx25l25655e"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L3205(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2016
-    name = "mx25l3205"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L3205D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2016
-    name = "mx25l3205d"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L3235D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x5e16
-    name = "mx25l3235d"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L3255E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x9e16
-    name = "mx25l3255e"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L3273E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2016
-    name = "mx25l3273e"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L4005(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2013
-    name = "mx25l4005"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L4005A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2013
-    name = "mx25l4005a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L4005C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2013
-    name = "mx25l4005c"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L4006E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2013
-    name = "mx25l4006e"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2010
-    name = "mx25l512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L51245(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x201a
-    name = "mx25l51245"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L51245G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x201a
-    name = "mx25l51245g"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX25L512E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2010
-    name = "mx25l512e"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6405(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6405"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6405D(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6405d"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6436E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6436e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6445E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6445e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6465E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6465e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6473E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6473e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6473F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2017
-    name = "mx25l6473f"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L6495F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x9517
-    name = "mx25l6495f"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L8005(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2014
-    name = "mx25l8005"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25L8006E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2014
-    name = "mx25l8006e"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25L8008E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2014
-    name = "mx25l8008e"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25LM51245(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x853a
-    name = "mx25lm51245"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_8,
-        SpiNorFlashOpCodes.PP_1_1_8,
-    ]
-    dummy_bits = 8
-
-
-class MX25R1035F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2811
-    name = "mx25r1035f"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25R1635F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2815
-    name = "mx25r1635f"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25R2035F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2812
-    name = "mx25r2035f"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25R3235F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2816
-    name = "mx25r3235f"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25R4035F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2813
-    name = "mx25r4035f"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25R512F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2810
-    name = "mx25r512f"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25R6435F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2817
-    name = "mx25r6435f"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25R8035F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2814
-    name = "mx25r8035f"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25U12835F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2538
-    name = "mx25u12835f"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25U1635E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2535
-    name = "mx25u1635e"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25U2033E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2532
-    name = "mx25u2033e"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25U25635F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2539
-    name = "mx25u25635f"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX25U3235E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2536
-    name = "mx25u3235e"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25U3235F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2536
-    name = "mx25u3235f"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25U4035(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2533
-    name = "mx25u4035"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25U51245G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x253a
-    name = "mx25u51245g"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX25U6435E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2537
-    name = "mx25u6435e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX25U6435F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2537
-    name = "mx25u6435f"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25U8032E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2534
-    name = "mx25u8032e"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25U8035(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2534
-    name = "mx25u8035"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class MX25V512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2010
-    name = "mx25v512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25V512C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2010
-    name = "mx25v512c"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25V8005(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2014
-    name = "mx25v8005"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class MX25V8035F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x2314
-    name = "mx25v8035f"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX66L1G45G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x201b
-    name = "mx66l1g45g"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX66L1G55G(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x261b
-    name = "mx66l1g55g"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class MX66L51235F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x201a
-    name = "mx66l51235f"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX66L51235L(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x201a
-    name = "mx66l51235l"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class MX66U51235F(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.MACRONIX
-    device_id = 0x253a
-    name = "mx66u51235f"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class N25Q00(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba21
-    name = "n25q00"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q00A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb21
-    name = "n25q00a"
-
-    total_size  =  134217728   # bytes
-    page_size   =        256   # bytes
-    total_pages =     524288
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q016(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb15
-    name = "n25q016"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q016A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb15
-    name = "n25q016a"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba16
-    name = "n25q032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q032XX1E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb16
-    name = "n25q032..1e"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q032XX3E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba16
-    name = "n25q032..3e"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q032A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb16
-    name = "n25q032a"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q064(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba17
-    name = "n25q064"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q064XX1E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb17
-    name = "n25q064..1e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q064XX3E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba17
-    name = "n25q064..3e"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q064A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb17
-    name = "n25q064a"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba18
-    name = "n25q128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q128A11(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb18
-    name = "n25q128a11"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q128A13(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba18
-    name = "n25q128a13"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q256XX1E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb19
-    name = "n25q256..1e"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q256XX3E(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba19
-    name = "n25q256..3e"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class N25Q256A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba19
-    name = "n25q256a"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q256AX1(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb19
-    name = "n25q256ax1"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q512A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xbb20
-    name = "n25q512a"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class N25Q512AX3(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ST
-    device_id = 0xba20
-    name = "n25q512ax3"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD010(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0021
-    name = "pm25ld010"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD010C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0021
-    name = "pm25ld010c"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD020(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0022
-    name = "pm25ld020"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD020C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0022
-    name = "pm25ld020c"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD256C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x002f
-    name = "pm25ld256c"
-
-    total_size  =      32768   # bytes
-    page_size   =        256   # bytes
-    total_pages =        128
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0020
-    name = "pm25ld512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LD512C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0020
-    name = "pm25ld512c"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LQ016(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0045
-    name = "pm25lq016"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LQ020(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0042
-    name = "pm25lq020"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LQ032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0046
-    name = "pm25lq032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class PM25LQ032C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0046
-    name = "pm25lq032c"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LQ040(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0043
-    name = "pm25lq040"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LQ080(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0044
-    name = "pm25lq080"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV010(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "pm25lv010"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV010A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x007c
-    name = "pm25lv010a"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV016B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0014
-    name = "pm25lv016b"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV020(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x007d
-    name = "pm25lv020"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV040(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x007e
-    name = "pm25lv040"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV080B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x0013
-    name = "pm25lv080b"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.NONJEDEC
-    device_id = 0x0000
-    name = "pm25lv512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class PM25LV512A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.ISSI
-    device_id = 0x007b
-    name = "pm25lv512a"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL004(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0212
-    name = "s25fl004"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL004A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0212
-    name = "s25fl004a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL004K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4013
-    name = "s25fl004k"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL008(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0213
-    name = "s25fl008"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL008A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0213
-    name = "s25fl008a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL008K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4014
-    name = "s25fl008k"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL016(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0214
-    name = "s25fl016"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL016A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0214
-    name = "s25fl016a"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL016K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4015
-    name = "s25fl016k"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL032(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0215
-    name = "s25fl032"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL032A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0215
-    name = "s25fl032a"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL032P(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0215
-    name = "s25fl032p"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL064(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0216
-    name = "s25fl064"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL064A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0216
-    name = "s25fl064a"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL064K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4017
-    name = "s25fl064k"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25FL064L(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x6017
-    name = "s25fl064l"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class S25FL064P(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0216
-    name = "s25fl064p"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL116K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x4015
-    name = "s25fl116k"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL128L(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x6018
-    name = "s25fl128l"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.READ_1_4_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class S25FL128S(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25fl128s"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL128S0(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25fl128s0"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL128S1(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25fl128s1"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL129PXXXXXX1(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25fl129p......1"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL129P0(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25fl129p0"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL129P1(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25fl129p1"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL132K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x4016
-    name = "s25fl132k"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25FL164K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x4017
-    name = "s25fl164k"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25FL204K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x4013
-    name = "s25fl204k"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class S25FL208K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x4014
-    name = "s25fl208k"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class S25FL216K(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x4015
-    name = "s25fl216k"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL256L(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x6019
-    name = "s25fl256l"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class S25FL256S(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0219
-    name = "s25fl256s"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class S25FL256SXXXXXX0(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0219
-    name = "s25fl256s......0"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-    ]
-    dummy_bits = 8
-
-
-class S25FL256S0(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0219
-    name = "s25fl256s0"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25FL256S1(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0219
-    name = "s25fl256s1"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FL512S(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0220
-    name = "s25fl512s"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25FS512S(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0220
-    name = "s25fs512s"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25SL004A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0212
-    name = "s25sl004a"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25SL008A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0213
-    name = "s25sl008a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25SL016A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0214
-    name = "s25sl016a"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25SL032A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0215
-    name = "s25sl032a"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25SL032P(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0215
-    name = "s25sl032p"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25SL064A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0216
-    name = "s25sl064a"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25SL064P(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0216
-    name = "s25sl064p"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class S25SL12800(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25sl12800"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S25SL12801(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x2018
-    name = "s25sl12801"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class S70FL01GS(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SPANSION
-    device_id = 0x0221
-    name = "s70fl01gs"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25LF080(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0080
-    name = "sst25lf080"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25LF080A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0080
-    name = "sst25lf080a"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF010(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0049
-    name = "sst25vf010"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF010A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0049
-    name = "sst25vf010a"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF016B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2541
-    name = "sst25vf016b"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF020(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0043
-    name = "sst25vf020"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF020B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x258c
-    name = "sst25vf020b"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF032B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x254a
-    name = "sst25vf032b"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF040(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0044
-    name = "sst25vf040"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF040B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x258d
-    name = "sst25vf040b"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF040BXREMS(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x008d
-    name = "sst25vf040b.rems"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF064C(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x254b
-    name = "sst25vf064c"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF080B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x258e
-    name = "sst25vf080b"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0048
-    name = "sst25vf512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25VF512A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x0048
-    name = "sst25vf512a"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF010(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2502
-    name = "sst25wf010"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF020(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2503
-    name = "sst25wf020"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF020A(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x1612
-    name = "sst25wf020a"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF040(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2504
-    name = "sst25wf040"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF040B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SANYO
-    device_id = 0x1613
-    name = "sst25wf040b"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF080(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2505
-    name = "sst25wf080"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF080B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x1614
-    name = "sst25wf080b"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST25WF512(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2501
-    name = "sst25wf512"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class SST26VF016B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2641
-    name = "sst26vf016b"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-    ]
-    dummy_bits = 8
-
-
-class SST26VF016BA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2641
-    name = "sst26vf016ba"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST26VF032B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2642
-    name = "sst26vf032b"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST26VF032BA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2642
-    name = "sst26vf032ba"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST26VF064B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2643
-    name = "sst26vf064b"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class SST26VF064BA(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2643
-    name = "sst26vf064ba"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class SST26WF016B(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.SST
-    device_id = 0x2651
-    name = "sst26wf016b"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25M512JV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x7119
-    name = "w25m512jv"
-
-    total_size  =   67108864   # bytes
-    page_size   =        256   # bytes
-    total_pages =     262144
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q128(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4018
-    name = "w25q128"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q128FV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4018
-    name = "w25q128fv"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25Q128FW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6018
-    name = "w25q128fw"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q128JV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x7018
-    name = "w25q128jv"
-
-    total_size  =   16777216   # bytes
-    page_size   =        256   # bytes
-    total_pages =      65536
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_2_2,
-        SpiNorFlashOpCodes.READ_1_4_4,
-    ]
-    dummy_bits = 8
-
-    dummy_cycles = {
-        SpiNorFlashOpCodes.READ_1_2_2: 0,
-        SpiNorFlashOpCodes.READ_1_4_4: 4,
-    }
-
-
-class W25Q16DW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6015
-    name = "w25q16dw"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q16JV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4015
-    name = "w25q16jv"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25Q16JV_IM(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x7015
-    name = "w25q16jv-im"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q16JV_JM(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x7015
-    name = "w25q16jv-jm"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q20BW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x5012
-    name = "w25q20bw"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q20CL(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4012
-    name = "w25q20cl"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q20EW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6012
-    name = "w25q20ew"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q256(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4019
-    name = "w25q256"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.PP_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.PP_1_1_4_4B,
-    ]
-    dummy_bits = 8
-
-
-class W25Q256FV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4019
-    name = "w25q256fv"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25Q256JV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4019
-    name = "w25q256jv"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25Q256JVM(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x7019
-    name = "w25q256jvm"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q256JW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6019
-    name = "w25q256jw"
-
-    total_size  =   33554432   # bytes
-    page_size   =        256   # bytes
-    total_pages =     131072
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-        SpiNorFlashOpCodes.READ_1_1_1_4B,
-        SpiNorFlashOpCodes.READ_1_1_2_4B,
-        SpiNorFlashOpCodes.READ_1_2_2_4B,
-        SpiNorFlashOpCodes.READ_1_1_4_4B,
-        SpiNorFlashOpCodes.READ_1_4_4_4B,
-    ]
-    dummy_bits = 8
-
-    dummy_cycles = {
-        SpiNorFlashOpCodes.READ_1_1_2    : 8,
-        SpiNorFlashOpCodes.READ_1_1_2_4B : 8,
-        SpiNorFlashOpCodes.READ_1_2_2    : 4,
-        SpiNorFlashOpCodes.READ_1_2_2_4B : 4,
-        SpiNorFlashOpCodes.READ_1_1_4    : 32,
-        SpiNorFlashOpCodes.READ_1_1_4_4B : 32,
-        SpiNorFlashOpCodes.READ_1_4_4    : 6,
-        SpiNorFlashOpCodes.READ_1_4_4_4B : 6,
-    }
-
-class W25Q32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4016
-    name = "w25q32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q32DW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6016
-    name = "w25q32dw"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q32FV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4016
-    name = "w25q32fv"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25Q32JV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x7016
-    name = "w25q32jv"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q32JWM(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x8016
-    name = "w25q32jwm"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4017
-    name = "w25q64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q64DW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6017
-    name = "w25q64dw"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q64FV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4017
-    name = "w25q64fv"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25Q64JV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4017
-    name = "w25q64jv"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q64JW(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x6017
-    name = "w25q64jw"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_2,
-        SpiNorFlashOpCodes.PP_1_1_2,
-        SpiNorFlashOpCodes.READ_1_1_4,
-        SpiNorFlashOpCodes.PP_1_1_4,
-    ]
-    dummy_bits = 8
-
-
-class W25Q80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x5014
-    name = "w25q80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q80BL(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4014
-    name = "w25q80bl"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25Q80BV(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x4014
-    name = "w25q80bv"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class W25X05(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3010
-    name = "w25x05"
-
-    total_size  =      65536   # bytes
-    page_size   =        256   # bytes
-    total_pages =        256
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X10(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3011
-    name = "w25x10"
-
-    total_size  =     131072   # bytes
-    page_size   =        256   # bytes
-    total_pages =        512
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X16(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3015
-    name = "w25x16"
-
-    total_size  =    2097152   # bytes
-    page_size   =        256   # bytes
-    total_pages =       8192
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X20(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3012
-    name = "w25x20"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X32(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3016
-    name = "w25x32"
-
-    total_size  =    4194304   # bytes
-    page_size   =        256   # bytes
-    total_pages =      16384
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3013
-    name = "w25x40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X64(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3017
-    name = "w25x64"
-
-    total_size  =    8388608   # bytes
-    page_size   =        256   # bytes
-    total_pages =      32768
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class W25X80(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.WINBOND
-    device_id = 0x3014
-    name = "w25x80"
-
-    total_size  =    1048576   # bytes
-    page_size   =        256   # bytes
-    total_pages =       4096
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-        SpiNorFlashOpCodes.READ_1_1_1_FAST,
-    ]
-    dummy_bits = 8
-
-
-class ZD25D20(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.THOMSON
-    device_id = 0x2012
-    name = "zd25d20"
-
-    total_size  =     262144   # bytes
-    page_size   =        256   # bytes
-    total_pages =       1024
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
-
-class ZD25D40(SpiNorFlashModule):
-
-    manufacturer_id = SpiNorFlashManufacturerIDs.THOMSON
-    device_id = 0x2013
-    name = "zd25d40"
-
-    total_size  =     524288   # bytes
-    page_size   =        256   # bytes
-    total_pages =       2048
-
-    supported_opcodes = [
-        SpiNorFlashOpCodes.READ_1_1_1,
-        SpiNorFlashOpCodes.PP_1_1_1,
-    ]
-    dummy_bits = 8
-
 
+# SPI NOR flash modules database, the SpiNorFlashModule subclasses are created on first access
+# from litespi.modules.
+#
+# (class name, manufacturer, device_id, name, total_size, page_size, total_pages, supported_opcodes,
+#  dummy_bits, dummy_cycles)
+
+modules = (
+    ("X160S33B", "INTEL", 0x8911, "160s33b", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("X25DF081A", "ATMEL", 0x4501, "25df081a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X25F160S33B8", "INTEL", 0x8911, "25f160s33b8", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X25F160S33T8", "INTEL", 0x8915, "25f160s33t8", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X25F320S33B8", "INTEL", 0x8912, "25f320s33b8", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X25F320S33T8", "INTEL", 0x8916, "25f320s33t8", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X25F640S33B8", "INTEL", 0x8913, "25f640s33b8", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X25F640S33T8", "INTEL", 0x8917, "25f640s33t8", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X320S33B", "INTEL", 0x8912, "320s33b", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("X3S1400AN", "ATMEL", 0x2600, "3S1400AN", 2162688, 528, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X3S200AN", "ATMEL", 0x2400, "3S200AN", 540672, 264, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X3S400AN", "ATMEL", 0x2400, "3S400AN", 540672, 264, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X3S50AN", "ATMEL", 0x2200, "3S50AN", 135168, 264, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X3S700AN", "ATMEL", 0x2500, "3S700AN", 1081344, 264, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("X640S33B", "INTEL", 0x8913, "640s33b", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("XM25QH128A", "ST", 0x7018, "XM25QH128A", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("XM25QH64A", "ST", 0x7017, "XM25QH64A", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("A25L010", "AMIC", 0x3011, "a25l010", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L016", "AMIC", 0x3015, "a25l016", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L020", "AMIC", 0x3012, "a25l020", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L032", "AMIC", 0x3016, "a25l032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L040", "AMIC", 0x3013, "a25l040", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L05PT", "AMIC", 0x2020, "a25l05pt", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L05PU", "AMIC", 0x2010, "a25l05pu", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L080", "AMIC", 0x3014, "a25l080", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L10PT", "AMIC", 0x2021, "a25l10pt", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L10PU", "AMIC", 0x2011, "a25l10pu", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L16PT", "AMIC", 0x2025, "a25l16pt", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L16PU", "AMIC", 0x2015, "a25l16pu", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L20PT", "AMIC", 0x2022, "a25l20pt", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L20PU", "AMIC", 0x2012, "a25l20pu", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L40PU", "AMIC", 0x2013, "a25l40pu", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L512", "AMIC", 0x3010, "a25l512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25L80P", "AMIC", 0x2014, "a25l80p", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25LQ032", "AMIC", 0x4016, "a25lq032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25LQ16", "AMIC", 0x4015, "a25lq16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25LQ32A", "AMIC", 0x4016, "a25lq32a", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("A25LQ64", "AMIC", 0x4017, "a25lq64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("AT25DF021", "ATMEL", 0x4300, "at25df021", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DF021A", "ATMEL", 0x4301, "at25df021a", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DF041A", "ATMEL", 0x4401, "at25df041a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT25DF081A", "ATMEL", 0x4501, "at25df081a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DF161", "ATMEL", 0x4602, "at25df161", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DF321", "ATMEL", 0x4700, "at25df321", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT25DF321A", "ATMEL", 0x4701, "at25df321a", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT25DF641", "ATMEL", 0x4800, "at25df641", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT25DF641A", "ATMEL", 0x4800, "at25df641a", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DL081", "ATMEL", 0x4502, "at25dl081", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DL161", "ATMEL", 0x4603, "at25dl161", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25DQ161", "ATMEL", 0x8600, "at25dq161", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F1024", "ATMEL", 0x0060, "at25f1024", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F1024A", "ATMEL", 0x0060, "at25f1024a", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F2048", "ATMEL", 0x0063, "at25f2048", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F4096", "ATMEL", 0x0064, "at25f4096", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F512", "ATMEL", 0x0060, "at25f512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F512A", "ATMEL", 0x0065, "at25f512a", 65536, 128, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25F512B", "ATMEL", 0x6500, "at25f512b", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25FS010", "ATMEL", 0x6601, "at25fs010", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT25FS040", "ATMEL", 0x6604, "at25fs040", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT25SF041", "ATMEL", 0x8401, "at25sf041", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25SF081", "ATMEL", 0x8501, "at25sf081", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25SF161", "ATMEL", 0x8601, "at25sf161", 2097152, 256, 8192, ("READ_1_1_1", "READ_1_1_4", "PP_1_1_1"), 8, None),
+    ("AT25SF321", "ATMEL", 0x8701, "at25sf321", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT25SL128A", "ATMEL", 0x4218, "at25sl128a", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("AT25SL321", "ATMEL", 0x4216, "at25sl321", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("AT26DF041", "ATMEL", 0x4400, "at26df041", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT26DF081A", "ATMEL", 0x4501, "at26df081a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT26DF161", "ATMEL", 0x4600, "at26df161", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT26DF161A", "ATMEL", 0x4601, "at26df161a", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT26DF321", "ATMEL", 0x4700, "at26df321", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT26F004", "ATMEL", 0x0400, "at26f004", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT45DB011D", "ATMEL", 0x2200, "at45db011d", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT45DB021D", "ATMEL", 0x2300, "at45db021d", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT45DB041D", "ATMEL", 0x2400, "at45db041d", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT45DB081D", "ATMEL", 0x2500, "at45db081d", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("AT45DB161D", "ATMEL", 0x2600, "at45db161d", 2097152, 512, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT45DB321D", "ATMEL", 0x2701, "at45db321d", 4194304, 512, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT45DB321E", "ATMEL", 0x2700, "at45db321e", 4194304, 512, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("AT45DB642D", "ATMEL", 0x2800, "at45db642d", 8388608, 1024, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("CAT25128", "NONJEDEC", 0x0000, "cat25128", 16384, 64, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("CAT25C03", "NONJEDEC", 0x0000, "cat25c03", 256, 16, 16, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("CAT25C09", "NONJEDEC", 0x0000, "cat25c09", 1024, 32, 32, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("CAT25C11", "NONJEDEC", 0x0000, "cat25c11", 128, 16, 8, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("CAT25C17", "NONJEDEC", 0x0000, "cat25c17", 2048, 32, 64, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("EN25F32", "EON", 0x3116, "en25f32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25P32", "EON", 0x2016, "en25p32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25P64", "EON", 0x2017, "en25p64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25Q32B", "EON", 0x3016, "en25q32b", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25Q64", "EON", 0x3017, "en25q64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25Q80A", "EON", 0x3014, "en25q80a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("EN25QH128", "EON", 0x7018, "en25qh128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25QH16", "EON", 0x7015, "en25qh16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("EN25QH256", "EON", 0x7019, "en25qh256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25QH32", "EON", 0x7016, "en25qh32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("EN25QH64", "EON", 0x7017, "en25qh64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("EN25S64", "EON", 0x3817, "en25s64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("F25L008A", "ESMT", 0x2014, "f25l008a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("F25L32PA", "ESMT", 0x2016, "f25l32pa", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("F25L32QA", "ESMT", 0x4116, "f25l32qa", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("F25L64QA", "ESMT", 0x4117, "f25l64qa", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("GD25LQ128C", "GIGADEVICE", 0x6018, "gd25lq128c", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25LQ128D", "GIGADEVICE", 0x6018, "gd25lq128d", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25LQ16", "GIGADEVICE", 0x6015, "gd25lq16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25LQ32", "GIGADEVICE", 0x6016, "gd25lq32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25LQ40", "GIGADEVICE", 0x6013, "gd25lq40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25LQ64", "GIGADEVICE", 0x6017, "gd25lq64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25LQ64B", "GIGADEVICE", 0x6017, "gd25lq64b", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25LQ64C", "GIGADEVICE", 0x6017, "gd25lq64c", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25LQ80", "GIGADEVICE", 0x6014, "gd25lq80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q10", "GIGADEVICE", 0x4011, "gd25q10", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q127C", "GIGADEVICE", 0x4018, "gd25q127c", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q128", "GIGADEVICE", 0x4018, "gd25q128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q128C", "GIGADEVICE", 0x4018, "gd25q128c", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q16", "GIGADEVICE", 0x4015, "gd25q16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q16B", "GIGADEVICE", 0x4015, "gd25q16b", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q16C", "GIGADEVICE", 0x4015, "gd25q16c", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q20", "GIGADEVICE", 0x4012, "gd25q20", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q20B", "GIGADEVICE", 0x4012, "gd25q20b", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q256", "GIGADEVICE", 0x4019, "gd25q256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("GD25Q256C", "GIGADEVICE", 0x4019, "gd25q256c", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q256D", "GIGADEVICE", 0x4019, "gd25q256d", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("GD25Q32", "GIGADEVICE", 0x4016, "gd25q32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q32B", "GIGADEVICE", 0x4016, "gd25q32b", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q32C", "GIGADEVICE", 0x4016, "gd25q32c", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q40", "GIGADEVICE", 0x4013, "gd25q40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q40B", "GIGADEVICE", 0x4013, "gd25q40b", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q512", "GIGADEVICE", 0x4010, "gd25q512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q512MC", "GIGADEVICE", 0x4020, "gd25q512mc", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q64", "GIGADEVICE", 0x4017, "gd25q64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25Q64B", "GIGADEVICE", 0x4017, "gd25q64b", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q64C", "GIGADEVICE", 0x4017, "gd25q64c", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q80", "GIGADEVICE", 0x4014, "gd25q80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25Q80B", "GIGADEVICE", 0x4014, "gd25q80b", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25T80", "GIGADEVICE", 0x3114, "gd25t80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("GD25VQ16C", "GIGADEVICE", 0x4215, "gd25vq16c", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25VQ21B", "GIGADEVICE", 0x4212, "gd25vq21b", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25VQ41B", "GIGADEVICE", 0x4213, "gd25vq41b", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25VQ80C", "GIGADEVICE", 0x4214, "gd25vq80c", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("GD25WQ80E", "GIGADEVICE", 0x6514, "gd25wq80e", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("IS25CD512", "NONJEDEC", 0x0020, "is25cd512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("IS25LP016D", "ISSI", 0x6015, "is25lp016d", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25LP032", "ISSI", 0x6016, "is25lp032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("IS25LP064", "ISSI", 0x6017, "is25lp064", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("IS25LP080D", "ISSI", 0x6014, "is25lp080d", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25LP128", "ISSI", 0x6018, "is25lp128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "READ_1_1_4", "PP_1_1_2"), 8, None),
+    ("IS25LP128D", "ISSI", 0x6018, "is25lp128d", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("IS25LP256", "ISSI", 0x6019, "is25lp256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("IS25LP256D", "ISSI", 0x6019, "is25lp256d", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("IS25LP512M", "ISSI", 0x601a, "is25lp512m", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25LQ040B", "ISSI", 0x4013, "is25lq040b", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25WP032", "ISSI", 0x7016, "is25wp032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25WP064", "ISSI", 0x7017, "is25wp064", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25WP128", "ISSI", 0x7018, "is25wp128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("IS25WP128D", "ISSI", 0x7018, "is25wp128d", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("IS25WP256", "ISSI", 0x7019, "is25wp256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("IS25WP256D", "ISSI", 0x7019, "is25wp256d", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("IS25WP512M", "ISSI", 0x701a, "is25wp512m", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("LE25FU106B", "SANYO", 0x001d, "le25fu106b", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FU206", "SANYO", 0x0044, "le25fu206", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FU206A", "SANYO", 0x0612, "le25fu206a", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FU406B", "SANYO", 0x001e, "le25fu406b", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FU406C", "SANYO", 0x0613, "le25fu406c", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW106", "SANYO", 0x0015, "le25fw106", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW203A", "SANYO", 0x1600, "le25fw203a", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW403A", "SANYO", 0x1100, "le25fw403a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW406A", "SANYO", 0x001a, "le25fw406a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW418A", "SANYO", 0x0010, "le25fw418a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW806", "SANYO", 0x0026, "le25fw806", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25FW808", "SANYO", 0x0020, "le25fw808", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("LE25U40CMC", "SANYO", 0x0613, "le25u40cmc", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25P05", "ST", 0x2010, "m25p05", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P05_A", "ST", 0x2010, "m25p05-a", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25P05_NONJEDEC", "NONJEDEC", 0x0000, "m25p05-nonjedec", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P10", "ST", 0x2011, "m25p10", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P10_A", "ST", 0x2011, "m25p10-a", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25P10_NONJEDEC", "NONJEDEC", 0x0000, "m25p10-nonjedec", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P128", "ST", 0x2018, "m25p128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P128_NONJEDEC", "NONJEDEC", 0x0000, "m25p128-nonjedec", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P16", "ST", 0x2015, "m25p16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P16_NONJEDEC", "NONJEDEC", 0x0000, "m25p16-nonjedec", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P20", "ST", 0x2012, "m25p20", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P20_NONJEDEC", "NONJEDEC", 0x0000, "m25p20-nonjedec", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P20_OLD", "ST", 0x0011, "m25p20-old", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25P32", "ST", 0x2016, "m25p32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P32_NONJEDEC", "NONJEDEC", 0x0000, "m25p32-nonjedec", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P40", "ST", 0x2013, "m25p40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P40_NONJEDEC", "NONJEDEC", 0x0000, "m25p40-nonjedec", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P40_OLD", "ST", 0x0012, "m25p40-old", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25P64", "ST", 0x2017, "m25p64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P64_NONJEDEC", "NONJEDEC", 0x0000, "m25p64-nonjedec", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P80", "ST", 0x2014, "m25p80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25P80_NONJEDEC", "NONJEDEC", 0x0000, "m25p80-nonjedec", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PE10", "ST", 0x8011, "m25pe10", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25PE16", "ST", 0x8015, "m25pe16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PE20", "ST", 0x8012, "m25pe20", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PE40", "ST", 0x8013, "m25pe40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M25PE80", "ST", 0x8014, "m25pe80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PX16", "ST", 0x7115, "m25px16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PX32", "ST", 0x7116, "m25px32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PX32_S0", "ST", 0x7316, "m25px32-s0", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PX32_S1", "ST", 0x6316, "m25px32-s1", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PX64", "ST", 0x7117, "m25px64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M25PX80", "ST", 0x7114, "m25px80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M45PE10", "ST", 0x4011, "m45pe10", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M45PE16", "ST", 0x4015, "m45pe16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M45PE20", "ST", 0x4012, "m45pe20", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M45PE40", "ST", 0x4013, "m45pe40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("M45PE80", "ST", 0x4014, "m45pe80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("M95M02", "ST", 0x0012, "m95m02", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MB85RS1MT", "FUJITSU", 0x7f27, "mb85rs1mt", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MR25H10", "NONJEDEC", 0x0000, "mr25h10", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MR25H128", "NONJEDEC", 0x0000, "mr25h128", 16384, 256, 64, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MR25H256", "NONJEDEC", 0x0000, "mr25h256", 32768, 256, 128, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MR25H40", "NONJEDEC", 0x0000, "mr25h40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MT25QL01", "ST", 0xba21, "mt25ql01", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MT25QL01G", "ST", 0xba21, "mt25ql01g", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QL02", "ST", 0xba22, "mt25ql02", 268435456, 256, 1048576, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MT25QL02G", "ST", 0xba22, "mt25ql02g", 268435456, 256, 1048576, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MT25QL128", "ST", 0xba18, "mt25ql128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QL256", "ST", 0xba19, "mt25ql256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QL256A", "ST", 0xba19, "mt25ql256a", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("MT25QL512", "ST", 0xba20, "mt25ql512", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QL512A", "ST", 0xba20, "mt25ql512a", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("MT25QU01G", "ST", 0xbb21, "mt25qu01g", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QU02G", "ST", 0xbb22, "mt25qu02g", 268435456, 256, 1048576, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MT25QU128", "ST", 0xbb18, "mt25qu128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QU256", "ST", 0xbb19, "mt25qu256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QU256A", "ST", 0xbb19, "mt25qu256a", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("MT25QU512", "ST", 0xbb20, "mt25qu512", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MT25QU512A", "ST", 0xbb20, "mt25qu512a", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("MT35XU02G", "MICRON", 0x5b1c, "mt35xu02g", 268435456, 256, 1048576, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_8", "PP_1_1_8", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_8_4B", "PP_1_1_8_4B"), 8, None),
+    ("MT35XU512ABA", "MICRON", 0x5b1a, "mt35xu512aba", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_8", "PP_1_1_8", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_8_4B", "PP_1_1_8_4B"), 8, None),
+    ("MX23L12854", "MACRONIX", 0x0518, "mx23l12854", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX23L1654", "MACRONIX", 0x0515, "mx23l1654", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX23L3254", "MACRONIX", 0x0516, "mx23l3254", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX23L6454", "MACRONIX", 0x0517, "mx23l6454", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1005", "MACRONIX", 0x2011, "mx25l1005", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1005C", "MACRONIX", 0x2011, "mx25l1005c", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1006E", "MACRONIX", 0x2011, "mx25l1006e", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L12805D", "MACRONIX", 0x2018, "mx25l12805d", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L12835F", "MACRONIX", 0x2018, "mx25l12835f", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L12845", "MACRONIX", 0x2018, "mx25l12845", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L12845E", "MACRONIX", 0x2018, "mx25l12845e", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L12855E", "MACRONIX", 0x2618, "mx25l12855e", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L12865E", "MACRONIX", 0x2018, "mx25l12865e", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1605", "MACRONIX", 0x2015, "mx25l1605", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1605D", "MACRONIX", 0x2015, "mx25l1605d", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1606E", "MACRONIX", 0x2015, "mx25l1606e", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L1608D", "MACRONIX", 0x2015, "mx25l1608d", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1635D", "MACRONIX", 0x2415, "mx25l1635d", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1635E", "MACRONIX", 0x2515, "mx25l1635e", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L1673E", "MACRONIX", 0x2015, "mx25l1673e", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L2005", "MACRONIX", 0x2012, "mx25l2005", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L2005A", "MACRONIX", 0x2012, "mx25l2005a", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L2005C", "MACRONIX", 0x2012, "mx25l2005c", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L2006E", "MACRONIX", 0x2012, "mx25l2006e", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L25635E", "MACRONIX", 0x2019, "mx25l25635e", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25L25635F", "MACRONIX", 0x2019, "mx25l25635f", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MX25L25645", "MACRONIX", 0x2019, "mx25l25645", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L25645G", "MACRONIX", 0x2019, "mx25l25645g", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MX25L25655E", "MACRONIX", 0x2619, "mx25l25655e", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L3205", "MACRONIX", 0x2016, "mx25l3205", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L3205D", "MACRONIX", 0x2016, "mx25l3205d", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L3235D", "MACRONIX", 0x5e16, "mx25l3235d", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L3255E", "MACRONIX", 0x9e16, "mx25l3255e", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L3273E", "MACRONIX", 0x2016, "mx25l3273e", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L4005", "MACRONIX", 0x2013, "mx25l4005", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L4005A", "MACRONIX", 0x2013, "mx25l4005a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L4005C", "MACRONIX", 0x2013, "mx25l4005c", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L4006E", "MACRONIX", 0x2013, "mx25l4006e", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L512", "MACRONIX", 0x2010, "mx25l512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L51245", "MACRONIX", 0x201a, "mx25l51245", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L51245G", "MACRONIX", 0x201a, "mx25l51245g", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MX25L512E", "MACRONIX", 0x2010, "mx25l512e", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L6405", "MACRONIX", 0x2017, "mx25l6405", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L6405D", "MACRONIX", 0x2017, "mx25l6405d", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L6436E", "MACRONIX", 0x2017, "mx25l6436e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L6445E", "MACRONIX", 0x2017, "mx25l6445e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L6465E", "MACRONIX", 0x2017, "mx25l6465e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L6473E", "MACRONIX", 0x2017, "mx25l6473e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L6473F", "MACRONIX", 0x2017, "mx25l6473f", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L6495F", "MACRONIX", 0x9517, "mx25l6495f", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L8005", "MACRONIX", 0x2014, "mx25l8005", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25L8006E", "MACRONIX", 0x2014, "mx25l8006e", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25L8008E", "MACRONIX", 0x2014, "mx25l8008e", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25LM51245", "MACRONIX", 0x853a, "mx25lm51245", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_8", "PP_1_1_8"), 8, None),
+    ("MX25R1035F", "MACRONIX", 0x2811, "mx25r1035f", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25R1635F", "MACRONIX", 0x2815, "mx25r1635f", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25R2035F", "MACRONIX", 0x2812, "mx25r2035f", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25R3235F", "MACRONIX", 0x2816, "mx25r3235f", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25R4035F", "MACRONIX", 0x2813, "mx25r4035f", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25R512F", "MACRONIX", 0x2810, "mx25r512f", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25R6435F", "MACRONIX", 0x2817, "mx25r6435f", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25R8035F", "MACRONIX", 0x2814, "mx25r8035f", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25U12835F", "MACRONIX", 0x2538, "mx25u12835f", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25U1635E", "MACRONIX", 0x2535, "mx25u1635e", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25U2033E", "MACRONIX", 0x2532, "mx25u2033e", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25U25635F", "MACRONIX", 0x2539, "mx25u25635f", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MX25U3235E", "MACRONIX", 0x2536, "mx25u3235e", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25U3235F", "MACRONIX", 0x2536, "mx25u3235f", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25U4035", "MACRONIX", 0x2533, "mx25u4035", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25U51245G", "MACRONIX", 0x253a, "mx25u51245g", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("MX25U6435E", "MACRONIX", 0x2537, "mx25u6435e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX25U6435F", "MACRONIX", 0x2537, "mx25u6435f", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25U8032E", "MACRONIX", 0x2534, "mx25u8032e", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25U8035", "MACRONIX", 0x2534, "mx25u8035", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("MX25V512", "MACRONIX", 0x2010, "mx25v512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25V512C", "MACRONIX", 0x2010, "mx25v512c", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25V8005", "MACRONIX", 0x2014, "mx25v8005", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("MX25V8035F", "MACRONIX", 0x2314, "mx25v8035f", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX66L1G45G", "MACRONIX", 0x201b, "mx66l1g45g", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX66L1G55G", "MACRONIX", 0x261b, "mx66l1g55g", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("MX66L51235F", "MACRONIX", 0x201a, "mx66l51235f", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("MX66L51235L", "MACRONIX", 0x201a, "mx66l51235l", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("MX66U51235F", "MACRONIX", 0x253a, "mx66u51235f", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("N25Q00", "ST", 0xba21, "n25q00", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q00A", "ST", 0xbb21, "n25q00a", 134217728, 256, 524288, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q016", "ST", 0xbb15, "n25q016", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q016A", "ST", 0xbb15, "n25q016a", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q032", "ST", 0xba16, "n25q032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q032XX1E", "ST", 0xbb16, "n25q032..1e", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q032XX3E", "ST", 0xba16, "n25q032..3e", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q032A", "ST", 0xbb16, "n25q032a", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q064", "ST", 0xba17, "n25q064", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q064XX1E", "ST", 0xbb17, "n25q064..1e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q064XX3E", "ST", 0xba17, "n25q064..3e", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q064A", "ST", 0xbb17, "n25q064a", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q128", "ST", 0xba18, "n25q128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q128A11", "ST", 0xbb18, "n25q128a11", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q128A13", "ST", 0xba18, "n25q128a13", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q256XX1E", "ST", 0xbb19, "n25q256..1e", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q256XX3E", "ST", 0xba19, "n25q256..3e", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("N25Q256A", "ST", 0xba19, "n25q256a", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q256AX1", "ST", 0xbb19, "n25q256ax1", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q512A", "ST", 0xbb20, "n25q512a", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("N25Q512AX3", "ST", 0xba20, "n25q512ax3", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("PM25LD010", "ISSI", 0x0021, "pm25ld010", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LD010C", "ISSI", 0x0021, "pm25ld010c", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LD020", "ISSI", 0x0022, "pm25ld020", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LD020C", "ISSI", 0x0022, "pm25ld020c", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LD256C", "ISSI", 0x002f, "pm25ld256c", 32768, 256, 128, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LD512", "ISSI", 0x0020, "pm25ld512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LD512C", "ISSI", 0x0020, "pm25ld512c", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LQ016", "ISSI", 0x0045, "pm25lq016", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LQ020", "ISSI", 0x0042, "pm25lq020", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LQ032", "NONJEDEC", 0x0046, "pm25lq032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("PM25LQ032C", "ISSI", 0x0046, "pm25lq032c", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LQ040", "ISSI", 0x0043, "pm25lq040", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LQ080", "ISSI", 0x0044, "pm25lq080", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LV010", "NONJEDEC", 0x0000, "pm25lv010", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("PM25LV010A", "ISSI", 0x007c, "pm25lv010a", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LV016B", "ISSI", 0x0014, "pm25lv016b", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LV020", "ISSI", 0x007d, "pm25lv020", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LV040", "ISSI", 0x007e, "pm25lv040", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LV080B", "ISSI", 0x0013, "pm25lv080b", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("PM25LV512", "NONJEDEC", 0x0000, "pm25lv512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("PM25LV512A", "ISSI", 0x007b, "pm25lv512a", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL004", "SPANSION", 0x0212, "s25fl004", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL004A", "SPANSION", 0x0212, "s25fl004a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL004K", "WINBOND", 0x4013, "s25fl004k", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL008", "SPANSION", 0x0213, "s25fl008", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL008A", "SPANSION", 0x0213, "s25fl008a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL008K", "WINBOND", 0x4014, "s25fl008k", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL016", "SPANSION", 0x0214, "s25fl016", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL016A", "SPANSION", 0x0214, "s25fl016a", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL016K", "WINBOND", 0x4015, "s25fl016k", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL032", "SPANSION", 0x0215, "s25fl032", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL032A", "SPANSION", 0x0215, "s25fl032a", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL032P", "SPANSION", 0x0215, "s25fl032p", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL064", "SPANSION", 0x0216, "s25fl064", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL064A", "SPANSION", 0x0216, "s25fl064a", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL064K", "WINBOND", 0x4017, "s25fl064k", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25FL064L", "SPANSION", 0x6017, "s25fl064l", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("S25FL064P", "SPANSION", 0x0216, "s25fl064p", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL116K", "SPANSION", 0x4015, "s25fl116k", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL128L", "SPANSION", 0x6018, "s25fl128l", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "READ_1_4_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("S25FL128S", "SPANSION", 0x2018, "s25fl128s", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_4"), 8, None),
+    ("S25FL128S0", "SPANSION", 0x2018, "s25fl128s0", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL128S1", "SPANSION", 0x2018, "s25fl128s1", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL129PXXXXXX1", "SPANSION", 0x2018, "s25fl129p......1", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL129P0", "SPANSION", 0x2018, "s25fl129p0", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL129P1", "SPANSION", 0x2018, "s25fl129p1", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL132K", "SPANSION", 0x4016, "s25fl132k", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25FL164K", "SPANSION", 0x4017, "s25fl164k", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25FL204K", "SPANSION", 0x4013, "s25fl204k", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("S25FL208K", "SPANSION", 0x4014, "s25fl208k", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("S25FL216K", "SPANSION", 0x4015, "s25fl216k", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL256L", "SPANSION", 0x6019, "s25fl256l", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("S25FL256S", "SPANSION", 0x0219, "s25fl256s", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("S25FL256SXXXXXX0", "SPANSION", 0x0219, "s25fl256s......0", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B"), 8, None),
+    ("S25FL256S0", "SPANSION", 0x0219, "s25fl256s0", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25FL256S1", "SPANSION", 0x0219, "s25fl256s1", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FL512S", "SPANSION", 0x0220, "s25fl512s", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25FS512S", "SPANSION", 0x0220, "s25fs512s", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25SL004A", "SPANSION", 0x0212, "s25sl004a", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25SL008A", "SPANSION", 0x0213, "s25sl008a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25SL016A", "SPANSION", 0x0214, "s25sl016a", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25SL032A", "SPANSION", 0x0215, "s25sl032a", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25SL032P", "SPANSION", 0x0215, "s25sl032p", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25SL064A", "SPANSION", 0x0216, "s25sl064a", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25SL064P", "SPANSION", 0x0216, "s25sl064p", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("S25SL12800", "SPANSION", 0x2018, "s25sl12800", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S25SL12801", "SPANSION", 0x2018, "s25sl12801", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("S70FL01GS", "SPANSION", 0x0221, "s70fl01gs", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25LF080", "SST", 0x0080, "sst25lf080", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25LF080A", "SST", 0x0080, "sst25lf080a", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF010", "SST", 0x0049, "sst25vf010", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF010A", "SST", 0x0049, "sst25vf010a", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF016B", "SST", 0x2541, "sst25vf016b", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25VF020", "SST", 0x0043, "sst25vf020", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF020B", "SST", 0x258c, "sst25vf020b", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF032B", "SST", 0x254a, "sst25vf032b", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25VF040", "SST", 0x0044, "sst25vf040", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF040B", "SST", 0x258d, "sst25vf040b", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25VF040BXREMS", "SST", 0x008d, "sst25vf040b.rems", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF064C", "SST", 0x254b, "sst25vf064c", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25VF080B", "SST", 0x258e, "sst25vf080b", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25VF512", "SST", 0x0048, "sst25vf512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25VF512A", "SST", 0x0048, "sst25vf512a", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25WF010", "SST", 0x2502, "sst25wf010", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25WF020", "SST", 0x2503, "sst25wf020", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25WF020A", "SANYO", 0x1612, "sst25wf020a", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25WF040", "SST", 0x2504, "sst25wf040", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25WF040B", "SANYO", 0x1613, "sst25wf040b", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25WF080", "SST", 0x2505, "sst25wf080", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST25WF080B", "SST", 0x1614, "sst25wf080b", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST25WF512", "SST", 0x2501, "sst25wf512", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("SST26VF016B", "SST", 0x2641, "sst26vf016b", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2"), 8, None),
+    ("SST26VF016BA", "SST", 0x2641, "sst26vf016ba", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST26VF032B", "SST", 0x2642, "sst26vf032b", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST26VF032BA", "SST", 0x2642, "sst26vf032ba", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST26VF064B", "SST", 0x2643, "sst26vf064b", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("SST26VF064BA", "SST", 0x2643, "sst26vf064ba", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("SST26WF016B", "SST", 0x2651, "sst26wf016b", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25M512JV", "WINBOND", 0x7119, "w25m512jv", 67108864, 256, 262144, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q128", "WINBOND", 0x4018, "w25q128", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q128FV", "WINBOND", 0x4018, "w25q128fv", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25Q128FW", "WINBOND", 0x6018, "w25q128fw", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q128JV", "WINBOND", 0x7018, "w25q128jv", 16777216, 256, 65536, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_2_2", "READ_1_4_4"), 8, (("READ_1_2_2", 0), ("READ_1_4_4", 4))),
+    ("W25Q16DW", "WINBOND", 0x6015, "w25q16dw", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q16JV", "WINBOND", 0x4015, "w25q16jv", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25Q16JV_IM", "WINBOND", 0x7015, "w25q16jv-im", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q16JV_JM", "WINBOND", 0x7015, "w25q16jv-jm", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q20BW", "WINBOND", 0x5012, "w25q20bw", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q20CL", "WINBOND", 0x4012, "w25q20cl", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q20EW", "WINBOND", 0x6012, "w25q20ew", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q256", "WINBOND", 0x4019, "w25q256", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "PP_1_1_1_4B", "READ_1_1_1_FAST_4B", "READ_1_1_2_4B", "READ_1_1_4_4B", "PP_1_1_4_4B"), 8, None),
+    ("W25Q256FV", "WINBOND", 0x4019, "w25q256fv", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25Q256JV", "WINBOND", 0x4019, "w25q256jv", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25Q256JVM", "WINBOND", 0x7019, "w25q256jvm", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q256JW", "WINBOND", 0x6019, "w25q256jw", 33554432, 256, 131072, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4", "READ_1_1_1_4B", "READ_1_1_2_4B", "READ_1_2_2_4B", "READ_1_1_4_4B", "READ_1_4_4_4B"), 8, (("READ_1_1_2", 8), ("READ_1_1_2_4B", 8), ("READ_1_2_2", 4), ("READ_1_2_2_4B", 4), ("READ_1_1_4", 32), ("READ_1_1_4_4B", 32), ("READ_1_4_4", 6), ("READ_1_4_4_4B", 6))),
+    ("W25Q32", "WINBOND", 0x4016, "w25q32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q32DW", "WINBOND", 0x6016, "w25q32dw", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q32FV", "WINBOND", 0x4016, "w25q32fv", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25Q32JV", "WINBOND", 0x7016, "w25q32jv", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q32JWM", "WINBOND", 0x8016, "w25q32jwm", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q64", "WINBOND", 0x4017, "w25q64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q64DW", "WINBOND", 0x6017, "w25q64dw", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q64FV", "WINBOND", 0x4017, "w25q64fv", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25Q64JV", "WINBOND", 0x4017, "w25q64jv", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q64JW", "WINBOND", 0x6017, "w25q64jw", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_2", "PP_1_1_2", "READ_1_1_4", "PP_1_1_4"), 8, None),
+    ("W25Q80", "WINBOND", 0x5014, "w25q80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q80BL", "WINBOND", 0x4014, "w25q80bl", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25Q80BV", "WINBOND", 0x4014, "w25q80bv", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("W25X05", "WINBOND", 0x3010, "w25x05", 65536, 256, 256, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X10", "WINBOND", 0x3011, "w25x10", 131072, 256, 512, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X16", "WINBOND", 0x3015, "w25x16", 2097152, 256, 8192, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X20", "WINBOND", 0x3012, "w25x20", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X32", "WINBOND", 0x3016, "w25x32", 4194304, 256, 16384, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X40", "WINBOND", 0x3013, "w25x40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X64", "WINBOND", 0x3017, "w25x64", 8388608, 256, 32768, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("W25X80", "WINBOND", 0x3014, "w25x80", 1048576, 256, 4096, ("READ_1_1_1", "PP_1_1_1", "READ_1_1_1_FAST"), 8, None),
+    ("ZD25D20", "THOMSON", 0x2012, "zd25d20", 262144, 256, 1024, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+    ("ZD25D40", "THOMSON", 0x2013, "zd25d40", 524288, 256, 2048, ("READ_1_1_1", "PP_1_1_1"), 8, None),
+)
@@ -1,5 +1,9 @@
 import sys
 import os
+import time
+
+# Wall/CPU times at the import of LiteX (start of the elaboration phase of the build profiler).
+import_times = (time.perf_counter(), os.times())
 
 from litex.tools.litex_client import RemoteClient
 
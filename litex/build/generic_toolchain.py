@@ -12,6 +12,8 @@ from migen.fhdl.structure import Signal, _Fragment
 
 from litex.gen import LiteXContext
 
+from litex.build.profiler import profile_phase
+
 # Generic Toolchain --------------------------------------------------------------------------------
 
 class GenericToolchain:
@@ -64,6 +66,7 @@ class GenericToolchain:
         synth_opts     = "",
         run            = True,
         build_backend  = "litex",
+        verilog_cache  = False,
         **kwargs):
 
         self._build_name = build_name
@@ -78,31 +81,36 @@ class GenericToolchain:
         os.chdir(self._build_dir)
 
         # Finalize Design.
-        if not isinstance(self.fragment, _Fragment):
-            self.fragment = self.fragment.get_fragment()
-        platform.finalize(self.fragment)
+        with profile_phase("platform_finalize"):
+            if not isinstance(self.fragment, _Fragment):
+                self.fragment = self.fragment.get_fragment()
+            platform.finalize(self.fragment)
 
         # Generate Verilog.
-        v_output = platform.get_verilog(self.fragment, name=build_name, **kwargs)
-        self._vns = v_output.ns
-        v_file = build_name + ".v"
-        v_output.write(v_file)
+        with profile_phase("verilog"):
+            if verilog_cache:
+                kwargs["cache"] = build_name + ".v.cache"
+            v_output = platform.get_verilog(self.fragment, name=build_name, **kwargs)
+            self._vns = v_output.ns
+            v_file = build_name + ".v"
+            v_output.write(v_file) # Only writes changed outputs.
 
-        # Finalize toolchain (after gateware is complete)
-        self.finalize()
+        with profile_phase("constraints"):
+            # Finalize toolchain (after gateware is complete)
+            self.finalize()
 
-        # Get signals and platform constraints
-        self.named_sc, self.named_pc = platform.resolve_signals(self._vns)
-        platform.add_source(v_file)
+            # Get signals and platform constraints
+            self.named_sc, self.named_pc = platform.resolve_signals(self._vns)
+            platform.add_source(v_file)
 
-        # Generate Design Timing Constraints File.
-        tim_cst_file = self.build_timing_constraints(v_output.ns)
+            # Generate Design Timing Constraints File.
+            tim_cst_file = self.build_timing_constraints(v_output.ns)
 
-        # Generate Design IO Constraints File.
-        io_cst_file = self.build_io_constraints()
+            # Generate Design IO Constraints File.
+            io_cst_file = self.build_io_constraints()
 
-        # Generate Design Placement Constraints File.
-        place_cst_file = self.build_placement_constraints()
+            # Generate Design Placement Constraints File.
+            place_cst_file = self.build_placement_constraints()
 
         if build_backend not in self.supported_build_backend:
             raise NotImplementedError("Build backend {build_backend} is not supported by {toolchain} toolchain".format(
@@ -113,14 +121,16 @@ class GenericToolchain:
         # LiteX backend.
         if build_backend == "litex":
             # Generate project.
-            self.build_project()
+            with profile_phase("project"):
+                self.build_project()
 
-            # Generate build script.
-            script = self.build_script()
+                # Generate build script.
+                script = self.build_script()
 
             # Run.
             if run:
-                self.run_script(script)
+                with profile_phase("run", python=False):
+                    self.run_script(script)
 
         # Edalize backend.
         else:
@@ -154,9 +164,11 @@ class GenericToolchain:
             }
 
             backend = get_edatool(tool)(edam=edam, work_root=self._build_dir)
-            backend.configure()
+            with profile_phase("project"):
+                backend.configure()
             if run:
-                backend.build()
+                with profile_phase("run", python=False):
+                    backend.build()
 
         os.chdir(cwd)
 
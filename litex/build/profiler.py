@@ -0,0 +1,179 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None # Not available on Windows.
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _cpu_time(t=None):
+    # CPU time of the process and of its (terminated) children: toolchains, compilers, etc...
+    t = os.times() if t is None else t
+    return t.user + t.system + t.children_user + t.children_system
+
+def _peak_memory():
+    # Peak resident memory of the process (in bytes).
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak*1024
+
+def _count_statements(statements):
+    from migen.fhdl.structure import If, Case
+    count = 0
+    for s in statements:
+        if isinstance(s, If):
+            count += 1 + _count_statements(s.t) + _count_statements(s.f)
+        elif isinstance(s, Case):
+            count += 1 + sum(_count_statements(v) for v in s.cases.values())
+        elif isinstance(s, (list, tuple)):
+            count += _count_statements(s)
+        else:
+            count += 1
+    return count
+
+def get_fragment_counts(f, signals):
+    """Return the number of signals, statements, memories and instances of a lowered fragment."""
+    from migen.fhdl.specials import Instance, Memory
+    return {
+        "signals"    : len(signals),
+        "statements" : _count_statements(f.comb) + sum(_count_statements(v) for v in f.sync.values()),
+        "memories"   : sum(isinstance(s, Memory)   for s in f.specials),
+        "instances"  : sum(isinstance(s, Instance) for s in f.specials),
+    }
+
+# Build Profiler -----------------------------------------------------------------------------------
+
+_profiler = None
+
+class BuildProfiler:
+    """Records the wall time, CPU time and peak memory of the build phases.
+
+    The profiler is active between ``start`` and ``stop``. Phases are recorded with the ``phase``
+    context manager, or with ``profile_phase`` from code that has no access to the profiler
+    (toolchains, Verilog generation), and can be nested: their names are then joined with "/".
+    The CPU time includes the CPU time of the subprocesses (compilers, vendor tools) and the peak
+    memory is the peak resident memory of the Python process at the end of the phase.
+
+    With ``cprofile``, the Python code of the phases (except the ones running external tools) is
+    also profiled with cProfile. The elaboration phase (from the import of LiteX to ``start``) has
+    already run when the profiler is created and is not profiled.
+    """
+    def __init__(self, cprofile=False):
+        self.phases   = []
+        self.counts   = {}
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self._stack   = []
+        self._python  = [True]
+        self._parent  = None
+
+    def start(self):
+        global _profiler
+        self._parent = _profiler
+        _profiler    = self
+        # Time spent before the build (SoC elaboration), from the import of LiteX.
+        import litex
+        wall, cpu = litex.import_times
+        self.phases.append({
+            "name"        : "elaboration",
+            "wall"        : time.perf_counter() - wall,
+            "cpu"         : _cpu_time() - _cpu_time(cpu),
+            "peak_memory" : _peak_memory(),
+        })
+        if self.cprofile is not None:
+            self.cprofile.enable()
+
+    def stop(self):
+        global _profiler
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        _profiler = self._parent
+
+    @contextmanager
+    def phase(self, name, python=True):
+        """Record a phase, ``python`` is False for phases running external tools."""
+        self._stack.append(name)
+        record = {"name": "/".join(self._stack)}
+        self.phases.append(record)
+        self._set_python(python)
+        wall = time.perf_counter()
+        cpu  = _cpu_time()
+        try:
+            yield
+        finally:
+            record["wall"]        = time.perf_counter() - wall
+            record["cpu"]         = _cpu_time() - cpu
+            record["peak_memory"] = _peak_memory()
+            self._stack.pop()
+            self._set_python(None)
+
+    def _set_python(self, python):
+        # Only profile the Python phases (python=None restores the state of the parent phase).
+        if python is None:
+            self._python.pop()
+        else:
+            self._python.append(self._python[-1] and python)
+        if self.cprofile is not None and _profiler is self:
+            if self._python[-1]:
+                self.cprofile.enable()
+            else:
+                self.cprofile.disable()
+
+    def count(self, **counts):
+        for k, v in counts.items():
+            self.counts[k] = self.counts.get(k, 0) + v
+
+    def summary(self):
+        s = "{:<40} {:>10} {:>10} {:>14}\n".format("Phase", "Wall (s)", "CPU (s)", "Peak Mem (MB)")
+        for phase in self.phases:
+            *parents, name = phase["name"].split("/")
+            s += "{:<40} {:>10} {:>10} {:>14}\n".format(
+                "  "*len(parents) + name,
+                "-" if phase.get("wall")        is None else "{:.2f}".format(phase["wall"]),
+                "-" if phase.get("cpu")         is None else "{:.2f}".format(phase["cpu"]),
+                "-" if phase.get("peak_memory") is None else "{:.1f}".format(phase["peak_memory"]/2**20),
+            )
+        if self.counts:
+            s += ", ".join("{}: {}".format(k, v) for k, v in self.counts.items()) + "\n"
+        return s
+
+    def write(self, filename):
+        """Write the profile to filename (JSON) and the cProfile statistics next to it (.prof/.txt)."""
+        with open(filename, "w") as f:
+            json.dump({"phases": self.phases, "counts": self.counts}, f, indent=4)
+        if self.cprofile is not None:
+            base = os.path.splitext(filename)[0]
+            self.cprofile.dump_stats(base + ".prof")
+            with open(base + ".txt", "w") as f:
+                stats = pstats.Stats(self.cprofile, stream=f)
+                stats.sort_stats("cumulative").print_stats(50)
+
+def get_profiler():
+    """Return the active BuildProfiler (or None)."""
+    return _profiler
+
+@contextmanager
+def profile_phase(name, python=True):
+    """Record a phase in the active BuildProfiler (if any)."""
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name, python=python):
+            yield
+
+def profile_count(**counts):
+    """Add counts to the active BuildProfiler (if any)."""
+    if _profiler is not None:
+        _profiler.count(**counts)
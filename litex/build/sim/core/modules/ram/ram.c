@@ -0,0 +1,324 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <string.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <json-c/json.h>
+#include "error.h"
+#include "modules.h"
+
+/*
+ * RAM backed by memory images loaded at startup.
+ *
+ * The module serves a Wishbone slave exported on the "interface" pads (adr, dat_w, dat_r, sel,
+ * cyc, stb, ack, we). Images are mapped privately (copy-on-write) into the RAM, so that large
+ * images (Linux, rootfs) are loaded lazily by the OS and are never modified by the simulation.
+ *
+ * Args (JSON):
+ *   base        RAM base address in bytes (origin of the RAM region on the bus).
+ *   size        RAM size in bytes.
+ *   data_width  Wishbone data width in bits (multiple of 8).
+ *   endianness  "little" or "big" (bytes of the 32-bit words of the images).
+ *   images      List of [filename, offset in bytes] loaded into the RAM.
+ *
+ * The Wishbone address is the word address on the bus: accesses outside of [base, base + size)
+ * are reported and return zero data (writes are dropped).
+ *
+ * Pads values are stored by Verilator as little-endian integers (CData/SData/IData/QData or
+ * arrays of 32-bit words for wider signals), so they are accessed as bytes.
+ */
+
+struct session_s {
+  char *sys_clk;
+  uint8_t *adr;
+  uint8_t *dat_w;
+  uint8_t *dat_r;
+  uint8_t *sel;
+  uint8_t *cyc;
+  uint8_t *stb;
+  uint8_t *ack;
+  uint8_t *we;
+  size_t adr_bytes;
+  size_t sel_bytes;
+  uint8_t *mem;
+  uint64_t base;
+  size_t size;
+  unsigned int data_bytes;
+  unsigned int big_endian;
+  clk_edge_state_t edge;
+};
+
+static int litex_sim_module_pads_get(struct pad_s *pads, char *name, void **signal, size_t *len)
+{
+  int ret = RC_OK;
+  void *sig = NULL;
+  int i;
+
+  if(!pads || !name || !signal) {
+    ret=RC_INVARG;
+    goto out;
+  }
+
+  i = 0;
+  while(pads[i].name) {
+    if(!strcmp(pads[i].name, name)) {
+      sig = (void*)pads[i].signal;
+      if(len)
+        *len = pads[i].len;
+      break;
+    }
+    i++;
+  }
+
+out:
+  *signal = sig;
+  return ret;
+}
+
+static int ram_start(void *b)
+{
+  printf("[ram] loaded\n");
+  return RC_OK;
+}
+
+static int ram_load_image(struct session_s *s, const char *filename, size_t offset)
+{
+  struct stat st;
+  size_t len = 0;
+  size_t done;
+  ssize_t r;
+  long page_size = sysconf(_SC_PAGESIZE);
+  int fd;
+
+  fd = open(filename, O_RDONLY);
+  if(fd < 0 || fstat(fd, &st) < 0) {
+    eprintf("Unable to open %s\n", filename);
+    return RC_ERROR;
+  }
+  len = st.st_size;
+  if(offset + len > s->size) {
+    eprintf("%s does not fit in RAM (%zu + %zu > %zu bytes)\n", filename, offset, len, s->size);
+    close(fd);
+    return RC_ERROR;
+  }
+
+  if(len && (offset % page_size) == 0) {
+    /* Map the image over the RAM, the last (partial) page is zero padded by the OS. */
+    if(mmap(s->mem + offset, len, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_FIXED, fd, 0) == MAP_FAILED) {
+      eprintf("Unable to map %s\n", filename);
+      close(fd);
+      return RC_ERROR;
+    }
+  } else {
+    for(done = 0; done < len; done += r) {
+      r = pread(fd, s->mem + offset + done, len - done, done);
+      if(r <= 0) {
+        eprintf("Unable to read %s\n", filename);
+        close(fd);
+        return RC_ERROR;
+      }
+    }
+  }
+  close(fd);
+  printf("[ram] %s loaded at 0x%zx (%zu bytes)\n", filename, offset, len);
+  return RC_OK;
+}
+
+static int ram_parse_args(struct session_s *s, char *args)
+{
+  json_object *jsobj;
+  json_object *obj;
+  json_object *image;
+  const char *endianness;
+  size_t i;
+  int ret = RC_OK;
+
+  jsobj = json_tokener_parse(args);
+  if(!jsobj || !json_object_is_type(jsobj, json_type_object)) {
+    fprintf(stderr, "Error parsing json arg: %s \n", args);
+    return RC_JSERROR;
+  }
+
+  if(!json_object_object_get_ex(jsobj, "size", &obj)) {
+    fprintf(stderr, "Could not find object: \"size\" (%s)\n", args);
+    ret = RC_JSERROR;
+    goto out;
+  }
+  s->size = json_object_get_int64(obj);
+
+  s->base = 0;
+  if(json_object_object_get_ex(jsobj, "base", &obj))
+    s->base = json_object_get_int64(obj);
+
+  s->data_bytes = 4;
+  if(json_object_object_get_ex(jsobj, "data_width", &obj))
+    s->data_bytes = json_object_get_int(obj)/8;
+
+  s->big_endian = 0;
+  if(json_object_object_get_ex(jsobj, "endianness", &obj)) {
+    endianness = json_object_get_string(obj);
+    s->big_endian = !strcmp(endianness, "big");
+  }
+
+  /* Zero initialized RAM, only the pages that are accessed are allocated. */
+  s->mem = mmap(NULL, s->size, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+  if(s->mem == MAP_FAILED) {
+    eprintf("Unable to allocate %zu bytes\n", s->size);
+    ret = RC_NOENMEM;
+    goto out;
+  }
+
+  if(json_object_object_get_ex(jsobj, "images", &obj)) {
+    for(i = 0; i < json_object_array_length(obj); i++) {
+      image = json_object_array_get_idx(obj, i);
+      ret = ram_load_image(s,
+        json_object_get_string(json_object_array_get_idx(image, 0)),
+        json_object_get_int64(json_object_array_get_idx(image, 1)));
+      if(ret != RC_OK)
+        goto out;
+    }
+  }
+
+out:
+  json_object_put(jsobj);
+  return ret;
+}
+
+static int ram_new(void **sess, char *args)
+{
+  int ret = RC_OK;
+  struct session_s *s = NULL;
+
+  if(!sess) {
+    ret = RC_INVARG;
+    goto out;
+  }
+
+  s = (struct session_s*) malloc(sizeof(struct session_s));
+  if(!s) {
+    ret=RC_NOENMEM;
+    goto out;
+  }
+  memset(s, 0, sizeof(struct session_s));
+
+  ret = ram_parse_args(s, args);
+
+out:
+  *sess = (void*) s;
+  return ret;
+}
+
+static int ram_add_pads(void *sess, struct pad_list_s *plist)
+{
+  int ret = RC_OK;
+  struct session_s *s = (struct session_s*) sess;
+  struct pad_s *pads;
+  size_t len = 0;
+
+  if(!sess || !plist) {
+    ret = RC_INVARG;
+    goto out;
+  }
+  pads = plist->pads;
+  if(!strcmp(plist->name, "sys_clk")) {
+    litex_sim_module_pads_get(pads, "sys_clk", (void**) &s->sys_clk, NULL);
+  } else {
+    litex_sim_module_pads_get(pads, "adr",   (void**) &s->adr, &len);
+    s->adr_bytes = (len + 7)/8;
+    litex_sim_module_pads_get(pads, "sel",   (void**) &s->sel, &len);
+    s->sel_bytes = (len + 7)/8;
+    litex_sim_module_pads_get(pads, "dat_w", (void**) &s->dat_w, NULL);
+    litex_sim_module_pads_get(pads, "dat_r", (void**) &s->dat_r, NULL);
+    litex_sim_module_pads_get(pads, "cyc",   (void**) &s->cyc, NULL);
+    litex_sim_module_pads_get(pads, "stb",   (void**) &s->stb, NULL);
+    litex_sim_module_pads_get(pads, "ack",   (void**) &s->ack, NULL);
+    litex_sim_module_pads_get(pads, "we",    (void**) &s->we, NULL);
+  }
+
+out:
+  return ret;
+}
+
+static uint64_t ram_get_value(uint8_t *signal, size_t nbytes)
+{
+  uint64_t value = 0;
+  size_t i;
+
+  for(i = 0; i < nbytes && i < 8; i++)
+    value |= (uint64_t) signal[i] << (8*i);
+  return value;
+}
+
+static int ram_tick(void *sess, uint64_t time_ps)
+{
+  struct session_s *s = (struct session_s*)sess;
+  uint64_t sel;
+  uint64_t addr;
+  size_t byte;
+  unsigned int i;
+
+  if(!clk_pos_edge(&s->edge, *s->sys_clk)) {
+    return RC_OK;
+  }
+
+  if(*s->ack) {
+    *s->ack = 0;
+    return RC_OK;
+  }
+  if(!(*s->cyc && *s->stb)) {
+    return RC_OK;
+  }
+
+  addr = ram_get_value(s->adr, s->adr_bytes)*s->data_bytes;
+  if(addr < s->base || addr - s->base > s->size - s->data_bytes) {
+    eprintf("Access outside of RAM at 0x%llx\n", (unsigned long long) addr);
+    if(!*s->we)
+      memset(s->dat_r, 0, s->data_bytes);
+    *s->ack = 1;
+    return RC_OK;
+  }
+  addr -= s->base;
+  sel   = ram_get_value(s->sel, s->sel_bytes);
+  for(i = 0; i < s->data_bytes; i++) {
+    /* Images are made of 32-bit words in the CPU endianness. */
+    byte = addr + (s->big_endian ? (i ^ 3) : i);
+    if(*s->we) {
+      if((sel >> i) & 1)
+        s->mem[byte] = s->dat_w[i];
+    } else {
+      s->dat_r[i] = s->mem[byte];
+    }
+  }
+  *s->ack = 1;
+
+  return RC_OK;
+}
+
+static int ram_close(void *sess)
+{
+  struct session_s *s = (struct session_s*)sess;
+
+  if(s->mem && s->mem != MAP_FAILED)
+    munmap(s->mem, s->size);
+  free(s);
+  return RC_OK;
+}
+
+static struct ext_module_s ext_mod = {
+  "ram",
+  ram_start,
+  ram_new,
+  ram_add_pads,
+  ram_close,
+  ram_tick
+};
+
+int litex_sim_ext_module_init(int (*register_module) (struct ext_module_s *))
+{
+  int ret = RC_OK;
+  ret = register_module(&ext_mod);
+  return ret;
+}
@@ -23,10 +23,10 @@ EXTRA_MOD_SRC_DIR=$(EXTRA_MOD_BASE_DIR)/$(MOD)
 all: $(MOD).so
 
 %.o: $(MOD_SRC_DIR)/%.c
-	$(CC) -c $(CFLAGS) -I$(MOD_SRC_DIR)/../.. -o $@ $<
+	$(OBJCACHE) $(CC) -c $(CFLAGS) -I$(MOD_SRC_DIR)/../.. -o $@ $<
 
 %.o: $(EXTRA_MOD_SRC_DIR)/%.c
-	$(CC) -c $(CFLAGS) -I$(SRC_DIR) -o $@ $<
+	$(OBJCACHE) $(CC) -c $(CFLAGS) -I$(SRC_DIR) -o $@ $<
 
 %.so: %.o
 ifeq ($(UNAME_S),Darwin)
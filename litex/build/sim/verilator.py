@@ -7,6 +7,7 @@
 
 import os
 import sys
+import hashlib
 import subprocess
 from pathlib import Path
 from shutil import which
@@ -133,25 +134,70 @@ def _generate_sim_config(config):
     tools.write_to_file("sim_config.js", content)
 
 
-def _build_sim(build_name, sources, jobs, threads, coverage, opt_level="O3", trace_fst=False, video=False):
+def _hash_files(h, filenames):
+    for filename in sorted(filenames):
+        h.update(filename.encode() + b"\0")
+        with open(filename, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+
+def _list_files(directory):
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for f in files:
+            yield os.path.join(root, f)
+
+def _build_sim(build_name, sources, jobs, threads, coverage, opt_level="O3", trace_fst=False, video=False,
+    extra_mods=None, extra_mods_path=""):
     makefile = os.path.join(core_directory, 'Makefile')
 
-    cc_srcs = []
+    cc_srcs  = []
+    cc_files = []
     for filename, language, library, *copy in sources:
+        # Memory init files are read at runtime by $readmemh and are not part of the build.
         if Path(filename).suffix not in [".hex", ".init"]:
             cc_srcs.append("--cc " + filename + " ")
+            cc_files.append(filename)
+
+    # Build flags: a change requires a full rebuild since compiler flags are not tracked by make.
+    flags = " ".join(flag for flag in [
+        "CC_SRCS=\"{}\"".format("".join(cc_srcs)),
+        "THREADS={}".format(threads) if int(threads) > 1 else "",
+        "COVERAGE=1" if coverage else "",
+        "OPT_LEVEL={}".format(opt_level),
+        "TRACE_FST=1" if trace_fst else "",
+        "VIDEO=1" if video else "",
+    ] if flag)
+    flags_hash = hashlib.sha256(flags.encode()).hexdigest()
+
+    # Build sources: Verilog, generated C++/headers and simulator/modules sources. A change only
+    # requires an incremental build (Verilator skips unchanged inputs, make unchanged objects).
+    h = hashlib.sha256(flags_hash.encode())
+    _hash_files(h, cc_files + ["sim_header.h", "sim_init.cpp", "variables.mak"])
+    _hash_files(h, _list_files(core_directory))
+    if extra_mods:
+        for mod in extra_mods:
+            _hash_files(h, _list_files(os.path.join(extra_mods_path, mod)))
+    sources_hash = h.hexdigest()
 
     build_script_contents = """\
-rm -rf obj_dir/
-make -C . -f {} {} {} {} {} {} {}
-""".format(makefile,
-    "CC_SRCS=\"{}\"".format("".join(cc_srcs)),
-    "JOBS={}".format(jobs) if jobs else "",
-    "THREADS={}".format(threads) if int(threads) > 1 else "",
-    "COVERAGE=1" if coverage else "",
-    "OPT_LEVEL={}".format(opt_level),
-    "TRACE_FST=1" if trace_fst else "",
-    "VIDEO=1" if video else "",
+set -e
+if [ "$(cat obj_dir/flags.sha256 2>/dev/null)" != "{flags_hash}" ]; then
+    rm -rf obj_dir/
+fi
+if [ "$(cat obj_dir/sources.sha256 2>/dev/null)" != "{sources_hash}" ] || [ ! -x obj_dir/Vsim ]; then
+    make -C . -f {makefile} {flags}
+    echo {flags_hash} > obj_dir/flags.sha256
+    echo {sources_hash} > obj_dir/sources.sha256
+fi
+""".format(
+    makefile     = makefile,
+    flags        = " ".join(flag for flag in [
+        flags,
+        "JOBS={}".format(jobs) if jobs else "",
+        "OBJCACHE=ccache" if which("ccache") is not None else "",
+    ] if flag),
+    flags_hash   = flags_hash,
+    sources_hash = sources_hash,
     )
     build_script_file = "build_" + build_name + ".sh"
     tools.write_to_file(build_script_file, build_script_contents, force_unix=True)
@@ -209,6 +255,7 @@ class SimVerilatorToolchain:
             trace_start      = 0,
             trace_end        = -1,
             regular_comb     = False,
+            verilog_cache    = False,
             interactive      = True,
             pre_run_callback = None,
             extra_mods       = None,
@@ -229,6 +276,7 @@ class SimVerilatorToolchain:
             v_output = platform.get_verilog(fragment,
                 name         = build_name,
                 regular_comb = regular_comb,
+                cache        = build_name + ".v.cache" if verilog_cache else None,
             )
             named_sc, named_pc = platform.resolve_signals(v_output.ns)
             v_file = build_name + ".v"
@@ -250,14 +298,16 @@ class SimVerilatorToolchain:
 
             # Build
             _build_sim(
-                build_name = build_name,
-                sources    = platform.sources,
-                jobs       = jobs,
-                threads    = threads,
-                coverage   = coverage,
-                opt_level  = opt_level,
-                trace_fst  = trace_fst,
-                video      = video,
+                build_name      = build_name,
+                sources         = platform.sources,
+                jobs            = jobs,
+                threads         = threads,
+                coverage        = coverage,
+                opt_level       = opt_level,
+                trace_fst       = trace_fst,
+                video           = video,
+                extra_mods      = extra_mods,
+                extra_mods_path = extra_mods_path,
             )
 
         # Run
@@ -28,7 +28,10 @@ def language_by_filename(name):
     return None
 
 
-def write_to_file(filename, contents, force_unix=False):
+def write_to_file(filename, contents, force_unix=False, ignore_banner=False):
+    # Only write the file when its contents change (keeping its modification time, and avoiding
+    # rebuilds of its dependencies). With ignore_banner, a change of the generated banner (date and
+    # LiteX revision) alone is not considered as a change.
     newline = None
     if force_unix:
         newline = "\n"
@@ -36,7 +39,12 @@ def write_to_file(filename, contents, force_unix=False):
     if os.path.exists(filename):
         with open(filename, "r", newline=newline) as f:
             old_contents = f.read()
-    if old_contents != contents:
+    if ignore_banner and old_contents is not None:
+        old_contents = _generated_banner_re.sub("", old_contents)
+        new_contents = _generated_banner_re.sub("", contents)
+    else:
+        new_contents = contents
+    if old_contents != new_contents:
         with open(filename, "w", newline=newline) as f:
             f.write(contents)
 
@@ -120,6 +128,8 @@ def generated_separator(line_comment="//", msg=""):
     r += line_comment + "-"*80 + "\n"
     return r
 
+_generated_banner_re = re.compile(r"^.*Auto-generated by LiteX \(.*\) on .*$", re.MULTILINE)
+
 def generated_banner(line_comment="//"):
     msg = "Auto-generated by LiteX ({}) on {}".format(
         get_litex_git_revision(),
@@ -0,0 +1,304 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import enum
+import pickle
+import hashlib
+
+from migen.fhdl.structure import *
+from migen.fhdl.structure import _Value, _Statement, _Operator, _Slice, _ArrayProxy, _Assign
+from migen.fhdl.specials  import Special
+
+from litex.gen.fhdl.namer import SignalNamespace
+
+# Version of the cache format, to be increased when the cached data or the Verilog generation
+# change in a way not covered by the fragment hash.
+_CACHE_VERSION = 2
+
+# Fragment Hasher ----------------------------------------------------------------------------------
+
+class _Unhashable(Exception):
+    pass
+
+class _FragmentHasher:
+    """Computes a structural hash of a lowered fragment.
+
+    The hash covers everything the Verilog generation depends on: statements, specials (with all
+    their attributes, private ones included), clock domains and the properties of the signals used
+    to name them (width, reset, name override, backtrace, related signals and attributes). Signals
+    and specials are identified by their order of first appearance, which is deterministic for a
+    given design, and are recorded in ``objects`` so that a cached namespace can be mapped back
+    onto the current design.
+    """
+    max_depth = 16
+
+    def __init__(self):
+        self.tokens  = []
+        self.objects = []
+        self.indices = {}
+
+    # Objects --------------------------------------------------------------------------------------
+
+    def _index(self, obj):
+        # Return (index, new) for a Signal/Special.
+        try:
+            return self.indices[obj], False
+        except KeyError:
+            index = len(self.objects)
+            self.indices[obj] = index
+            self.objects.append(obj)
+            return index, True
+
+    def _signal_description(self, signal):
+        related = None
+        if signal.related is not None:
+            related = self._signal_description(signal.related)
+        return (
+            signal.nbits,
+            signal.signed,
+            signal.name_override,
+            signal.variable,
+            tuple(tuple(step) for step in signal.backtrace),
+            tuple(sorted(repr(a) for a in signal.attr)),
+            related,
+        )
+
+    def signal(self, signal):
+        index, new = self._index(signal)
+        if new:
+            self.tokens.append("S{}:{!r}".format(index, self._signal_description(signal)))
+            self.expression(signal.reset)
+        else:
+            self.tokens.append("s{}".format(index))
+
+    # Expressions ----------------------------------------------------------------------------------
+
+    def expression(self, node):
+        tokens = self.tokens
+        if isinstance(node, Constant):
+            tokens.append("C{},{},{}".format(node.value, node.nbits, node.signed))
+        elif isinstance(node, Signal):
+            self.signal(node)
+        elif isinstance(node, ClockSignal):
+            tokens.append("CK" + node.cd)
+        elif isinstance(node, ResetSignal):
+            tokens.append("RS{},{}".format(node.cd, node.allow_reset_less))
+        elif isinstance(node, _Operator):
+            tokens.append("O" + node.op)
+            for operand in node.operands:
+                self.expression(operand)
+            tokens.append(")")
+        elif isinstance(node, _Slice):
+            tokens.append("SL{},{}".format(node.start, node.stop))
+            self.expression(node.value)
+        elif isinstance(node, Cat):
+            tokens.append("CAT")
+            for element in node.l:
+                self.expression(element)
+            tokens.append(")")
+        elif isinstance(node, Replicate):
+            tokens.append("R{}".format(node.n))
+            self.expression(node.v)
+        elif isinstance(node, _ArrayProxy):
+            tokens.append("A")
+            for choice in node.choices:
+                self.expression(choice)
+            tokens.append("K")
+            self.expression(node.key)
+        else:
+            self.obj(node)
+
+    # Statements -----------------------------------------------------------------------------------
+
+    def statements(self, statements):
+        tokens = self.tokens
+        tokens.append("[")
+        for s in statements:
+            if isinstance(s, _Assign):
+                tokens.append("=")
+                self.expression(s.l)
+                self.expression(s.r)
+            elif isinstance(s, If):
+                tokens.append("IF")
+                self.expression(s.cond)
+                self.statements(s.t)
+                self.statements(s.f)
+            elif isinstance(s, Case):
+                tokens.append("CASE")
+                self.expression(s.test)
+                for k, v in s.cases.items():
+                    if isinstance(k, Constant):
+                        self.expression(k)
+                    else:
+                        tokens.append(repr(k))
+                    self.statements(v)
+                tokens.append(")")
+            elif isinstance(s, (list, tuple)):
+                self.statements(s)
+            else:
+                self.obj(s)
+        tokens.append("]")
+
+    # Generic Objects ------------------------------------------------------------------------------
+
+    def obj(self, o, depth=0, visited=None):
+        if depth > self.max_depth:
+            raise _Unhashable(o)
+        if visited is None:
+            visited = set()
+        tokens = self.tokens
+        if o is None or isinstance(o, (bool, int, float, str, bytes, enum.Enum)):
+            tokens.append(repr(o))
+        elif isinstance(o, _Value):
+            self.expression(o)
+        elif isinstance(o, _Statement):
+            self.statements([o])
+        elif isinstance(o, (list, tuple)):
+            if all(type(e) is int for e in o):
+                # Fast path for memory contents.
+                tokens.append(repr(o))
+            else:
+                tokens.append("[")
+                for e in o:
+                    self.obj(e, depth + 1, visited)
+                tokens.append("]")
+        elif isinstance(o, (set, frozenset)):
+            tokens.append("{")
+            for e in sorted(o, key=lambda e: (0, e.duid, "") if hasattr(e, "duid") else (1, 0, repr(e))):
+                self.obj(e, depth + 1, visited)
+            tokens.append("}")
+        elif isinstance(o, dict):
+            tokens.append("{")
+            for k, v in sorted(o.items(), key=lambda kv: repr(kv[0])):
+                tokens.append(repr(k))
+                self.obj(v, depth + 1, visited)
+            tokens.append("}")
+        elif isinstance(o, type) or callable(o) and hasattr(o, "__qualname__"):
+            tokens.append("T{}.{}".format(o.__module__, o.__qualname__))
+        elif isinstance(o, ClockDomain):
+            tokens.append("CD" + o.name)
+            self.expression(o.clk)
+            self.obj(o.rst, depth + 1, visited)
+        elif hasattr(o, "__dict__"):
+            if id(o) in visited:
+                raise _Unhashable(o)
+            visited.add(id(o))
+            if isinstance(o, Special):
+                index, new = self._index(o)
+                tokens.append("X{}".format(index))
+            tokens.append("T{}.{}".format(type(o).__module__, type(o).__qualname__))
+            for k, v in sorted(vars(o).items()):
+                if k in ("duid", "platform"):
+                    continue
+                tokens.append(k)
+                self.obj(v, depth + 1, visited)
+            visited.discard(id(o))
+        else:
+            raise _Unhashable(o)
+
+    # Fragment -------------------------------------------------------------------------------------
+
+    def fragment(self, f, ios):
+        self.tokens.append("IOS")
+        for io in sorted(ios, key=lambda x: x.duid):
+            self.signal(io)
+        self.tokens.append("CDS")
+        for cd in f.clock_domains:
+            self.obj(cd)
+        self.tokens.append("COMB")
+        self.statements(f.comb)
+        for k, v in sorted(f.sync.items()):
+            self.tokens.append("SYNC" + k)
+            self.statements(v)
+        self.tokens.append("SPECIALS")
+        for special in sorted(f.specials, key=lambda x: x.duid):
+            self.obj(special)
+
+    def hexdigest(self, *parameters):
+        h = hashlib.sha256()
+        h.update(repr((_CACHE_VERSION,) + parameters).encode())
+        for token in self.tokens:
+            h.update(token.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+# Verilog Cache ------------------------------------------------------------------------------------
+
+class VerilogCache:
+    """On-disk cache of the Verilog generated for a fragment.
+
+    ``lookup`` hashes the lowered fragment and, when it matches the cached one, returns the
+    cached Verilog preceding/following the specials along with a SignalNamespace rebuilt for the
+    current design objects, allowing to skip signal naming and Verilog printing. Specials are not
+    cached: their ``emit_verilog`` can have side effects (data files, sources) and they are always
+    emitted, with the namespace recorded by ``record_namespace`` just before their emission.
+    ``store`` records the result of a full generation.
+    """
+    def __init__(self, filename):
+        self.filename  = filename
+        self.hasher    = None
+        self.digest    = None
+        self.namespace = None
+
+    def lookup(self, f, ios, *parameters):
+        self.hasher = _FragmentHasher()
+        try:
+            self.hasher.fragment(f, ios)
+        except _Unhashable:
+            self.hasher = None
+            return None
+        self.digest = self.hasher.hexdigest(*parameters)
+
+        if not os.path.exists(self.filename):
+            return None
+        try:
+            with open(self.filename, "rb") as cf:
+                cache = pickle.load(cf)
+        except Exception:
+            return None
+        if cache.get("digest") != self.digest:
+            return None
+        if len(self.hasher.objects) != cache["nobjects"]:
+            return None
+
+        objects = self.hasher.objects
+        ns = SignalNamespace({objects[i]: name for i, name in cache["name_dict"]})
+        ns.counts = dict(cache["counts"])
+        ns.sigs   = {objects[i]: n for i, n in cache["sigs"]}
+        for i, attrs in cache["ios"]:
+            for k, v in attrs.items():
+                setattr(objects[i], k, v)
+        return cache["head"], cache["tail"], ns
+
+    def record_namespace(self, ns):
+        """Record the namespace before the emission of the specials (that can create signals)."""
+        if self.hasher is None:
+            return
+        indices = self.hasher.indices
+        # Only keep the objects that are part of the design: the name dictionary also contains
+        # the related signals used to build names (their names are still accounted for in counts).
+        self.namespace = {
+            "name_dict" : [(indices[s], name) for s, name in ns.name_dict.items() if s in indices],
+            "counts"    : dict(ns.counts),
+            "sigs"      : [(indices[s], n)    for s, n    in ns.sigs.items()      if s in indices],
+        }
+
+    def store(self, ios, head, tail):
+        """Store the Verilog preceding (head) and following (tail) the specials."""
+        if self.hasher is None or self.namespace is None:
+            return
+        indices = self.hasher.indices
+        cache = {
+            "digest"   : self.digest,
+            "nobjects" : len(self.hasher.objects),
+            "ios"      : [(indices[io], {k: getattr(io, k) for k in ("type", "name", "port", "direction")})
+                for io in ios if hasattr(io, "direction")],
+            "head"     : head,
+            "tail"     : tail,
+            **self.namespace,
+        }
+        with open(self.filename, "wb") as cf:
+            pickle.dump(cache, cf, protocol=pickle.HIGHEST_PROTOCOL)
@@ -5,6 +5,9 @@
 # This file is Copyright (c) 2021-2023 Florent Kermarrec <florent@enjoy-digital.fr>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import sys
+import array
+
 from migen.fhdl.structure    import *
 from migen.fhdl.module       import *
 from migen.fhdl.bitcontainer import bits_for
@@ -12,6 +15,29 @@ from migen.fhdl.tools        import *
 from migen.fhdl.verilog      import _printexpr as verilog_printexpr
 from migen.fhdl.specials     import *
 
+# LiteX Memory Init Content ------------------------------------------------------------------------
+
+_init_typecodes = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+def _memory_init_content(width, init):
+    # $readmemh content: one hexadecimal word per line.
+    typecode = _init_typecodes.get(width)
+    if typecode is not None and array.array(typecode).itemsize == width//8:
+        # Fast path: convert the words to a big-endian buffer and hexlify it in bulk.
+        try:
+            data = array.array(typecode, init)
+        except (OverflowError, TypeError):
+            pass
+        else:
+            if sys.byteorder == "little":
+                data.byteswap()
+            content = memoryview(data).cast("B").hex("\n", width//8)
+            if len(data):
+                content += "\n"
+            return content
+    formatter = f"%0{int(width/4)}x\n"
+    return (formatter*len(init)) % tuple(init)
+
 # LiteX Memory Verilog Generation ------------------------------------------------------------------
 
 def _memory_generate_verilog(name, memory, namespace, add_data_file):
@@ -74,10 +100,7 @@ def _memory_generate_verilog(name, memory, namespace, add_data_file):
     # ----------------------------------------
     r += f"reg [{memory.width-1}:0] {_get_name(memory)}[0:{memory.depth-1}];\n"
     if memory.init is not None:
-        content = ""
-        formatter = f"{{:0{int(memory.width/4)}x}}\n"
-        for d in memory.init:
-            content += formatter.format(d)
+        content = _memory_init_content(memory.width, memory.init)
         memory_filename = add_data_file(f"{name}_{_get_name(memory)}.init", content)
 
         r += "initial begin\n"
@@ -5,8 +5,6 @@
 # This file is Copyright (c) 2023 Florent Kermarrec <florent@enjoy-digital.fr>
 # SPDX-License-Identifier: BSD-2-Clause
 
-from itertools import combinations
-
 from migen.fhdl.structure import *
 
 # Hierarchy Node Class -----------------------------------------------------------------------------
@@ -17,22 +15,30 @@ class _HierarchyNode:
     Attributes:
         signal_count (int): The count of signals in this node.
         numbers      (set): A set containing numbers associated with this node.
+        all_numbers (dict): Ranks of the numbers of the base node, when numbering is used.
         use_name    (bool): Flag to determine if the node's name should be used in signal naming.
         use_number  (bool): Flag to determine if the node's number should be used in signal naming.
         children    (dict): A dictionary of child nodes.
     """
     def __init__(self):
-        self.signal_count = 0
-        self.numbers      = set()
-        self.use_name     = False
-        self.use_number   = False
-        self.children     = {}
-        self.all_numbers  = []
+        self.signal_count   = 0
+        self.numbers        = set()
+        self.use_name       = False
+        self.use_number     = False
+        self.children       = {}
+        self.all_numbers    = {}
+        self.number_indexes = None
+
+    def get_number_indexes(self):
+        """Returns a dictionary mapping each number of this node to its rank (computed once)."""
+        if self.number_indexes is None:
+            self.number_indexes = {n: i for i, n in enumerate(sorted(self.numbers))}
+        return self.number_indexes
 
     def update(self, name, number, use_number, current_base=None):
         """
         Updates or creates a hierarchy node based on the current position, name, and number.
-        If numbering is used, sorts and stores all numbers associated with the base node.
+        If numbering is used, stores the ranks of all numbers associated with the base node.
 
         Parameters:
             name                              (str): The name of the current hierarchy level.
@@ -45,15 +51,17 @@ class _HierarchyNode:
         """
         # Create the appropriate key for the node.
         key = (name, number) if use_number else name
-        # Use setdefault to either get the existing child node or create a new one.
-        child = self.children.setdefault(key, _HierarchyNode())
+        # Get the existing child node or create a new one.
+        child = self.children.get(key)
+        if child is None:
+            child = self.children[key] = _HierarchyNode()
         # Add the number to the set of numbers associated with this node.
         child.numbers.add(number)
         # Increment the count of signals that have traversed this node.
         child.signal_count += 1
-        # If numbering is used, sort and store all numbers associated with the base node.
+        # If numbering is used, store the ranks of all numbers associated with the base node.
         if use_number and current_base:
-            child.all_numbers = sorted(current_base.numbers)
+            child.all_numbers = current_base.get_number_indexes()
         return child
 
 # Build Hierarchy Tree Function --------------------------------------------------------------------
@@ -91,35 +99,51 @@ def _build_hierarchy_tree(signals, base_tree=None):
 
 # Determine Name Usage Function --------------------------------------------------------------------
 
-def _determine_name_usage(node, node_name=""):
+def _determine_name_usage(node, node_name="", names=None):
     """
     Recursively determines if node names should be used to ensure unique signal naming.
+
+    Names (tuples of node names) are interned in ``names`` as (head, tail id) -> id, so that
+    prefixing a name and comparing names are constant time operations. Returns the set of name
+    ids required to uniquely identify the signals below the node.
     """
-    required_names = set()  # This will accumulate all names that ensure unique identification of signals.
+    if names is None:
+        names = {}
 
-    # Recursively collect names from children, identifying if any naming conflicts occur.
+    # Recursively collect names from children.
     child_name_sets = {
-        child_name: _determine_name_usage(child_node, child_name)
+        child_name: _determine_name_usage(child_node, child_name, names)
         for child_name, child_node in node.children.items()
     }
 
-    # Check for naming conflicts between all pairs of children.
-    for (child1_name, names1), (child2_name, names2) in combinations(child_name_sets.items(), 2):
-        if names1 & names2:  # If there's an intersection, we have a naming conflict.
-            node.children[child1_name].use_name = node.children[child2_name].use_name = True
-
-    # Collect names, prepending child's name if necessary.
+    # Check for naming conflicts between children: children sharing a name need their own name.
+    owners = {}
+    for child_name, child_names in child_name_sets.items():
+        for name in child_names:
+            owner = owners.setdefault(name, child_name)
+            if owner != child_name:
+                node.children[owner].use_name = node.children[child_name].use_name = True
+
+    # Collect names, prepending child's name if necessary. The largest set of non-prepended names
+    # is reused to keep the merge cost proportional to the number of names moved.
+    required_names = None
     for child_name, child_names in child_name_sets.items():
         if node.children[child_name].use_name:
             # Prepend the child's name to ensure uniqueness.
-            required_names.update((child_name,) + name for name in child_names)
+            child_names = {names.setdefault((child_name, name), len(names)) for name in child_names}
+        if required_names is None:
+            required_names = child_names
         else:
+            if len(child_names) > len(required_names):
+                required_names, child_names = child_names, required_names
             required_names.update(child_names)
+    if required_names is None:
+        required_names = set()
 
     # If this node has its own signals, ensure its name is used.
     if node.signal_count > sum(child.signal_count for child in node.children.values()):
         node.use_name = True
-        required_names.add((node_name,))  # Add this node's name only if it has additional signals.
+        required_names.add(names.setdefault((node_name, -1), len(names)))  # Add this node's name only if it has additional signals.
 
     return required_names
 
@@ -153,7 +177,7 @@ def _build_signal_name_dict_from_tree(tree, signals):
             # If the tree node's name is to be used, add it to the elements.
             if treepos.use_name:
                 # Create the name part, including the number if necessary.
-                element_name = step_name if not use_number else f"{step_name}{treepos.all_numbers.index(step_n)}"
+                element_name = step_name if not use_number else f"{step_name}{treepos.all_numbers[step_n]}"
                 elements.append(element_name)
 
         # Combine the name parts into the signal's full name.
@@ -13,9 +13,13 @@
 # This file is Copyright (c) 2018 Robin Ole Heinemann <robin.ole.heinemann@t-online.de>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import os
 import time
 import datetime
+import itertools
+import functools
 import collections
+import multiprocessing
 
 from enum import IntEnum
 from operator import itemgetter
@@ -31,8 +35,10 @@ from litex.gen import LiteXContext
 from litex.gen.fhdl.expression import _generate_expression, _generate_signal
 from litex.gen.fhdl.namer      import build_signal_namespace
 from litex.gen.fhdl.hierarchy  import LiteXHierarchyExplorer
+from litex.gen.fhdl.cache      import VerilogCache
 
-from litex.build.tools import get_litex_git_revision
+from litex.build.tools    import get_litex_git_revision, write_to_file
+from litex.build.profiler import get_profiler, get_fragment_counts, profile_count, profile_phase
 
 # ------------------------------------------------------------------------------------------------ #
 #                                     BANNER/TRAILER/SEPARATORS                                    #
@@ -339,44 +345,45 @@ def _generate_signals(f, ios, name, ns, attr_translate, regs_init):
 #                                  COMBINATORIAL LOGIC                                             #
 # ------------------------------------------------------------------------------------------------ #
 
+def _list_combinatorial_blocks_sim(f):
+    target_stmt_map = collections.defaultdict(list)
+    for statement in flat_iteration(f.comb):
+        targets = list_targets(statement)
+        for t in targets:
+            target_stmt_map[t].append(statement)
+    return list(target_stmt_map.items())
+
+def _generate_combinatorial_block_sim(ns, t, stmts):
+    assert isinstance(t, Signal)
+    if _use_wire(stmts):
+        return "assign " + _generate_node(ns, AssignType.BLOCKING, 0, stmts[0])
+    r = "always @(*) begin\n"
+    r += _tab + ns.get_name(t) + " <= " + _generate_expression(ns, t.reset)[0] + ";\n"
+    r += _generate_node(ns, AssignType.NON_BLOCKING, 1, stmts, t)
+    r += "end\n"
+    return r
+
 def _generate_combinatorial_logic_sim(f, ns):
     r = ""
-    if f.comb:
-        target_stmt_map = collections.defaultdict(list)
-
-        for statement in flat_iteration(f.comb):
-            targets = list_targets(statement)
-            for t in targets:
-                target_stmt_map[t].append(statement)
-
-        groups = group_by_targets(f.comb)
-
-        for n, (t, stmts) in enumerate(target_stmt_map.items()):
-            assert isinstance(t, Signal)
-            if _use_wire(stmts):
-                r += "assign " + _generate_node(ns, AssignType.BLOCKING, 0, stmts[0])
-            else:
-                r += "always @(*) begin\n"
-                r += _tab + ns.get_name(t) + " <= " + _generate_expression(ns, t.reset)[0] + ";\n"
-                r += _generate_node(ns, AssignType.NON_BLOCKING, 1, stmts, t)
-                r += "end\n"
+    for t, stmts in _list_combinatorial_blocks_sim(f):
+        r += _generate_combinatorial_block_sim(ns, t, stmts)
     r += "\n"
     return r
 
+def _generate_combinatorial_block_synth(ns, targets, stmts):
+    if _use_wire(stmts):
+        return "assign " + _generate_node(ns, AssignType.BLOCKING, 0, stmts[0])
+    r = "always @(*) begin\n"
+    for t in sorted(targets, key=lambda x: ns.get_name(x)):
+        r += _tab + ns.get_name(t) + " <= " + _generate_expression(ns, t.reset)[0] + ";\n"
+    r += _generate_node(ns, AssignType.NON_BLOCKING, 1, stmts)
+    r += "end\n"
+    return r
+
 def _generate_combinatorial_logic_synth(f, ns):
     r = ""
-    if f.comb:
-        groups = group_by_targets(f.comb)
-
-        for n, g in enumerate(groups):
-            if _use_wire(g[1]):
-                r += "assign " + _generate_node(ns, AssignType.BLOCKING, 0, g[1][0])
-            else:
-                r += "always @(*) begin\n"
-                for t in sorted(g[0], key=lambda x: ns.get_name(x)):
-                    r += _tab + ns.get_name(t) + " <= " + _generate_expression(ns, t.reset)[0] + ";\n"
-                r += _generate_node(ns, AssignType.NON_BLOCKING, 1, g[1])
-                r += "end\n"
+    for targets, stmts in group_by_targets(f.comb):
+        r += _generate_combinatorial_block_synth(ns, targets, stmts)
     r += "\n"
     return r
 
@@ -384,36 +391,109 @@ def _generate_combinatorial_logic_synth(f, ns):
 #                                    SYNCHRONOUS LOGIC                                             #
 # ------------------------------------------------------------------------------------------------ #
 
+def _generate_synchronous_block(f, ns, k, v):
+    r = "always @(posedge " + ns.get_name(f.clock_domains[k].clk) + ") begin\n"
+    r += _generate_node(ns, AssignType.SIGNAL, 1, v)
+    r += "end\n\n"
+    return r
+
 def _generate_synchronous_logic(f, ns):
     r = ""
     for k, v in sorted(f.sync.items(), key=itemgetter(0)):
-        r += "always @(posedge " + ns.get_name(f.clock_domains[k].clk) + ") begin\n"
-        r += _generate_node(ns, AssignType.SIGNAL, 1, v)
-        r += "end\n\n"
+        r += _generate_synchronous_block(f, ns, k, v)
     return r
 
 # ------------------------------------------------------------------------------------------------ #
 #                                      SPECIALS                                                    #
 # ------------------------------------------------------------------------------------------------ #
 
+def _generate_special(name, overrides, special, namespace, add_data_file, attr_translate):
+    r = ""
+    if hasattr(special, "attr"):
+        r += _generate_attribute(special.attr, attr_translate)
+    # Replace Migen Memory's emit_verilog with LiteX's implementation.
+    if isinstance(special, Memory):
+        from litex.gen.fhdl.memory import _memory_generate_verilog
+        pr = _memory_generate_verilog(name, special, namespace, add_data_file)
+    # Replace Migen Instance's emit_verilog with LiteX's implementation.
+    elif isinstance(special, Instance):
+        from litex.gen.fhdl.instance import _instance_generate_verilog
+        pr = _instance_generate_verilog(special, namespace, add_data_file)
+    else:
+        pr = call_special_classmethod(overrides, special, "emit_verilog", namespace, add_data_file)
+    if pr is None:
+        raise NotImplementedError("Special " + str(special) + " failed to implement emit_verilog")
+    r += pr
+    return r
+
 def _generate_specials(name, overrides, specials, namespace, add_data_file, attr_translate):
     r = ""
     for special in sorted(specials, key=lambda x: x.duid):
-        if hasattr(special, "attr"):
-            r += _generate_attribute(special.attr, attr_translate)
-        # Replace Migen Memory's emit_verilog with LiteX's implementation.
-        if isinstance(special, Memory):
-            from litex.gen.fhdl.memory import _memory_generate_verilog
-            pr = _memory_generate_verilog(name, special, namespace, add_data_file)
-        # Replace Migen Instance's emit_verilog with LiteX's implementation.
-        elif isinstance(special, Instance):
-            from litex.gen.fhdl.instance import _instance_generate_verilog
-            pr = _instance_generate_verilog(special, namespace, add_data_file)
+        r += _generate_special(name, overrides, special, namespace, add_data_file, attr_translate)
+    return r
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    PARALLEL EMISSION                                             #
+# ------------------------------------------------------------------------------------------------ #
+
+# Minimum number of blocks for the emission to be spread over worker processes (below, the cost
+# of starting the pool exceeds the gain).
+_parallel_min_blocks = 2048
+
+def _logic_block(generate, *args):
+    # Block not producing data files.
+    return lambda add_data_file: generate(*args)
+
+# Blocks being emitted, inherited by the forked workers (avoids pickling the design).
+_emission_blocks = None
+
+def _generate_blocks_range(block_range):
+    r = []
+    for n in range(*block_range):
+        data_files = []
+        def add_data_file(filename_base, content):
+            data_files.append((filename_base, content))
+            return filename_base
+        r.append((_emission_blocks[n](add_data_file), data_files))
+    return r
+
+def _generate_blocks(blocks, conv_output, jobs):
+    """Emit blocks of Verilog, in parallel when possible.
+
+    Each block is a callable taking an ``add_data_file`` function and returning its Verilog. Blocks
+    must only use names already resolved in the namespace: they are emitted in forked workers and
+    names resolved there would not be seen by the other blocks. Outputs are returned in order.
+    """
+    parallel = (
+        jobs > 1 and
+        len(blocks) >= _parallel_min_blocks and
+        "fork" in multiprocessing.get_all_start_methods() and
+        not multiprocessing.current_process().daemon
+    )
+    if not parallel:
+        return [block(conv_output.add_data_file) for block in blocks]
+
+    global _emission_blocks
+    _emission_blocks = blocks
+    try:
+        size   = -(-len(blocks)//(4*jobs))
+        ranges = [(n, min(n + size, len(blocks))) for n in range(0, len(blocks), size)]
+        with multiprocessing.get_context("fork").Pool(jobs) as pool:
+            results = pool.map(_generate_blocks_range, ranges)
+    finally:
+        _emission_blocks = None
+
+    r = []
+    for n, (verilog, data_files) in enumerate(itertools.chain.from_iterable(results)):
+        filenames = [filename for filename, _ in data_files]
+        if (len(set(filenames)) != len(filenames) or
+            any(filename in conv_output.data_files for filename in filenames)):
+            # Data file names have to be uniquified, emit the block again with the real outputs.
+            verilog = blocks[n](conv_output.add_data_file)
         else:
-            pr = call_special_classmethod(overrides, special, "emit_verilog", namespace, add_data_file)
-        if pr is None:
-            raise NotImplementedError("Special " + str(special) + " failed to implement emit_verilog")
-        r += pr
+            for filename, content in data_files:
+                conv_output.add_data_file(filename, content)
+        r.append(verilog)
     return r
 
 # ------------------------------------------------------------------------------------------------ #
@@ -493,6 +573,13 @@ class DummyAttrTranslate(dict):
     def __getitem__(self, k):
         return (k, "true")
 
+class LiteXConvOutput(ConvOutput):
+    def write(self, main_filename):
+        # Only write files whose content changed, to preserve mtimes of unchanged outputs.
+        write_to_file(main_filename, self.main_source)
+        for filename, content in self.data_files.items():
+            write_to_file(filename, content)
+
 def convert(f, ios=set(), name="top", platform=None,
     # Verilog parameters.
     special_overrides = dict(),
@@ -502,50 +589,55 @@ def convert(f, ios=set(), name="top", platform=None,
     # Sim parameters.
     time_unit      = "1ns",
     time_precision = "1ps",
+    # Cache parameters.
+    cache          = None,
+    # Emission parameters.
+    jobs           = None,
     ):
 
     # Build Logic.
     # ------------
 
     # Create ConvOutput.
-    r = ConvOutput()
+    r = LiteXConvOutput()
 
     # Convert to FHDL's fragments is not already done.
     if not isinstance(f, _Fragment):
         f = f.get_fragment()
 
-    # Verify/Create Clock Domains.
-    for cd_name in sorted(list_clock_domains(f)):
-        # Try to get Clock Domain.
-        try:
-            f.clock_domains[cd_name]
-        # If not found, raise Error.
-        except:
-            msg = f"""Unresolved clock domain {cd_name}, availables:\n"""
-            for f in f.clock_domains:
-                msg += f"- {f.name}\n"
-            raise Exception(msg)
+    with profile_phase("lowering"):
+        # Verify/Create Clock Domains.
+        for cd_name in sorted(list_clock_domains(f)):
+            # Try to get Clock Domain.
+            try:
+                f.clock_domains[cd_name]
+            # If not found, raise Error.
+            except:
+                msg = f"""Unresolved clock domain {cd_name}, availables:\n"""
+                for f in f.clock_domains:
+                    msg += f"- {f.name}\n"
+                raise Exception(msg)
 
-    # Lower complex slices.
-    f = lower_complex_slices(f)
+        # Lower complex slices.
+        f = lower_complex_slices(f)
 
-    # Insert resets.
-    insert_resets(f)
+        # Insert resets.
+        insert_resets(f)
 
-    # Lower basics.
-    f = lower_basics(f)
+        # Lower basics.
+        f = lower_basics(f)
 
-    # Lower specials.
-    if platform is not None:
-        for s in f.specials:
-            s.platform = platform
-    f, lowered_specials = lower_specials(special_overrides, f)
+        # Lower specials.
+        if platform is not None:
+            for s in f.specials:
+                s.platform = platform
+        f, lowered_specials = lower_specials(special_overrides, f)
 
-    # Lower complex slices (for complex slices included in specials).
-    f = lower_complex_slices(f)
+        # Lower complex slices (for complex slices included in specials).
+        f = lower_complex_slices(f)
 
-    # Lower basics (for basics included in specials).
-    f = lower_basics(f)
+        # Lower basics (for basics included in specials).
+        f = lower_basics(f)
 
     # IOs collection (when not specified).
     if len(ios) == 0:
@@ -559,75 +651,143 @@ def convert(f, ios=set(), name="top", platform=None,
             if io_name:
                 io.name_override = io_name
 
+    # Count Signals/Statements/Memories/Instances when profiling.
+    if get_profiler() is not None:
+        profile_count(**get_fragment_counts(f,
+            signals = list_signals(f) | list_special_ios(f, ins=True, outs=True, inouts=True) | ios
+        ))
+
+    # Lookup Verilog Cache.
+    # ---------------------
+    hierarchy = _generate_hierarchy(top=LiteXContext.top)
+    if cache is not None:
+        with profile_phase("cache_lookup"):
+            cache  = VerilogCache(cache)
+            cached = cache.lookup(f, ios,
+                name,
+                getattr(platform, "device", "Unknown"),
+                get_litex_git_revision(),
+                sorted((repr(k), repr(v)) for k, v in attr_translate.items()),
+                sorted((repr(k), repr(v)) for k, v in special_overrides.items()),
+                regular_comb,
+                regs_init,
+                time_unit,
+                time_precision,
+                sorted(hierarchy.split("\n")), # Order of specials in the hierarchy is not stable.
+            )
+        if cached is not None:
+            head, tail, ns = cached
+            ns.clock_domains = f.clock_domains
+            # Specials are always emitted (emit_verilog can have side effects, ie data files).
+            specials = sorted(f.specials - lowered_specials, key=lambda x: x.duid)
+            with profile_phase("printing"):
+                verilog = [head]
+                for special in specials:
+                    verilog.append(_generate_special(name, special_overrides, special, ns,
+                        r.add_data_file, attr_translate=attr_translate))
+                verilog.append(tail)
+            r.set_main_source("".join(verilog))
+            r.ns = ns
+            return r
+
     # Build Signal Namespace.
     # ----------------------
-    ns = build_signal_namespace(
-        signals = (
-            list_signals(f) |
-            list_special_ios(f, ins=True, outs=True, inouts=True) |
-            ios
-        ),
-        reserved_keywords = _ieee_1800_2017_verilog_reserved_keywords
-    )
-    ns.clock_domains = f.clock_domains
+    with profile_phase("namer"):
+        ns = build_signal_namespace(
+            signals = (
+                list_signals(f) |
+                list_special_ios(f, ins=True, outs=True, inouts=True) |
+                ios
+            ),
+            reserved_keywords = _ieee_1800_2017_verilog_reserved_keywords
+        )
+        ns.clock_domains = f.clock_domains
 
     # Build Verilog.
     # --------------
-    verilog = ""
-
-    # Banner.
-    verilog += _generate_banner(
-        filename = name,
-        device   = getattr(platform, "device", "Unknown")
-    )
-
-    # Timescale.
-    verilog += _generate_timescale(
-        time_unit      = time_unit,
-        time_precision = time_precision
-    )
-
-    # Module Definition.
-    verilog += _generate_separator("Module")
-    verilog += _generate_module(f, ios, name, ns, attr_translate)
-
-    # Module Hierarchy.
-    verilog += _generate_separator("Hierarchy")
-    verilog += _generate_hierarchy(top=LiteXContext.top)
-
-    # Module Signals.
-    verilog += _generate_separator("Signals")
-    verilog += _generate_signals(f, ios, name, ns, attr_translate, regs_init)
-
-    # Combinatorial Logic.
-    verilog += _generate_separator("Combinatorial Logic")
-    if regular_comb:
-        verilog += _generate_combinatorial_logic_synth(f, ns)
-    else:
-        verilog += _generate_combinatorial_logic_sim(f, ns)
-
-    # Synchronous Logic.
-    verilog += _generate_separator("Synchronous Logic")
-    verilog += _generate_synchronous_logic(f, ns)
-
-    # Specials
-    verilog += _generate_separator("Specialized Logic")
-    verilog += _generate_specials(
-        name           = name,
-        overrides      = special_overrides,
-        specials       = f.specials - lowered_specials,
-        namespace      = ns,
-        add_data_file  = r.add_data_file,
-        attr_translate = attr_translate
-    )
-
-    # Module End.
-    verilog += "endmodule\n"
-
-    # Trailer.
-    verilog += _generate_trailer()
-
-    r.set_main_source(verilog)
-    r.ns = ns
+    with profile_phase("printing"):
+        verilog = []
+
+        # Banner.
+        verilog.append(_generate_banner(
+            filename = name,
+            device   = getattr(platform, "device", "Unknown")
+        ))
+
+        # Timescale.
+        verilog.append(_generate_timescale(
+            time_unit      = time_unit,
+            time_precision = time_precision
+        ))
+
+        # Module Definition.
+        verilog.append(_generate_separator("Module"))
+        verilog.append(_generate_module(f, ios, name, ns, attr_translate))
+
+        # Module Hierarchy.
+        verilog.append(_generate_separator("Hierarchy"))
+        verilog.append(hierarchy)
+
+        # Module Signals.
+        verilog.append(_generate_separator("Signals"))
+        verilog.append(_generate_signals(f, ios, name, ns, attr_translate, regs_init))
+
+        # Resolve remaining names (Clocks and Specials), in emission order, so that the logic blocks
+        # can be emitted independently.
+        sync     = sorted(f.sync.items(), key=itemgetter(0))
+        specials = sorted(f.specials - lowered_specials, key=lambda x: x.duid)
+        for k, v in sync:
+            ns.get_name(f.clock_domains[k].clk)
+        for special in specials:
+            if isinstance(special, (Instance, Memory)):
+                ns.get_name(special)
+        if cache is not None:
+            cache.record_namespace(ns)
+
+        # Logic Blocks.
+        blocks = []
+        if regular_comb:
+            for targets, stmts in group_by_targets(f.comb):
+                blocks.append(_logic_block(_generate_combinatorial_block_synth, ns, targets, stmts))
+        else:
+            for t, stmts in _list_combinatorial_blocks_sim(f):
+                blocks.append(_logic_block(_generate_combinatorial_block_sim, ns, t, stmts))
+        ncomb = len(blocks)
+        for k, v in sync:
+            blocks.append(_logic_block(_generate_synchronous_block, f, ns, k, v))
+        nsync = len(blocks) - ncomb
+        for special in specials:
+            blocks.append(functools.partial(_generate_special,
+                name, special_overrides, special, ns, attr_translate=attr_translate))
+        blocks = _generate_blocks(blocks, r, os.cpu_count() if jobs is None else jobs)
+
+        # Combinatorial Logic.
+        verilog.append(_generate_separator("Combinatorial Logic"))
+        verilog += blocks[:ncomb]
+        verilog.append("\n")
+
+        # Synchronous Logic.
+        verilog.append(_generate_separator("Synchronous Logic"))
+        verilog += blocks[ncomb:ncomb + nsync]
+
+        # Specials
+        verilog.append(_generate_separator("Specialized Logic"))
+        head = "".join(verilog)
+        verilog = blocks[ncomb + nsync:]
+
+        # Module End.
+        tail = "endmodule\n"
+
+        # Trailer.
+        tail += _generate_trailer()
+
+        r.set_main_source(head + "".join(verilog) + tail)
+        r.ns = ns
+
+    # Update Verilog Cache.
+    # ---------------------
+    if cache is not None:
+        with profile_phase("cache_store"):
+            cache.store(ios, head, tail)
 
     return r
@@ -0,0 +1,344 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import collections
+import inspect
+
+import numpy as np
+
+from migen.fhdl.structure import *
+from migen.fhdl.structure import _Value, _Statement, _Operator, _Slice, _ArrayProxy, _Assign
+from migen.fhdl.bitcontainer import value_bits_sign
+from migen.fhdl.specials import _MemoryLocation
+
+from litex.gen.sim.core import Evaluator, Simulator, str2op, _truncate
+
+# Values wider than this are held in Python int object arrays instead of int64 arrays.
+_MAX_NATIVE_BITS = 62
+
+
+def _dtype(nbits):
+    return np.int64 if nbits <= _MAX_NATIVE_BITS else object
+
+
+def _wide(x):
+    if isinstance(x, np.ndarray) and x.dtype != object:
+        return x.astype(object)
+    return x
+
+
+def _narrow(x):
+    if isinstance(x, np.ndarray) and x.dtype != np.int64:
+        return x.astype(np.int64)
+    return x
+
+
+class BatchEvaluator(Evaluator):
+    """Evaluator for N independent copies (lanes) of a fragment.
+
+    Signal values are NumPy arrays with one element per lane and statements
+    are executed for all lanes at once: control flow is turned into lane
+    masks, so that each lane only sees the assignments of the branches it
+    takes.
+    """
+    def __init__(self, clock_domains, replaced_memories, lanes):
+        Evaluator.__init__(self, clock_domains, replaced_memories)
+        self.lanes = lanes
+        self.all_lanes = np.ones(lanes, dtype=bool)
+
+    def _vector(self, value, nbits):
+        dtype = _dtype(nbits)
+        if isinstance(value, np.ndarray):
+            return value.astype(dtype)
+        return np.full(self.lanes, int(value), dtype=dtype)
+
+    def _current(self, signal, postcommit=False):
+        if postcommit:
+            try:
+                return self.modifications[signal]
+            except KeyError:
+                pass
+        try:
+            return self.signal_values[signal]
+        except KeyError:
+            return self._vector(signal.reset.value, signal.nbits)
+
+    def commit(self):
+        r = set()
+        for k, v in self.modifications.items():
+            if k not in self.signal_values or (self.signal_values[k] != v).any():
+                self.signal_values[k] = v
+                r.add(k)
+        self.modifications.clear()
+        return r
+
+    def lane_value(self, value, lane):
+        if isinstance(value, np.ndarray):
+            value = value[lane]
+        return int(value)
+
+    def eval(self, node, postcommit=False):
+        if isinstance(node, Constant):
+            return node.value
+        elif isinstance(node, Signal):
+            return self._current(node, postcommit)
+        elif isinstance(node, _Operator):
+            operands = [self.eval(o, postcommit) for o in node.operands]
+            if value_bits_sign(node)[0] > _MAX_NATIVE_BITS:
+                operands = [_wide(o) for o in operands]
+            if node.op == "-":
+                if len(operands) == 1:
+                    return -operands[0]
+                else:
+                    return operands[0] - operands[1]
+            elif node.op == "m":
+                sel, a, b = operands
+                if isinstance(sel, np.ndarray):
+                    return np.where(sel != 0, a, b)
+                return a if sel else b
+            r = str2op[node.op](*operands)
+            if isinstance(r, np.ndarray) and r.dtype != np.int64:
+                if r.dtype == bool or value_bits_sign(node)[0] <= _MAX_NATIVE_BITS:
+                    # comparisons must yield integers, as ~ and arithmetic are applied to them
+                    r = r.astype(np.int64)
+            return r
+        elif isinstance(node, _Slice):
+            v = self.eval(node.value, postcommit)
+            r = (v >> node.start) & (2**(node.stop - node.start) - 1)
+            if node.stop - node.start <= _MAX_NATIVE_BITS:
+                r = _narrow(r)
+            return r
+        elif isinstance(node, Cat):
+            wide = len(node) > _MAX_NATIVE_BITS
+            shift = 0
+            r = 0
+            for element in node.l:
+                nbits = len(element)
+                v = self.eval(element, postcommit)
+                if wide:
+                    v = _wide(v)
+                r |= (v & (2**nbits - 1)) << shift
+                shift += nbits
+            return r
+        elif isinstance(node, Replicate):
+            nbits = len(node.v)
+            v = self.eval(node.v, postcommit) & (2**nbits - 1)
+            if len(node) > _MAX_NATIVE_BITS:
+                v = _wide(v)
+            return v*sum(1 << i*nbits for i in range(node.n))
+        elif isinstance(node, _ArrayProxy):
+            return self._select(node.choices, self.eval(node.key, postcommit),
+                lambda choice: self.eval(choice, postcommit))
+        elif isinstance(node, _MemoryLocation):
+            array = self.replaced_memories[node.memory]
+            return self._select(array, self.eval(node.index, postcommit),
+                lambda choice: self.eval(choice, postcommit), clamp=False)
+        elif isinstance(node, ClockSignal):
+            return self.eval(self.clock_domains[node.cd].clk, postcommit)
+        elif isinstance(node, ResetSignal):
+            rst = self.clock_domains[node.cd].rst
+            if rst is None:
+                if node.allow_reset_less:
+                    return 0
+                else:
+                    raise ValueError("Attempted to get reset signal of resetless"
+                                     " domain '{}'".format(node.cd))
+            else:
+                return self.eval(rst, postcommit)
+        else:
+            raise NotImplementedError(node)
+
+    def _select(self, choices, key, evaluate, clamp=True):
+        # Only the choices selected by at least one lane are evaluated.
+        if clamp:
+            key = np.minimum(len(choices) - 1, key)
+        if not isinstance(key, np.ndarray):
+            return evaluate(choices[key])
+        indices = np.unique(key)
+        if len(indices) == 1:
+            return evaluate(choices[indices[0]])
+        wide = any(len(choices[i]) > _MAX_NATIVE_BITS for i in indices)
+        r = np.zeros(self.lanes, dtype=object if wide else np.int64)
+        for i in indices:
+            v = evaluate(choices[i])
+            r = np.where(key == i, _wide(v) if wide else v, r)
+        return r
+
+    def assign(self, node, value, mask=None):
+        if isinstance(node, Signal):
+            assert not node.variable
+            value = value & (2**node.nbits - 1)
+            if node.signed:
+                sign = 2**(node.nbits - 1)
+                if isinstance(value, np.ndarray):
+                    value = np.where(value & sign, value - 2**node.nbits, value)
+                elif value & sign:
+                    value -= 2**node.nbits
+            value = self._vector(value, node.nbits)
+            if mask is not None and not mask.all():
+                value = np.where(mask, value, self._current(node, postcommit=True))
+            self.modifications[node] = value
+        elif isinstance(node, Cat):
+            for element in node.l:
+                nbits = len(element)
+                self.assign(element, value & (2**nbits - 1), mask)
+                value = value >> nbits
+        elif isinstance(node, _Slice):
+            full_value = self.eval(node.value, True)
+            if node.stop > _MAX_NATIVE_BITS:
+                full_value, value = _wide(full_value), _wide(value)
+            # clear bits assigned to by the slice
+            full_value = full_value & ~((2**node.stop - 1) - (2**node.start - 1))
+            # set them to the new value
+            value = value & (2**(node.stop - node.start) - 1)
+            full_value = full_value | (value << node.start)
+            self.assign(node.value, full_value, mask)
+        elif isinstance(node, _ArrayProxy):
+            key = np.minimum(len(node.choices) - 1, self.eval(node.key))
+            self._assign_selected(node.choices, key, value, mask)
+        elif isinstance(node, _MemoryLocation):
+            array = self.replaced_memories[node.memory]
+            self._assign_selected(array, self.eval(node.index), value, mask)
+        else:
+            raise NotImplementedError(node)
+
+    def assign_lane(self, node, value, lane):
+        # Single lane assignment from a generator, avoiding full width masking.
+        if not isinstance(node, Signal):
+            mask = np.zeros(self.lanes, dtype=bool)
+            mask[lane] = True
+            self.assign(node, value, mask)
+            return
+        assert not node.variable
+        value = _truncate(self.lane_value(value, lane), node.nbits, node.signed)
+        try:
+            # pending modifications are never shared and can be updated in place
+            current = self.modifications[node]
+        except KeyError:
+            current = self._current(node).copy()
+            self.modifications[node] = current
+        current[lane] = value
+
+    def _assign_selected(self, choices, key, value, mask):
+        if not isinstance(key, np.ndarray):
+            self.assign(choices[key], value, mask)
+            return
+        if mask is None:
+            mask = self.all_lanes
+        for i in np.unique(key[mask]):
+            self.assign(choices[i], value, mask & (key == i))
+
+    def _condition(self, value, nbits):
+        value = value & (2**nbits - 1)
+        if isinstance(value, np.ndarray):
+            return value != 0
+        return np.full(self.lanes, bool(value))
+
+    def execute(self, statements, mask=None):
+        if mask is None:
+            mask = self.all_lanes
+        for s in statements:
+            if isinstance(s, _Assign):
+                self.assign(s.l, self.eval(s.r), mask)
+            elif isinstance(s, If):
+                cond = self._condition(self.eval(s.cond), len(s.cond))
+                t = mask & cond
+                if t.any():
+                    self.execute(s.t, t)
+                f = mask & ~cond
+                if f.any():
+                    self.execute(s.f, f)
+            elif isinstance(s, Case):
+                nbits, signed = value_bits_sign(s.test)
+                test = self.eval(s.test) & (2**nbits - 1)
+                if signed:
+                    test = np.where(test & 2**(nbits - 1), test - 2**nbits, test)
+                remaining = mask
+                for k, v in s.cases.items():
+                    if isinstance(k, Constant):
+                        match = remaining & (test == k.value)
+                        if match.any():
+                            self.execute(v, match)
+                            remaining = remaining & ~match
+                if remaining.any() and "default" in s.cases:
+                    self.execute(s.cases["default"], remaining)
+            elif isinstance(s, collections.abc.Iterable):
+                self.execute(s, mask)
+            elif isinstance(s, Display):
+                for lane in np.flatnonzero(mask):
+                    args = []
+                    for arg in s.args:
+                        assert isinstance(arg, _Value)
+                        args.append(self.lane_value(self._current(arg), lane))
+                    print("[{}] ".format(lane) + s.s %(*args,))
+            else:
+                raise NotImplementedError
+
+
+class BatchSimulator(Simulator):
+    """Simulates N independent copies of a fragment in lockstep.
+
+    ``generators`` is a list with one entry per copy, each entry accepting
+    the same forms as the ``generators`` argument of ``Simulator``. The
+    generators of a copy only see and drive the signals of that copy, using
+    the usual ``yield sig.eq(...)``/``(yield sig)`` protocol.
+    """
+    def __init__(self, fragment_or_module, generators, clocks={"sys": 10},
+                 special_overrides={}):
+        self.lanes = len(generators)
+        if not self.lanes:
+            raise ValueError("At least one set of generators is required")
+        Simulator.__init__(self, fragment_or_module, {}, clocks,
+                           special_overrides=special_overrides)
+
+        self.lane = None
+        for lane, lane_generators in enumerate(generators):
+            if not isinstance(lane_generators, dict):
+                lane_generators = {"sys": lane_generators}
+            for k, v in lane_generators.items():
+                if (isinstance(v, collections.abc.Iterable)
+                        and not inspect.isgenerator(v)):
+                    v = list(v)
+                else:
+                    v = [v]
+                self.generators.setdefault(k, []).extend(
+                    self._bind_lane(generator, lane) for generator in v)
+
+    def _create_evaluator(self, replaced_memories, compiled):
+        return BatchEvaluator(self.fragment.clock_domains, replaced_memories,
+                              self.lanes)
+
+    def _bind_lane(self, generator, lane):
+        # Forwards the requests of a generator, recording the lane they
+        # must be evaluated for.
+        reply = None
+        while True:
+            try:
+                request = generator.send(reply)
+            except StopIteration:
+                return
+            self.lane = lane
+            reply = yield request
+
+    def _evalexec_nested_lists(self, x):
+        if isinstance(x, list):
+            return [self._evalexec_nested_lists(e) for e in x]
+        elif isinstance(x, _Value):
+            return self.evaluator.lane_value(self.evaluator.eval(x), self.lane)
+        elif isinstance(x, _Assign):
+            self.evaluator.assign_lane(x.l, self.evaluator.eval(x.r), self.lane)
+            return None
+        elif isinstance(x, _Statement):
+            mask = np.zeros(self.lanes, dtype=bool)
+            mask[self.lane] = True
+            self.evaluator.execute([x], mask)
+            return None
+        else:
+            raise ValueError
+
+
+def run_batch_simulation(*args, **kwargs):
+    with BatchSimulator(*args, **kwargs) as s:
+        s.run()
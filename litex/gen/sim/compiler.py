@@ -0,0 +1,210 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import collections
+
+from migen.fhdl.structure import *
+from migen.fhdl.structure import _Operator, _Slice, _ArrayProxy, _Assign
+from migen.fhdl.bitcontainer import value_bits_sign
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class StatementCompiler:
+    """Translates a list of FHDL statements into the source of a Python function.
+
+    The generated function takes the slot value list ``v`` and the pending
+    modifications dictionary ``m`` and has the same semantics as
+    ``Evaluator.execute``. Statements that have no direct translation are
+    handed back to the interpreter through the ``_exec`` helper.
+    """
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+        self.lines     = []
+        self.namespace = {"_exec": evaluator.interpret}
+        self.ntemps    = 0
+
+    # Helpers --------------------------------------------------------------------------------------
+
+    def _temp(self):
+        self.ntemps += 1
+        return "t{}".format(self.ntemps)
+
+    def _const(self, obj):
+        name = "k{}".format(len(self.namespace))
+        self.namespace[name] = obj
+        return name
+
+    def _emit(self, level, line):
+        self.lines.append("    "*level + line)
+
+    # Expressions ----------------------------------------------------------------------------------
+
+    def expr(self, node, postcommit=False):
+        if isinstance(node, Constant):
+            return "({})".format(node.value)
+        elif isinstance(node, Signal):
+            slot = self.evaluator.slot(node)
+            if postcommit:
+                return "m.get({0}, v[{0}])".format(slot)
+            return "v[{}]".format(slot)
+        elif isinstance(node, _Operator):
+            operands = [self.expr(o, postcommit) for o in node.operands]
+            if node.op == "-" and len(operands) == 1:
+                return "(-{})".format(*operands)
+            elif node.op == "~":
+                return "(~{})".format(*operands)
+            elif node.op == "m":
+                return "({1} if {0} else {2})".format(*operands)
+            op = {">>>": ">>", "<<<": "<<"}.get(node.op, node.op)
+            if op not in {"+", "-", "*", ">>", "<<", "&", "^", "|",
+                          "<", "<=", "==", "!=", ">", ">="}:
+                raise _Unsupported
+            return "({} {} {})".format(operands[0], op, operands[1])
+        elif isinstance(node, _Slice):
+            mask = 2**(node.stop - node.start) - 1
+            return "(({} >> {}) & {})".format(
+                self.expr(node.value, postcommit), node.start, mask)
+        elif isinstance(node, Cat):
+            shift = 0
+            terms = []
+            for element in node.l:
+                nbits = len(element)
+                term = "({} & {})".format(self.expr(element, postcommit), 2**nbits - 1)
+                if shift:
+                    term = "({} << {})".format(term, shift)
+                terms.append(term)
+                shift += nbits
+            if not terms:
+                return "(0)"
+            return "(" + " | ".join(terms) + ")"
+        elif isinstance(node, Replicate):
+            nbits = len(node.v)
+            factor = sum(1 << i*nbits for i in range(node.n))
+            return "(({} & {}) * {})".format(
+                self.expr(node.v, postcommit), 2**nbits - 1, factor)
+        elif isinstance(node, _ArrayProxy):
+            key = "min({}, {})".format(len(node.choices) - 1, self.expr(node.key, postcommit))
+            if all(isinstance(c, Signal) for c in node.choices) and not postcommit:
+                slots = tuple(self.evaluator.slot(c) for c in node.choices)
+                return "v[{}[{}]]".format(self._const(slots), key)
+            choices = "(" + "".join("lambda: {}, ".format(self.expr(c, postcommit))
+                for c in node.choices) + ")"
+            return "{}[{}]()".format(choices, key)
+        elif isinstance(node, ClockSignal):
+            return self.expr(self.evaluator.clock_domains[node.cd].clk, postcommit)
+        elif isinstance(node, ResetSignal):
+            rst = self.evaluator.clock_domains[node.cd].rst
+            if rst is None:
+                if node.allow_reset_less:
+                    return "(0)"
+                raise _Unsupported
+            return self.expr(rst, postcommit)
+        else:
+            raise _Unsupported
+
+    # Assignments ----------------------------------------------------------------------------------
+
+    def _assign_signal(self, level, node, slot, value):
+        if node.variable:
+            raise _Unsupported
+        mask = 2**node.nbits - 1
+        if node.signed:
+            t = self._temp()
+            self._emit(level, "{} = {} & {}".format(t, value, mask))
+            self._emit(level, "m[{}] = {} - {} if {} & {} else {}".format(
+                slot, t, 2**node.nbits, t, 2**(node.nbits - 1), t))
+        else:
+            self._emit(level, "m[{}] = {} & {}".format(slot, value, mask))
+
+    def assign(self, level, node, value):
+        if isinstance(node, Signal):
+            self._assign_signal(level, node, self.evaluator.slot(node), value)
+        elif isinstance(node, Cat):
+            t = self._temp()
+            self._emit(level, "{} = {}".format(t, value))
+            shift = 0
+            for element in node.l:
+                nbits = len(element)
+                self.assign(level, element, "(({} >> {}) & {})".format(t, shift, 2**nbits - 1))
+                shift += nbits
+        elif isinstance(node, _Slice):
+            clear = (2**node.stop - 1) - (2**node.start - 1)
+            t = self._temp()
+            self._emit(level, "{} = ({} & {}) | (({} & {}) << {})".format(t,
+                self.expr(node.value, postcommit=True), ~clear,
+                value, 2**(node.stop - node.start) - 1, node.start))
+            self.assign(level, node.value, t)
+        elif isinstance(node, _ArrayProxy):
+            # Only arrays of identically typed signals, so that truncation does not depend on
+            # the selected choice.
+            if not all(isinstance(c, Signal) for c in node.choices):
+                raise _Unsupported
+            if len({(c.nbits, c.signed) for c in node.choices}) != 1:
+                raise _Unsupported
+            slots = tuple(self.evaluator.slot(c) for c in node.choices)
+            slot  = "{}[min({}, {})]".format(self._const(slots),
+                len(node.choices) - 1, self.expr(node.key))
+            self._assign_signal(level, node.choices[0], slot, value)
+        else:
+            raise _Unsupported
+
+    # Statements -----------------------------------------------------------------------------------
+
+    def statements(self, level, statements):
+        start = len(self.lines)
+        for s in statements:
+            mark = len(self.lines)
+            try:
+                self.statement(level, s)
+            except _Unsupported:
+                del self.lines[mark:]
+                self._emit(level, "_exec([{}])".format(self._const(s)))
+        if len(self.lines) == start:
+            self._emit(level, "pass")
+
+    def statement(self, level, s):
+        if isinstance(s, _Assign):
+            self.assign(level, s.l, self.expr(s.r))
+        elif isinstance(s, If):
+            self._emit(level, "if {} & {}:".format(self.expr(s.cond), 2**len(s.cond) - 1))
+            self.statements(level + 1, s.t)
+            if s.f:
+                self._emit(level, "else:")
+                self.statements(level + 1, s.f)
+        elif isinstance(s, Case):
+            nbits, signed = value_bits_sign(s.test)
+            t = self._temp()
+            self._emit(level, "{} = {} & {}".format(t, self.expr(s.test), 2**nbits - 1))
+            if signed:
+                self._emit(level, "if {} & {}: {} -= {}".format(t, 2**(nbits - 1), t, 2**nbits))
+            keyword = "if"
+            seen = set()
+            for k, v in s.cases.items():
+                if not isinstance(k, Constant) or k.value in seen:
+                    continue
+                seen.add(k.value)
+                self._emit(level, "{} {} == {}:".format(keyword, t, k.value))
+                self.statements(level + 1, v)
+                keyword = "elif"
+            if "default" in s.cases:
+                if keyword == "if":
+                    self.statements(level, s.cases["default"])
+                else:
+                    self._emit(level, "else:")
+                    self.statements(level + 1, s.cases["default"])
+        elif isinstance(s, collections.abc.Iterable):
+            self.statements(level, s)
+        else:
+            raise _Unsupported
+
+    def compile(self, statements):
+        self._emit(0, "def execute(v, m):")
+        self.statements(1, statements)
+        code = compile("\n".join(self.lines), "<litex.gen.sim>", "exec")
+        exec(code, self.namespace)
+        return self.namespace["execute"]
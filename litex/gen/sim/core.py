@@ -9,6 +9,7 @@
 # This file is Copyright (c) 2018 Robin Ole Heinemann <robin.ole.heinemann@t-online.de>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import heapq
 import operator
 import collections
 import inspect
@@ -19,14 +20,17 @@ from migen.fhdl.structure import (_Value, _Statement,
                                   _Operator, _Slice, _ArrayProxy,
                                   _Assign, _Fragment)
 from migen.fhdl.bitcontainer import value_bits_sign
-from migen.fhdl.tools import (list_targets, list_signals,
+from migen.fhdl.tools import (list_targets, list_signals, group_by_targets,
                               insert_resets, lower_specials)
+from migen.fhdl.visit import NodeVisitor
 from migen.fhdl.simplify import MemoryToArray
 from migen.fhdl.specials import _MemoryLocation
 from migen.fhdl.module import Module
 from migen.genlib.resetsync import AsyncResetSynchronizer
 
+from litex.gen.fhdl.namer import build_signal_namespace
 from litex.gen.sim.vcd import VCDWriter, DummyVCDWriter
+from litex.gen.sim.compiler import StatementCompiler
 
 
 class ClockState:
@@ -239,6 +243,90 @@ class Evaluator:
             else:
                 raise NotImplementedError
 
+    def compile(self, statements):
+        return lambda: self.execute(statements)
+
+
+class _SlotView(collections.abc.Mapping):
+    # Read-only view of the slot storage for users of Evaluator.signal_values.
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+
+    def __getitem__(self, signal):
+        return self.evaluator.values[self.evaluator.slots[signal]]
+
+    def __iter__(self):
+        return iter(self.evaluator.slots)
+
+    def __len__(self):
+        return len(self.evaluator.slots)
+
+
+class CompiledEvaluator(Evaluator):
+    """Evaluator holding signal values in a flat list indexed by per-signal slots.
+
+    Statement lists passed to ``compile`` are translated once into Python
+    functions working directly on the slot list. Anything the compiler does
+    not support is executed by the interpreter of ``Evaluator``.
+    """
+    def __init__(self, clock_domains, replaced_memories):
+        Evaluator.__init__(self, clock_domains, replaced_memories)
+        self.slots = dict()
+        self.signals = []
+        self.values = []
+        self.signal_values = _SlotView(self)
+
+    def slot(self, signal):
+        try:
+            return self.slots[signal]
+        except KeyError:
+            slot = len(self.signals)
+            self.slots[signal] = slot
+            self.signals.append(signal)
+            self.values.append(signal.reset.value)
+            return slot
+
+    def commit(self):
+        r = set()
+        values = self.values
+        for slot, v in self.modifications.items():
+            if values[slot] != v:
+                values[slot] = v
+                r.add(self.signals[slot])
+        self.modifications.clear()
+        return r
+
+    def eval(self, node, postcommit=False):
+        if isinstance(node, Signal):
+            slot = self.slot(node)
+            if postcommit:
+                try:
+                    return self.modifications[slot]
+                except KeyError:
+                    pass
+            return self.values[slot]
+        return Evaluator.eval(self, node, postcommit)
+
+    def assign(self, node, value):
+        if isinstance(node, Signal):
+            assert not node.variable
+            self.modifications[self.slot(node)] = _truncate(value,
+                                                            node.nbits, node.signed)
+        else:
+            Evaluator.assign(self, node, value)
+
+    def interpret(self, statements):
+        Evaluator.execute(self, statements)
+
+    def compile(self, statements):
+        try:
+            execute = StatementCompiler(self).compile(statements)
+        except (RecursionError, MemoryError, SyntaxError):
+            # too deeply nested for the Python compiler, keep interpreting
+            return Evaluator.compile(self, statements)
+        values, modifications = self.values, self.modifications
+        return lambda: execute(values, modifications)
+
 
 class DummyAsyncResetSynchronizerImpl(Module):
     def __init__(self, cd, async_reset):
@@ -254,10 +342,155 @@ class DummyAsyncResetSynchronizer:
         return DummyAsyncResetSynchronizerImpl(dr.cd, dr.async_reset)
 
 
+class _SensitivityLister(NodeVisitor):
+    # Lists the signals whose value a statement depends on. Unlike
+    # migen.fhdl.tools.list_inputs, this includes the array indices and
+    # memory addresses of assignment targets, clock/reset signals and
+    # Display arguments.
+    def __init__(self, clock_domains):
+        self.clock_domains = clock_domains
+        self.output_list = set()
+        self.opaque = False
+
+    def visit_Signal(self, node):
+        self.output_list.add(node)
+
+    def visit_ClockSignal(self, node):
+        self.output_list.add(self.clock_domains[node.cd].clk)
+
+    def visit_ResetSignal(self, node):
+        rst = self.clock_domains[node.cd].rst
+        if rst is not None:
+            self.output_list.add(rst)
+
+    def visit_Assign(self, node):
+        self.visit_target(node.l)
+        self.visit(node.r)
+
+    def visit_target(self, node):
+        if isinstance(node, Cat):
+            for element in node.l:
+                self.visit_target(element)
+        elif isinstance(node, _Slice):
+            self.visit_target(node.value)
+        elif isinstance(node, _ArrayProxy):
+            self.visit(node.key)
+            for choice in node.choices:
+                self.visit_target(choice)
+        elif not isinstance(node, Signal):
+            self.visit(node)
+
+    def visit_unknown(self, node):
+        if isinstance(node, Display):
+            for arg in node.args:
+                self.visit(arg)
+        elif isinstance(node, _MemoryLocation):
+            self.visit(node.index)
+            self.opaque = True
+        else:
+            self.opaque = True
+
+
+class CombGraph:
+    """Sensitivity graph of the combinatorial statements of a fragment.
+
+    Statements are grouped by the signals they drive (each group behaving
+    like a Verilog ``always @(*)`` block) and groups are sorted in
+    topological order of their dependencies. Groups whose dependencies
+    can't be determined statically are re-run on every propagation.
+
+    Attributes:
+        groups   (list): Statement list of each group, in topological order.
+        readers  (dict): Signal -> indices of the groups reading it.
+        drivers  (dict): Signal -> index of the group driving it.
+        always   (list): Indices of the groups re-run on every change.
+        loops    (list): Sets of signals involved in combinatorial loops.
+    """
+    def __init__(self, statements, clock_domains):
+        groups = []
+        inputs = []
+        opaque = []
+        for targets, group in group_by_targets(statements):
+            lister = _SensitivityLister(clock_domains)
+            lister.visit(group)
+            groups.append((targets, group))
+            inputs.append(lister.output_list)
+            opaque.append(lister.opaque)
+
+        drivers = dict()
+        for i, (targets, _) in enumerate(groups):
+            for target in targets:
+                drivers[target] = i
+        successors = [sorted({drivers[s] for s in inputs[i] if s in drivers})
+                      for i in range(len(groups))]
+
+        order = []
+        self.loops = []
+        for scc in self._strongly_connected_components(successors):
+            if len(scc) > 1 or scc[0] in successors[scc[0]]:
+                self.loops.append(set().union(*(groups[i][0] for i in scc)))
+            order += scc
+        order.reverse()
+
+        rank = {g: r for r, g in enumerate(order)}
+        self.groups = [groups[g][1] for g in order]
+        self.readers = collections.defaultdict(list)
+        for g in order:
+            for signal in inputs[g]:
+                self.readers[signal].append(rank[g])
+        self.drivers = {signal: rank[g] for signal, g in drivers.items()}
+        self.always = [rank[g] for g in order if opaque[g]]
+
+    @staticmethod
+    def _strongly_connected_components(successors):
+        # Iterative Tarjan, yields components in reverse topological order.
+        index = [None]*len(successors)
+        lowlink = [0]*len(successors)
+        on_stack = [False]*len(successors)
+        stack = []
+        counter = 0
+        for root in range(len(successors)):
+            if index[root] is not None:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                for i in range(child, len(successors[node])):
+                    succ = successors[node][i]
+                    if index[succ] is None:
+                        work.append((node, i + 1))
+                        work.append((succ, 0))
+                        break
+                    elif on_stack[succ]:
+                        lowlink[node] = min(lowlink[node], index[succ])
+                else:
+                    if lowlink[node] == index[node]:
+                        scc = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            scc.append(member)
+                            if member == node:
+                                break
+                        yield scc
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+
 # TODO: instances via Iverilog/VPI
 class Simulator:
+    # maximum number of comb group executions per propagation, relative to
+    # the number of groups, before a comb loop is considered oscillating
+    comb_loop_limit = 64
+
     def __init__(self, fragment_or_module, generators, clocks={"sys": 10}, vcd_name=None,
-                 special_overrides={}):
+                 special_overrides={}, compiled=True, vcd_filter=None):
         if isinstance(fragment_or_module, _Fragment):
             self.fragment = fragment_or_module
         else:
@@ -296,13 +529,18 @@ class Simulator:
         # comb signals return to their reset value if nothing assigns them
         self.fragment.comb[0:0] = [s.eq(s.reset)
                                    for s in list_targets(self.fragment.comb)]
-        self.evaluator = Evaluator(self.fragment.clock_domains,
-                                   mta.replacements)
+        self.evaluator = self._create_evaluator(mta.replacements, compiled)
+        self.comb_graph = CombGraph(self.fragment.comb,
+                                    self.fragment.clock_domains)
+        self.comb = [self.evaluator.compile(statements)
+                     for statements in self.comb_graph.groups]
+        self.sync = {cd: self.evaluator.compile(statements)
+                     for cd, statements in self.fragment.sync.items()}
 
         if vcd_name is None:
             self.vcd = DummyVCDWriter()
         else:
-            self.vcd = VCDWriter(vcd_name)
+            self.vcd = VCDWriter(vcd_name, vcd_filter)
 
             signals = list_signals(self.fragment)
             for cd in self.fragment.clock_domains:
@@ -315,6 +553,10 @@ class Simulator:
             for signal in sorted(signals, key=lambda x: x.duid):
                 self.vcd.set(signal, signal.reset.value)
 
+    def _create_evaluator(self, replaced_memories, compiled):
+        evaluator_cls = CompiledEvaluator if compiled else Evaluator
+        return evaluator_cls(self.fragment.clock_domains, replaced_memories)
+
     def __enter__(self):
         return self
 
@@ -324,18 +566,58 @@ class Simulator:
     def close(self):
         self.vcd.close()
 
-    def _commit_and_comb_propagate(self):
-        # TODO: optimize
+    def _commit_and_comb_propagate(self, pending=()):
+        readers = self.comb_graph.readers
+        drivers = self.comb_graph.drivers
         all_modified = set()
         modified = self.evaluator.commit()
         all_modified |= modified
-        while modified:
-            self.evaluator.execute(self.fragment.comb)
+
+        # signals modified by sync statements or generators wake up their
+        # readers, and their comb driver if any, which must take over again
+        pending = set(pending)
+        for signal in modified:
+            pending.update(readers.get(signal, ()))
+            if signal in drivers:
+                pending.add(drivers[signal])
+        if modified:
+            pending.update(self.comb_graph.always)
+        heap = list(pending)
+        heapq.heapify(heap)
+
+        # groups are in topological order, so outside of comb loops each
+        # group is executed at most once
+        executions = 0
+        while heap:
+            group = heapq.heappop(heap)
+            pending.discard(group)
+            self.comb[group]()
             modified = self.evaluator.commit()
             all_modified |= modified
+            if modified:
+                for signal in modified:
+                    for reader in readers.get(signal, ()):
+                        if reader not in pending:
+                            pending.add(reader)
+                            heapq.heappush(heap, reader)
+                for reader in self.comb_graph.always:
+                    if reader not in pending:
+                        pending.add(reader)
+                        heapq.heappush(heap, reader)
+            executions += 1
+            if executions > self.comb_loop_limit*len(self.comb):
+                self._raise_comb_loop(all_modified)
+
         for signal in all_modified:
             self.vcd.set(signal, self.evaluator.signal_values[signal])
 
+    def _raise_comb_loop(self, modified):
+        loops = [loop for loop in self.comb_graph.loops if loop & modified]
+        signals = set().union(*loops) if loops else modified
+        ns = build_signal_namespace(signals)
+        raise ValueError("Combinatorial logic does not settle, signals involved: {}"
+                         .format(", ".join(sorted(ns.get_name(s) for s in signals))))
+
     def _evalexec_nested_lists(self, x):
         if isinstance(x, list):
             return [self._evalexec_nested_lists(e) for e in x]
@@ -379,16 +661,15 @@ class Simulator:
         return False
 
     def run(self):
-        self.evaluator.execute(self.fragment.comb)
-        self._commit_and_comb_propagate()
+        self._commit_and_comb_propagate(range(len(self.comb)))
 
         while True:
             dt, rising, falling = self.time.tick()
             self.vcd.delay(dt)
             for cd in rising:
                 self.evaluator.assign(self.fragment.clock_domains[cd].clk, 1)
-                if cd in self.fragment.sync:
-                    self.evaluator.execute(self.fragment.sync[cd])
+                if cd in self.sync:
+                    self.sync[cd]()
                 if cd in self.generators:
                     self._process_generators(cd)
             for cd in falling:
@@ -7,10 +7,10 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 from itertools import count
-import tempfile
 import os
-from collections import OrderedDict
+import gzip
 import shutil
+import subprocess
 
 from litex.gen.fhdl.namer import build_signal_namespace
 
@@ -25,89 +25,140 @@ def vcd_codes():
         yield code
 
 
+def vcd_signal_path(signal):
+    """Hierarchical path of a signal, from its backtrace (e.g. ``top_fifo_syncfifo_level``)."""
+    return "_".join(name for name, _ in signal.backtrace)
+
+
 class VCDWriter:
-    def __init__(self, filename):
+    """Streaming VCD writer.
+
+    Value changes are accumulated per timestep in a buffer that is written
+    to the output file in large chunks. The output format is selected from
+    the file name: ``.vcd``, ``.vcd.gz`` (gzip compressed VCD) or ``.fst``
+    (converted from VCD with GTKWave's ``vcd2fst`` on close).
+
+    ``signal_filter`` restricts tracing to a subset of the signals. It is
+    applied to the hierarchical path of the signals (see
+    ``vcd_signal_path``: attribute/class names of the modules down to the
+    signal, joined with "_") and is either a callable receiving the path and
+    returning whether the signal is traced, or a list of hierarchy prefixes:
+    a signal is traced when one of them matches whole names of its path from
+    any level of the hierarchy (``["fifo"]`` traces the signals of
+    ``self.fifo`` and of its submodules, ``["tb_fifo"]`` only the ones of
+    ``tb.fifo``).
+
+    Signals must be declared with ``init`` before the first value change;
+    changes of signals that were not declared are ignored.
+    """
+    buffer_size = 1 << 20
+
+    def __init__(self, filename, signal_filter=None):
         self.filename = filename
+        self.fst = filename.endswith(".fst")
+        if self.fst:
+            if shutil.which("vcd2fst") is None:
+                raise OSError("vcd2fst (from GTKWave) is required to write FST traces.")
+            self.vcd_filename = filename + ".vcd"
+        else:
+            self.vcd_filename = filename
+        if signal_filter is None or callable(signal_filter):
+            self.signal_filter = signal_filter
+        else:
+            prefixes = ["_" + prefix + "_" for prefix in signal_filter]
+            self.signal_filter = lambda path: any(prefix in "_" + path + "_" for prefix in prefixes)
         self.out_file = None
-        self.buffer_file = tempfile.TemporaryFile(
-            dir=os.path.dirname(filename), mode="w+")
-        self.initialized = False
         self.codegen = vcd_codes()
-        self.codes = OrderedDict()
+        self.formats = dict()
         self.signal_values = dict()
+        self.buffer = []
+        self.buffered = 0
         self.t = 0
+        self.t_written = True
 
-    def _write_value(self, signal, value):
-        l = len(signal)
-        if value < 0:
-            value += 2**l
-        if l > 1:
-            fmtstr = "b{:0" + str(l) + "b} {}\n"
-        else:
-            fmtstr = "{}{}\n"
-        try:
-            code = self.codes[signal]
-        except KeyError:
-            code = next(self.codegen)
-            self.codes[signal] = code
-            self.init(self.codes.keys())
+    def _open(self):
+        if self.vcd_filename.endswith(".gz"):
+            return gzip.open(self.vcd_filename, "wt", compresslevel=6)
+        return open(self.vcd_filename, "w")
 
-        return fmtstr.format(value, code)
+    def _format(self, nbits, code):
+        if nbits > 1:
+            return "b{:0" + str(nbits) + "b} " + code + "\n"
+        return "{}" + code + "\n"
 
     def _write(self, s):
-        self.out_file.write(s)
-        self.buffer_file.write(s)
+        self.buffer.append(s)
+        self.buffered += len(s)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.out_file.write("".join(self.buffer))
+        self.buffer.clear()
+        self.buffered = 0
 
     def init(self, signals):
-        self.out_file = open(self.filename, "w")
-
-        # generate codes
-        for signal in signals:
-            try:
-                code = self.codes[signal]
-            except KeyError:
-                code = next(self.codegen)
-                self.codes[signal] = code
-
-        # write vcd header
-        header = ""
-        ns = build_signal_namespace(self.codes.keys())
-        for signal, code in self.codes.items():
+        ns = build_signal_namespace(signals)
+        header = []
+        dumpvars = []
+        for signal in sorted(signals, key=lambda x: x.duid):
+            if self.signal_filter is not None and not self.signal_filter(vcd_signal_path(signal)):
+                continue
             name = ns.get_name(signal)
-            header += "$var wire {len} {code} {name} $end\n".format(name=name, code=code, len=len(signal))
-        header += "$dumpvars\n"
-        for signal in self.codes.keys():
-            header += self._write_value(signal, signal.reset.value)
-        header += "$end\n"
-        self.out_file.write(header)
-
-        if self.initialized:
-            self.buffer_file.seek(0)
-            shutil.copyfileobj(self.buffer_file, self.out_file)
-            self.buffer_file.seek(0, 2)
-        else:
-            # init time
-            self._write("#0\n")
-
-        self.initialized = True
+            code = next(self.codegen)
+            nbits = len(signal)
+            fmt = self._format(nbits, code)
+            self.formats[signal] = (fmt, 2**nbits)
+            header.append("$var wire {len} {code} {name} $end\n".format(
+                name=name, code=code, len=nbits))
+            value = signal.reset.value
+            if value < 0:
+                value += 2**nbits
+            dumpvars.append(fmt.format(value))
+            self.signal_values[signal] = signal.reset.value
+        header.append("$dumpvars\n")
+        header += dumpvars
+        header.append("$end\n")
+        header.append("#0\n")
+
+        self.out_file = self._open()
+        self.out_file.write("".join(header))
 
     def set(self, signal, value):
-        if (signal not in self.signal_values
-                or self.signal_values[signal] != value):
-            self._write(self._write_value(signal, value))
+        try:
+            fmt, modulo = self.formats[signal]
+        except KeyError:
+            return
+        if self.signal_values[signal] != value:
             self.signal_values[signal] = value
+            if not self.t_written:
+                self._write("#{}\n".format(self.t))
+                self.t_written = True
+            if value < 0:
+                value += modulo
+            self._write(fmt.format(value))
 
     def delay(self, delay):
+        # The timestamp is only emitted if some value changes at that time.
         self.t += delay
-        self._write("#{}\n".format(self.t))
+        self.t_written = False
 
     def close(self):
+        if self.out_file is None:
+            return
+        if not self.t_written:
+            self._write("#{}\n".format(self.t))
+        self.flush()
         self.out_file.close()
-        self.buffer_file.close()
+        self.out_file = None
+        if self.fst:
+            subprocess.check_call(["vcd2fst", self.vcd_filename, self.filename],
+                                  stdout=subprocess.DEVNULL)
+            os.remove(self.vcd_filename)
 
 
 class DummyVCDWriter:
-    def init(self):
+    def init(self, signals):
         pass
 
     def set(self, signal, value):
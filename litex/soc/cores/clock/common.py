@@ -4,8 +4,13 @@
 # Copyright (c) 2018-2020 Florent Kermarrec <florent@enjoy-digital.fr>
 # SPDX-License-Identifier: BSD-2-Clause
 
-import logging
+import os
+import json
 import math
+import bisect
+import hashlib
+import logging
+import tempfile
 
 from migen import Record
 
@@ -54,3 +59,174 @@ def clkdiv_range(start, stop, step=1):
     while current < stop:
         yield int(current) if math.floor(current) == current else current
         current += step
+
+# PLL Solver ---------------------------------------------------------------------------------------
+
+# Solutions are memoized for the current process. They can also be cached on disk, in the file
+# pointed to by LITEX_PLL_CACHE (the disk cache is disabled when LITEX_PLL_CACHE is not set).
+
+_PLL_CACHE_VERSION = 1
+_pll_solutions     = {}
+
+def _pll_cache_filename():
+    return os.getenv("LITEX_PLL_CACHE", "")
+
+def _pll_cache_load(filename):
+    try:
+        with open(filename, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _PLL_CACHE_VERSION:
+        return {}
+    return cache.get("solutions", {})
+
+def _pll_cache_store(filename, key, solution):
+    solutions = _pll_cache_load(filename)
+    solutions[key] = solution
+    # Write to a unique temporary file and rename it: concurrent builds never see (or clobber) a
+    # partially written cache. An entry lost to a concurrent update is just solved again.
+    directory = os.path.dirname(os.path.abspath(filename))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        f = tempfile.NamedTemporaryFile("w", dir=directory, prefix=".pll-", suffix=".json", delete=False)
+    except OSError:
+        return
+    try:
+        with f:
+            json.dump({"version": _PLL_CACHE_VERSION, "solutions": solutions}, f)
+        os.replace(f.name, filename)
+    except OSError:
+        try:
+            os.remove(f.name)
+        except OSError:
+            pass
+
+class _Candidates:
+    """Sorted view of divider/multiplier values, remembering their order of preference."""
+    def __init__(self, values):
+        ranks = {}
+        for rank, value in enumerate(values):
+            ranks.setdefault(value, rank)
+        self.values = sorted(ranks)
+        self.ranks  = [ranks[value] for value in self.values]
+
+    def window(self, low, high):
+        # Indexes of the values in [low, high], slightly widened to be tolerant to rounding (the
+        # exact constraints are checked by the caller).
+        start = bisect.bisect_left(self.values,  low*(1 - 1e-9))
+        end   = bisect.bisect_right(self.values, high*(1 + 1e-9))
+        return range(start, end)
+
+    def nearest(self, value):
+        # Indexes of the values surrounding value (the closest ones on each side).
+        i = bisect.bisect_left(self.values, value)
+        return [j for j in (i - 1, i) if 0 <= j < len(self.values)]
+
+def solve_pll(family, clkin_freq, clkouts, pre_dividers, multipliers, out_dividers,
+    vco_freq_range, vco_margin=0, pfd_freq_range=None, margin_isclose=False, cache=True):
+    """Find the PLL configuration generating the requested output clocks with the lowest error.
+
+    The PLL is modelled as vco = clkin_freq*multiplier/pre_divider and clkout = vco/divider, with
+    ``clkouts`` a {n: (freq, margin)} dict of the requested outputs and ``pre_dividers``,
+    ``multipliers`` and ``out_dividers`` ({n: dividers}) the supported values, in order of
+    preference. For each pre-divider, only the multipliers keeping the VCO (and PFD) in range are
+    considered and the best divider of each output is found directly around vco/freq. The
+    solution minimizing the sum of the relative errors of the outputs is returned (ties are
+    resolved by the order of preference) as a dict with ``pre_divider``, ``multiplier``, ``vco``
+    and ``clkouts`` ({n: (divider, freq)}) entries.
+
+    Pre-dividers giving a PFD frequency (clkin_freq/pre_divider) outside of ``pfd_freq_range``
+    are skipped: PLL primitives with a PFD frequency limit must provide it.
+
+    An output is accepted when its error is within its margin of the requested frequency or, with
+    ``margin_isclose``, of the larger of the requested and generated frequencies (as checked by
+    ``math.isclose(rel_tol=margin)``, slightly more tolerant to frequencies above the request).
+
+    ``family`` (the name of the PLL primitive) and all the parameters are used as the key of the
+    solution in the cache.
+    """
+    clkouts      = {n: (f, m) for n, (f, m) in sorted(clkouts.items())}
+    pre_dividers = list(pre_dividers)
+    multipliers  = list(multipliers)
+    out_dividers = {n: list(out_dividers[n]) for n in clkouts}
+    key = hashlib.sha256(repr((family, clkin_freq, clkouts, pre_dividers, multipliers,
+        out_dividers, vco_freq_range, vco_margin, pfd_freq_range, margin_isclose)).encode()).hexdigest()
+
+    # Lookup memoized/cached solution (None when there is no solution).
+    if key in _pll_solutions:
+        solution = _pll_solutions[key]
+    else:
+        filename  = _pll_cache_filename() if cache else ""
+        solutions = _pll_cache_load(filename) if filename else {}
+        if key in solutions:
+            solution = solutions[key]
+        else:
+            solution = _solve_pll(clkin_freq, clkouts, pre_dividers, multipliers, out_dividers,
+                vco_freq_range, vco_margin, pfd_freq_range, margin_isclose)
+            if filename:
+                _pll_cache_store(filename, key, solution)
+        _pll_solutions[key] = solution
+
+    if solution is None:
+        raise ValueError("No PLL config found")
+    pre_divider, multiplier, dividers = solution
+    vco_freq = clkin_freq*multiplier/pre_divider
+    return {
+        "pre_divider" : pre_divider,
+        "multiplier"  : multiplier,
+        "vco"         : vco_freq,
+        "clkouts"     : {int(n): (d, vco_freq/d) for n, d in dividers},
+    }
+
+def _solve_pll(clkin_freq, clkouts, pre_dividers, multipliers, out_dividers,
+    vco_freq_range, vco_margin, pfd_freq_range, margin_isclose):
+    vco_freq_min = vco_freq_range[0]*(1 + vco_margin)
+    vco_freq_max = vco_freq_range[1]*(1 - vco_margin)
+    multipliers  = _Candidates(multipliers)
+    out_dividers = {n: _Candidates(dividers) for n, dividers in out_dividers.items()}
+
+    best       = None
+    best_error = None
+    for pre_rank, pre_divider in enumerate(pre_dividers):
+        if pfd_freq_range is not None:
+            if not (pfd_freq_range[0] <= clkin_freq/pre_divider <= pfd_freq_range[1]):
+                continue
+        # Multipliers keeping the VCO in range, in order of preference.
+        window = multipliers.window(
+            vco_freq_min*pre_divider/clkin_freq,
+            vco_freq_max*pre_divider/clkin_freq)
+        for i in sorted(window, key=lambda i: multipliers.ranks[i]):
+            multiplier = multipliers.values[i]
+            vco_freq   = clkin_freq*multiplier/pre_divider
+            if not (vco_freq_min <= vco_freq <= vco_freq_max):
+                continue
+            # Best divider of each output, independently.
+            error    = 0
+            dividers = []
+            for n, (f, m) in clkouts.items():
+                candidates = out_dividers[n]
+                output     = None
+                for j in candidates.nearest(vco_freq/f):
+                    d = candidates.values[j]
+                    diff = abs(vco_freq/d - f)
+                    if margin_isclose:
+                        if not math.isclose(vco_freq/d, f, rel_tol=m):
+                            continue
+                    elif diff > f*m:
+                        continue
+                    if output is None or (diff, candidates.ranks[j]) < output[:2]:
+                        output = (diff, candidates.ranks[j], d)
+                if output is None:
+                    break
+                error += output[0]/f
+                dividers.append((n, output[2]))
+            else:
+                # Round the error to not select a solution on floating point noise.
+                error = round(error, 12)
+                if best is None or error < best_error:
+                    best       = [pre_divider, multiplier, dividers]
+                    best_error = error
+                    if error == 0:
+                        return best
+    return best
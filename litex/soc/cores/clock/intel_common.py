@@ -5,10 +5,6 @@
 # Copyright (c) 2022 Jevin Sweval <jevinsweval@gmail.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
-import math
-from operator import mul
-from functools import reduce
-
 from migen import *
 from migen.genlib.resetsync import AsyncResetSynchronizer
 
@@ -22,10 +18,6 @@ from litex.soc.cores.clock.common import *
 
 # Intel / Generic ---------------------------------------------------------------------------------
 
-def geometric_mean(vals):
-    return reduce(mul, vals, 1) ** (1 / len(vals))
-
-
 class IntelClocking(LiteXModule):
     def __init__(self, vco_margin=0):
         self.vco_margin = vco_margin
@@ -60,50 +52,28 @@ class IntelClocking(LiteXModule):
         self.nclkouts += 1
 
     def compute_config(self):
-        valid_configs = {}
-        clkdiv_range_list = list(clkdiv_range(*self.c_div_range)) # for speed
         # Only test values of N (input clock divisor) which result in a PFD
         # input frequency within the allowable range.
-        min_n = math.ceil(self.clkin_freq/self.clkin_pfd_freq_range[1])
-        max_n = math.floor(self.clkin_freq/self.clkin_pfd_freq_range[0])
-        min_n = max(min_n, self.n_div_range[0]) # keep within counter size
-        max_n = min(max_n+1, self.n_div_range[1])
-        for n in range(min_n, max_n):
-            for m in range(*self.m_div_range):
-                # For this given N, M, check to see if we can meet requirements
-                # for each clkout. If so, record the difference ratio from the
-                # requested clock freqs.
-                diff_ratios = [None] * len(self.clkouts)
-                vco_freq = self.clkin_freq*m/n
-                config = {"m": m, "vco": vco_freq}
-                (vco_freq_min, vco_freq_max) = self.vco_freq_range
-                if (vco_freq >= vco_freq_min*(1 + self.vco_margin) and
-                    vco_freq <= vco_freq_max*(1 - self.vco_margin)):
-                    clk_valid = [False] * len(self.clkouts)
-                    for _n, (clk, f, p, _m) in sorted(self.clkouts.items()):
-                        # For each C, see if the output frequency is within margin
-                        # and the difference is better than the previous valid, best C.
-                        best_diff = float("inf")
-                        for c in clkdiv_range_list:
-                            clk_freq = vco_freq/c
-                            diff = abs(clk_freq - f)
-                            if diff <= f*_m and diff < best_diff:
-                                config[f"clk{_n}_freq"]   = clk_freq
-                                config[f"clk{_n}_divide"] = c * n
-                                config[f"clk{_n}_phase"]  = p
-                                clk_valid[_n] = True
-                                diff_ratios[_n] = diff / f
-                                best_diff = diff
-                    all_valid = all(clk_valid)
-                else:
-                    all_valid = False
-                if all_valid:
-                    valid_configs[geometric_mean(diff_ratios)] = config
-        if len(valid_configs):
-            best_config = sorted(valid_configs.items())[0][1]
-            compute_config_log(self.logger, best_config)
-            return best_config
-        raise ValueError("No PLL config found")
+        solution = solve_pll(
+            family         = type(self).__name__,
+            clkin_freq     = self.clkin_freq,
+            clkouts        = {n: (f, m) for n, (clk, f, p, m) in self.clkouts.items()},
+            pre_dividers   = range(*self.n_div_range),
+            multipliers    = range(*self.m_div_range),
+            out_dividers   = {n: clkdiv_range(*self.c_div_range) for n in self.clkouts.keys()},
+            vco_freq_range = self.vco_freq_range,
+            vco_margin     = self.vco_margin,
+            pfd_freq_range = self.clkin_pfd_freq_range,
+        )
+        n = solution["pre_divider"]
+        config = {"m": solution["multiplier"], "vco": solution["vco"]}
+        for _n, (clk, f, p, _m) in sorted(self.clkouts.items()):
+            c, clk_freq = solution["clkouts"][_n]
+            config[f"clk{_n}_freq"]   = clk_freq
+            config[f"clk{_n}_divide"] = c * n
+            config[f"clk{_n}_phase"]  = p
+        compute_config_log(self.logger, config)
+        return config
 
     def add_reset_delay(self, cycles):
         for _ in range(cycles):
@@ -23,6 +23,7 @@ class iCE40PLL(LiteXModule):
     divf_range = (0, 128)
     divq_range = (0,   7)
     clki_freq_range = ( 10e6,  133e9)
+    pfd_freq_range  = ( 10e6,  133e6)
     clko_freq_range = ( 16e6,  275e9)
     vco_freq_range  = (533e6, 1066e6)
 
@@ -66,33 +67,26 @@ class iCE40PLL(LiteXModule):
         self.nclkouts += 1
 
     def compute_config(self):
+        solution = solve_pll(
+            family         = type(self).__name__,
+            clkin_freq     = self.clkin_freq,
+            clkouts        = {n: (f, m) for n, (clk, f, p, m) in self.clkouts.items()},
+            pre_dividers   = [divr + 1 for divr in range(*self.divr_range)],
+            multipliers    = [divf + 1 for divf in range(*self.divf_range)],
+            out_dividers   = {n: [2**divq for divq in range(*self.divq_range)] for n in self.clkouts.keys()},
+            vco_freq_range = self.vco_freq_range,
+            pfd_freq_range = self.pfd_freq_range,
+        )
         config = {}
-        for divr in range(*self.divr_range):
-            for divf in range(*self.divf_range):
-                all_valid = True
-                vco_freq = self.clkin_freq/(divr + 1)*(divf +  1)
-                (vco_freq_min, vco_freq_max) = self.vco_freq_range
-                if vco_freq >= vco_freq_min and vco_freq <= vco_freq_max:
-                    for n, (clk, f, p, m) in sorted(self.clkouts.items()):
-                        valid = False
-                        for divq in range(*self.divq_range):
-                            clk_freq = vco_freq/(2**divq)
-                            if abs(clk_freq - f) <= f*m:
-                                config["clkout_freq"] = clk_freq
-                                config["divq"]        = divq
-                                valid = True
-                                break
-                        if not valid:
-                            all_valid = False
-                else:
-                    all_valid = False
-                if all_valid:
-                    config["vco"] = vco_freq
-                    config["divr"] = divr
-                    config["divf"] = divf
-                    compute_config_log(self.logger, config)
-                    return config
-        raise ValueError("No PLL config found")
+        for n, (clk, f, p, m) in sorted(self.clkouts.items()):
+            d, clk_freq = solution["clkouts"][n]
+            config["clkout_freq"] = clk_freq
+            config["divq"]        = d.bit_length() - 1
+        config["vco"]  = solution["vco"]
+        config["divr"] = solution["pre_divider"] - 1
+        config["divf"] = solution["multiplier"] - 1
+        compute_config_log(self.logger, config)
+        return config
 
     def do_finalize(self):
         config = self.compute_config()
@@ -168,34 +168,26 @@ class NXPLL(LiteXModule):
         self.nclkouts += 1
 
     def compute_config(self):
-        config = {}
-        for clki_div in range(*self.clki_div_range):
-            config["clki_div"] = clki_div
-            for clkfb_div in range(*self.clkfb_div_range):
-                all_valid = True
-                vco_freq = self.clkin_freq/clki_div*clkfb_div
-                (vco_freq_min, vco_freq_max) = self.vco_out_freq_range
-                if vco_freq >= vco_freq_min and vco_freq <= vco_freq_max:
-                    for n, (clk, f, p, m) in sorted(self.clkouts.items()):
-                        valid = False
-                        for d in range(*self.clko_div_range):
-                            clk_freq = vco_freq/d
-                            if abs(clk_freq - f) <= f*m:
-                                config["clko{}_freq".format(n)]  = clk_freq
-                                config["clko{}_div".format(n)]   = d
-                                config["clko{}_phase".format(n)] = p
-                                valid = True
-                                break
-                        if not valid:
-                            all_valid = False
-                else:
-                    all_valid = False
-                if all_valid:
-                    config["vco"] = vco_freq
-                    config["clkfb_div"] = clkfb_div
-                    compute_config_log(self.logger, config)
-                    return config
-        raise ValueError("No PLL config found")
+        solution = solve_pll(
+            family         = type(self).__name__,
+            clkin_freq     = self.clkin_freq,
+            clkouts        = {n: (f, m) for n, (clk, f, p, m) in self.clkouts.items()},
+            pre_dividers   = range(*self.clki_div_range),
+            multipliers    = range(*self.clkfb_div_range),
+            out_dividers   = {n: range(*self.clko_div_range) for n in self.clkouts.keys()},
+            vco_freq_range = self.vco_out_freq_range,
+            pfd_freq_range = self.vco_in_freq_range,
+        )
+        config = {"clki_div": solution["pre_divider"]}
+        for n, (clk, f, p, m) in sorted(self.clkouts.items()):
+            d, clk_freq = solution["clkouts"][n]
+            config["clko{}_freq".format(n)]  = clk_freq
+            config["clko{}_div".format(n)]   = d
+            config["clko{}_phase".format(n)] = p
+        config["vco"]       = solution["vco"]
+        config["clkfb_div"] = solution["multiplier"]
+        compute_config_log(self.logger, config)
+        return config
 
     def calculate_analog_parameters(self, clki_freq, fb_div, bw_factor = 5):
         config = {}
@@ -20,6 +20,7 @@ from litex.soc.cores.clock.common import *
 class XilinxClocking(LiteXModule):
     clkfbout_mult_frange = (2,  64+1)
     clkout_divide_range  = (1, 128+1)
+    pfd_freq_range       = None
 
     def __init__(self, vco_margin=0):
         self.vco_margin = vco_margin
@@ -76,41 +77,32 @@ class XilinxClocking(LiteXModule):
         self.nclkouts += 1
 
     def compute_config(self):
-        config = {}
-        for divclk_divide in range(*self.divclk_divide_range):
-            config["divclk_divide"] = divclk_divide
-            for clkfbout_mult in reversed(range(*self.clkfbout_mult_frange)):
-                all_valid = True
-                vco_freq = self.clkin_freq*clkfbout_mult/divclk_divide
-                (vco_freq_min, vco_freq_max) = self.vco_freq_range
-                if (vco_freq >= vco_freq_min*(1 + self.vco_margin) and
-                    vco_freq <= vco_freq_max*(1 - self.vco_margin)):
-                    for n, (clk, f, p, m) in sorted(self.clkouts.items()):
-                        valid = False
-                        d_ranges = [self.clkout_divide_range]
-                        if getattr(self, "clkout{}_divide_range".format(n), None) is not None:
-                            d_ranges += [getattr(self, "clkout{}_divide_range".format(n))]
-                        for d_range in d_ranges:
-                            for d in clkdiv_range(*d_range):
-                                clk_freq = vco_freq/d
-                                if abs(clk_freq - f) <= f*m:
-                                    config["clkout{}_freq".format(n)]   = clk_freq
-                                    config["clkout{}_divide".format(n)] = d
-                                    config["clkout{}_phase".format(n)]  = p
-                                    valid = True
-                                    break
-                                if valid:
-                                    break
-                        if not valid:
-                            all_valid = False
-                else:
-                    all_valid = False
-                if all_valid:
-                    config["vco"]           = vco_freq
-                    config["clkfbout_mult"] = clkfbout_mult
-                    compute_config_log(self.logger, config)
-                    return config
-        raise ValueError("No PLL config found")
+        out_dividers = {}
+        for n in self.clkouts.keys():
+            out_dividers[n] = list(clkdiv_range(*self.clkout_divide_range))
+            if getattr(self, "clkout{}_divide_range".format(n), None) is not None:
+                out_dividers[n] += clkdiv_range(*getattr(self, "clkout{}_divide_range".format(n)))
+        solution = solve_pll(
+            family         = type(self).__name__,
+            clkin_freq     = self.clkin_freq,
+            clkouts        = {n: (f, m) for n, (clk, f, p, m) in self.clkouts.items()},
+            pre_dividers   = range(*self.divclk_divide_range),
+            multipliers    = reversed(range(*self.clkfbout_mult_frange)),
+            out_dividers   = out_dividers,
+            vco_freq_range = self.vco_freq_range,
+            vco_margin     = self.vco_margin,
+            pfd_freq_range = self.pfd_freq_range,
+        )
+        config = {"divclk_divide": solution["pre_divider"]}
+        for n, (clk, f, p, m) in sorted(self.clkouts.items()):
+            d, clk_freq = solution["clkouts"][n]
+            config["clkout{}_freq".format(n)]   = clk_freq
+            config["clkout{}_divide".format(n)] = d
+            config["clkout{}_phase".format(n)]  = p
+        config["vco"]           = solution["vco"]
+        config["clkfbout_mult"] = solution["multiplier"]
+        compute_config_log(self.logger, config)
+        return config
 
     def expose_drp(self):
         self.drp_reset  = CSR()
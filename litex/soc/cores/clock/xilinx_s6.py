@@ -26,6 +26,11 @@ class S6PLL(XilinxClocking):
             -2: (400e6, 1000e6),
             -3: (400e6, 1080e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (19e6, 300e6),
+            -2: (19e6, 400e6),
+            -3: (19e6, 500e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
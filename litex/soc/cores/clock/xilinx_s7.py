@@ -27,6 +27,11 @@ class S7PLL(XilinxClocking):
             -2: (800e6, 1866e6),
             -3: (800e6, 2133e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (19e6, 450e6),
+            -2: (19e6, 500e6),
+            -3: (19e6, 550e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
@@ -76,6 +81,11 @@ class S7MMCM(XilinxClocking):
             -2: (600e6, 1440e6),
             -3: (600e6, 1600e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (10e6, 450e6),
+            -2: (10e6, 500e6),
+            -3: (10e6, 550e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
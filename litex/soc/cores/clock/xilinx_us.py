@@ -32,6 +32,11 @@ class USPLL(XilinxClocking):
             -2: (600e6, 1335e6),
             -3: (600e6, 1335e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (70e6, 600e6),
+            -2: (70e6, 667.5e6),
+            -3: (70e6, 667.5e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
@@ -80,6 +85,11 @@ class USMMCM(XilinxClocking):
             -2: (600e6, 1440e6),
             -3: (600e6, 1600e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (10e6, 450e6),
+            -2: (10e6, 500e6),
+            -3: (10e6, 550e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
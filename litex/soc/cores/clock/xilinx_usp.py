@@ -8,8 +8,7 @@ from litex.gen import *
 
 from litex.soc.cores.clock.common import *
 from litex.soc.cores.clock.xilinx_common import *
-from typing import Dict, Any
-import math
+from typing import Dict, Any, List
 
 # Xilinx / Ultrascale Plus PLL ---------------------------------------------------------------------
 
@@ -34,6 +33,11 @@ class USPPLL(XilinxClocking):
             -2: (750e6, 1500e6),
             -3: (750e6, 1500e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (70e6, 667.5e6),
+            -2: (70e6, 667.5e6),
+            -3: (70e6, 667.5e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
@@ -81,6 +85,11 @@ class USPMMCM(XilinxClocking):
             -2: (800e6, 1600e6),
             -3: (800e6, 1600e6),
         }[speedgrade]
+        self.pfd_freq_range = {
+            -1: (10e6, 450e6),
+            -2: (10e6, 500e6),
+            -3: (10e6, 550e6),
+        }[speedgrade]
 
     def do_finalize(self):
         XilinxClocking.do_finalize(self)
@@ -121,58 +130,53 @@ class USPMMCM(XilinxClocking):
         Raises:
             ValueError: If no valid MMCM configuration is found.
         """
-        vco_min_margin = self.vco_freq_range[0] * (1 + self.vco_margin)
-        vco_max_margin = self.vco_freq_range[1] * (1 - self.vco_margin)
         # ref: https://docs.amd.com/r/en-US/ug572-ultrascale-clocking/MMCM-Attributes
         # CLKFBOUT_MULT_F: 2.0 to 128.0 with step 0.125
         clkfbout_mult_f_values = [x / 8 for x in range(16, 1025)]
 
-        for divclk_divide in range(*self.divclk_divide_range):
-            for clkfbout_mult in reversed(clkfbout_mult_f_values):
-                vco_freq = self.clkin_freq * clkfbout_mult / divclk_divide
-                if not (vco_min_margin <= vco_freq <= vco_max_margin):
-                    continue # vco_freq out of range
-
-                config: Dict[str, Any] = {
-                    "divclk_divide": divclk_divide,
-                    "clkfbout_mult": clkfbout_mult,
-                    "vco": vco_freq
-                }
-                all_valid = True
-                for n, (clk, f, p, m) in sorted(self.clkouts.items()):
-                    valid = False
-
-                    dividers = list(clkdiv_range(*self.clkout_divide_range))
-                    # Add specific range dividers if they exist
-                    specific_div_range = getattr(self, f"clkout{n}_divide_range", None)
-                    if specific_div_range:
-                        dividers.extend(clkdiv_range(*specific_div_range))
-
-                    # For clkout0, CLKOUT[0]_DIVIDE_F also has range 2.0 to 128.0 with step 0.125
-                    if n == 0:
-                        dividers = [x / 8 for x in range(16, 1025)]
-
-                    for d in dividers:
-                        clk_freq = vco_freq / d
-                        if not math.isclose(clk_freq, f, rel_tol=m):
-                        # if abs(clk_freq - f) <= f * m:
-                            continue
-
-                        config[f"clkout{n}_freq"] = clk_freq
-                        config[f"clkout{n}_divide"] = d
-                        config[f"clkout{n}_phase"] = p
-                        valid = True
-                        break # Valid divider found
-
-                    if not valid:
-                        all_valid = False
-                        break # Exit early if any clock output is invalid
-
-                if all_valid:
-                    compute_config_log(self.logger, config)
-                    return config
-
-        raise ValueError("No MMCM config found")
+        out_dividers: Dict[int, List[float]] = {}
+        for n in self.clkouts.keys():
+            dividers = list(clkdiv_range(*self.clkout_divide_range))
+            # Add specific range dividers if they exist
+            specific_div_range = getattr(self, f"clkout{n}_divide_range", None)
+            if specific_div_range:
+                dividers.extend(clkdiv_range(*specific_div_range))
+
+            # For clkout0, CLKOUT[0]_DIVIDE_F also has range 2.0 to 128.0 with step 0.125
+            if n == 0:
+                dividers = [x / 8 for x in range(16, 1025)]
+            out_dividers[n] = dividers
+
+        try:
+            solution = solve_pll(
+                family         = type(self).__name__,
+                clkin_freq     = self.clkin_freq,
+                clkouts        = {n: (f, m) for n, (clk, f, p, m) in self.clkouts.items()},
+                pre_dividers   = range(*self.divclk_divide_range),
+                multipliers    = reversed(clkfbout_mult_f_values),
+                out_dividers   = out_dividers,
+                vco_freq_range = self.vco_freq_range,
+                vco_margin     = self.vco_margin,
+                pfd_freq_range = self.pfd_freq_range,
+                # Margins have always been checked with math.isclose on this primitive.
+                margin_isclose = True,
+            )
+        except ValueError:
+            raise ValueError("No MMCM config found")
+
+        config: Dict[str, Any] = {
+            "divclk_divide": solution["pre_divider"],
+            "clkfbout_mult": solution["multiplier"],
+            "vco": solution["vco"]
+        }
+        for n, (clk, f, p, m) in sorted(self.clkouts.items()):
+            d, clk_freq = solution["clkouts"][n]
+            config[f"clkout{n}_freq"] = clk_freq
+            config[f"clkout{n}_divide"] = d
+            config[f"clkout{n}_phase"] = p
+
+        compute_config_log(self.logger, config)
+        return config
 
 # Xilinx / Ultrascale Plus IDELAY CTRL -------------------------------------------------------------
 
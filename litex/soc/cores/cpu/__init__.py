@@ -6,9 +6,11 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import re
 import sys
 import inspect
 import importlib
+import collections.abc
 
 from migen import *
 
@@ -92,39 +94,84 @@ CPU_GCC_TRIPLE_RISCV32 = CPU_GCC_TRIPLE_RISCV64 + (
 
 # CPUs Collection ----------------------------------------------------------------------------------
 
+def import_cpu(path, cpu):
+    """Imports the CPU package cpu from path and returns its CPU class (or None)."""
+    sys.path.append(path)
+    for cpu_name, cpu_cls in inspect.getmembers(importlib.import_module(cpu), inspect.isclass):
+        if cpu_name.lower() in [cpu, cpu.replace("_", "")]:
+            return cpu_cls
+    return None
+
+def defines_cpu(path, cpu):
+    """Checks, without importing it, that the package cpu from path defines or imports its CPU class."""
+    names = [cpu, cpu.replace("_", "")]
+    for file in ["__init__.py", "core.py"]:
+        try:
+            with open(os.path.join(path, cpu, file)) as f:
+                source = f.read()
+        except OSError:
+            continue
+        for match in re.finditer(r"^[ \t]*(?:class[ \t]+(\w+)|from[ \t]+\S+[ \t]+import[ \t]+([\w \t,]+))", source, re.M):
+            for cpu_name in re.findall(r"\w+", match.group(1) or match.group(2)):
+                if cpu_name.lower() in names:
+                    return True
+    return False
+
+class CPURegistry(collections.abc.Mapping):
+    """Lazy CPU registry, mapping CPU names to CPU classes.
+
+    The CPU index (name -> path) is built from the directories of the CPU paths that contain a
+    core.py and define (or import) a class named after the directory, without importing them: a
+    CPU package is only imported when its class is accessed.
+    """
+    def __init__(self, paths):
+        self.paths  = paths
+        self._index = None
+        self._cpus  = {"None" : CPUNone}
+
+    @property
+    def index(self):
+        if self._index is None:
+            index = {"None" : None}
+            # Search for CPUs in paths.
+            for path in self.paths:
+                for file in os.listdir(path):
+                    # Verify that it's a path, that core.py is present...
+                    if not os.path.exists(os.path.join(path, file, "core.py")):
+                        continue
+                    # ... and that it defines a CPU class.
+                    if defines_cpu(path, file):
+                        index[file] = path
+            self._index = index
+        return self._index
+
+    def __getitem__(self, name):
+        try:
+            return self._cpus[name]
+        except KeyError:
+            pass
+        cpu_cls = import_cpu(self.index[name], name)
+        if cpu_cls is None:
+            raise KeyError(name)
+        self._cpus[name] = cpu_cls
+        return cpu_cls
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self.index
+
 def collect_cpus():
-    cpus  = {"None" : CPUNone}
-    paths = [
+    # Return collected CPUs.
+    return CPURegistry(paths=[
         # Add litex.soc.cores.cpu path.
         os.path.dirname(__file__),
         # Add execution path.
         os.getcwd()
-    ]
-
-    exec_dir = os.getcwd()
-
-    # Search for CPUs in paths.
-    for path in paths:
-        for file in os.listdir(path):
-
-            # Verify that it's a path...
-            cpu_path = os.path.join(path, file)
-            if not os.path.isdir(cpu_path):
-                continue
-
-            # ... and that core.py is present.
-            cpu_core = os.path.join(cpu_path, "core.py")
-            if not os.path.exists(cpu_core):
-                continue
-
-            # OK, it seems to be a CPU; now get the class and add it to dict.
-            cpu = file
-            sys.path.append(path)
-            for cpu_name, cpu_cls in inspect.getmembers(importlib.import_module(cpu), inspect.isclass):
-                if cpu_name.lower() in [cpu, cpu.replace("_", "")]:
-                    cpus[cpu] = cpu_cls
-
-    # Return collected CPUs.
-    return cpus
+    ])
 
 CPUS = collect_cpus()
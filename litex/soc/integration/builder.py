@@ -13,10 +13,12 @@
 
 
 import os
+import inspect
 import argparse
 import subprocess
 import struct
 import shutil
+import hashlib
 
 from packaging.version import Version
 
@@ -24,6 +26,7 @@ from litex import get_data_mod
 from litex.gen import colorer
 
 from litex.build.tools import write_to_file
+from litex.build.profiler import BuildProfiler, profile_phase
 
 from litex.soc.cores import cpu
 from litex.soc.integration import export, soc_core
@@ -39,6 +42,22 @@ def _create_dir(d, remove_if_exists=False):
         shutil.rmtree(dir_path)
     os.makedirs(dir_path, exist_ok=True)
 
+def _hash_files(h, path):
+    # Hash the files of path (file or directory, recursively) in a deterministic order, ignoring
+    # the LiteX banner of the generated files (that changes on each build).
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for f in sorted(files):
+                _hash_files(h, os.path.join(root, f))
+    elif os.path.isfile(path):
+        h.update(path.encode() + b"\0")
+        with open(path, "rb") as f:
+            for line in f:
+                if b"Auto-generated by LiteX" not in line:
+                    h.update(line)
+        h.update(b"\0")
+
 # Software Packages --------------------------------------------------------------------------------
 
 soc_software_packages = [
@@ -77,6 +96,7 @@ class Builder:
         compile_software = True,
         compile_gateware = True,
         build_backend    = "litex",
+        verilog_cache    = False,
 
         # Exports.
         csr_json         = None,
@@ -90,7 +110,10 @@ class Builder:
         bios_console     = "full",
 
         # Documentation.
-        generate_doc     = False):
+        generate_doc     = False,
+
+        # Profiling.
+        profile          = False):
 
         # SoC/Builder Attach.
         self.soc         = soc   # Attach SoC to Builder.
@@ -107,6 +130,7 @@ class Builder:
         self.compile_software = compile_software
         self.compile_gateware = compile_gateware
         self.build_backend    = build_backend
+        self.verilog_cache    = verilog_cache
 
         # Exports (Generated by default to output_dir with default name unless explicitly specified).
         self.csr_csv  = csr_csv  if csr_csv  else os.path.join(self.output_dir, "csr.csv")
@@ -122,6 +146,9 @@ class Builder:
         # Documentation.
         self.generate_doc = generate_doc
 
+        # Profiling.
+        self.profile = profile
+
         # Software packages and libraries.
         self.software_packages  = []
         self.software_libraries = []
@@ -215,7 +242,8 @@ class Builder:
         self.soc.constants.update(  self._get_json_constants())
         self.soc.csr_regions.update(self._get_json_csr_regions())
 
-        # Generate BIOS files when the SoC uses it.
+        # Generate BIOS files when the SoC uses it (these have no banner: write_to_file already leaves
+        # them untouched when their contents do not change).
         if with_bios:
             # Generate Variables to variables.mak.
             variables_contents = self._get_variables_contents()
@@ -229,16 +257,19 @@ class Builder:
             regions_contents = export.get_linker_regions(self.soc.mem_regions)
             write_to_file(os.path.join(self.generated_dir, "regions.ld"), regions_contents)
 
+        # C headers below have a generated banner (date/revision) that is ignored when comparing them
+        # to the existing files, so that software is only recompiled when their contents change.
+
         # Collect / Generate I2C config and init table.
         from litex.soc.cores.bitbang import collect_i2c_info
         i2c_devs, i2c_init = collect_i2c_info(self.soc)
         if i2c_devs:
             i2c_info = export.get_i2c_header((i2c_devs, i2c_init))
-            write_to_file(os.path.join(self.generated_dir, "i2c.h"), i2c_info)
+            write_to_file(os.path.join(self.generated_dir, "i2c.h"), i2c_info, ignore_banner=True)
 
         # Generate Memory Regions to mem.h.
         mem_contents = export.get_mem_header(self.soc.mem_regions)
-        write_to_file(os.path.join(self.generated_dir, "mem.h"), mem_contents)
+        write_to_file(os.path.join(self.generated_dir, "mem.h"), mem_contents, ignore_banner=True)
 
         # Generate Memory Regions to memory.x if specified.
         if self.memory_x is not None:
@@ -247,7 +278,7 @@ class Builder:
 
         # Generate SoC Config/Constants to soc.h.
         soc_contents = export.get_soc_header(self.soc.constants)
-        write_to_file(os.path.join(self.generated_dir, "soc.h"), soc_contents)
+        write_to_file(os.path.join(self.generated_dir, "soc.h"), soc_contents, ignore_banner=True)
 
         # Generate CSR registers definitions/access functions to csr.h.
         csr_contents = export.get_csr_header(
@@ -257,11 +288,11 @@ class Builder:
             with_access_functions        = True,
             with_fields_access_functions = False,
         )
-        write_to_file(os.path.join(self.generated_dir, "csr.h"), csr_contents)
+        write_to_file(os.path.join(self.generated_dir, "csr.h"), csr_contents, ignore_banner=True)
 
         # Generate Git SHA1 of tools to git.h
         git_contents = export.get_git_header()
-        write_to_file(os.path.join(self.generated_dir, "git.h"), git_contents)
+        write_to_file(os.path.join(self.generated_dir, "git.h"), git_contents, ignore_banner=True)
 
         # Generate LiteDRAM C header to sdram_phy.h when the SoC use it
         if hasattr(self.soc, "sdram"):
@@ -270,7 +301,7 @@ class Builder:
                 self.soc.sdram.controller.settings.phy,
                 self.soc.sdram.controller.settings.timing,
                 self.soc.sdram.controller.settings.geom)
-            write_to_file(os.path.join(self.generated_dir, "sdram_phy.h"), sdram_contents)
+            write_to_file(os.path.join(self.generated_dir, "sdram_phy.h"), sdram_contents, ignore_banner=True)
 
     def _generate_csr_map(self):
         # JSON Export.
@@ -315,18 +346,97 @@ class Builder:
         for name, src_dir in self.software_packages:
             _create_dir(os.path.join(self.software_dir, name))
 
+    def _get_software_dependencies(self, packages):
+        # Libraries are compiled after libc (that generates the picolibc headers used by all the
+        # packages) and the other packages (BIOS, firmwares) after all the libraries.
+        libraries    = [name for name in packages if name in self.software_libraries]
+        dependencies = {}
+        for name in packages:
+            if name == "libc":
+                dependencies[name] = []
+            elif name in libraries:
+                dependencies[name] = [lib for lib in libraries if lib == "libc"]
+            else:
+                dependencies[name] = libraries
+        return dependencies
+
+    def _get_software_hashes(self, packages, dependencies):
+        # Hash the inputs of the software packages: generated files, common software files/includes,
+        # CPU files, package sources and the hashes of the packages they depend on.
+        common = hashlib.sha256()
+        _hash_files(common, self.generated_dir)
+        for f in sorted(os.listdir(os.path.join(soc_directory, "software"))):
+            if os.path.isfile(os.path.join(soc_directory, "software", f)):
+                _hash_files(common, os.path.join(soc_directory, "software", f))
+        _hash_files(common, os.path.join(soc_directory, "software", "include"))
+        _hash_files(common, os.path.join(soc_directory, "software", "libbase"))
+        _hash_files(common, os.path.dirname(inspect.getfile(self.soc.cpu.__class__)))
+        hashes = {}
+        def get_hash(name):
+            if name not in hashes:
+                h = common.copy()
+                _hash_files(h, packages[name])
+                for dependency in dependencies[name]:
+                    h.update(get_hash(dependency).encode())
+                hashes[name] = h.hexdigest()
+            return hashes[name]
+        return {name: get_hash(name) for name in packages}
+
+    def _software_package_built(self, name, src_dir, stamp, digest):
+        # Check the stamp of the last compilation...
+        try:
+            with open(stamp) as f:
+                if f.read() != digest:
+                    return False
+        except OSError:
+            return False
+        # ... and that the outputs of the package (prerequisites of its "all" target) exist.
+        outputs = []
+        with open(os.path.join(src_dir, "Makefile")) as f:
+            for line in f:
+                if line.startswith("all:"):
+                    outputs = line[len("all:"):].split()
+                    break
+        if not outputs:
+            return False
+        return all(os.path.exists(os.path.join(self.software_dir, name, output)) for output in outputs)
+
     def _generate_rom_software(self, compile_bios=True):
-        # Compile all software packages.
-        cpu_count = os.cpu_count()
-        for name, src_dir in self.software_packages:
-            # Skip BIOS compilation when disabled.
-            if name == "bios" and not compile_bios:
-                continue
-            # Compile software package.
-            dst_dir  = os.path.join(self.software_dir, name)
-            makefile = os.path.join(src_dir, "Makefile")
-            if self.compile_software:
-                subprocess.check_call(["make", f"-j{cpu_count}", "-C", dst_dir, "-f", makefile])
+        # Select software packages (skip BIOS compilation when disabled).
+        packages = {name: src_dir for name, src_dir in self.software_packages
+            if not (name == "bios" and not compile_bios)}
+        dependencies = self._get_software_dependencies(packages)
+
+        # Only compile the packages whose inputs changed since their last compilation (or whose
+        # outputs are missing, ex: deleted or interrupted compilation): generated files are
+        # rewritten on each build, so make alone would recompile everything.
+        hashes  = self._get_software_hashes(packages, dependencies)
+        stamps  = {name: os.path.join(self.software_dir, name, "inputs.sha256") for name in packages}
+        changed = []
+        for name, src_dir in packages.items():
+            if not self._software_package_built(name, src_dir, stamps[name], hashes[name]):
+                changed.append(name)
+
+        # Generate top-level Makefile, compiling all software packages in parallel (in dependency
+        # order) under a single make jobserver.
+        makefile = []
+        makefile.append("all: " + " ".join(packages))
+        makefile.append("")
+        for name, src_dir in packages.items():
+            makefile.append(f"{name}: " + " ".join(dependencies[name]))
+            if name in changed:
+                dst_dir = os.path.join(self.software_dir, name)
+                makefile.append(f"\t$(MAKE) -C {_makefile_escape(dst_dir)} -f {_makefile_escape(os.path.join(src_dir, 'Makefile'))}")
+            makefile.append("")
+        makefile.append(".PHONY: all " + " ".join(packages))
+        write_to_file(os.path.join(self.software_dir, "Makefile"), "\n".join(makefile) + "\n", force_unix=True)
+
+        # Compile software packages.
+        if self.compile_software:
+            cpu_count = os.cpu_count()
+            subprocess.check_call(["make", f"-j{cpu_count}", "-C", self.software_dir])
+            for name in changed:
+                write_to_file(stamps[name], hashes[name])
 
     def _initialize_rom_software(self):
         # Get BIOS data from compiled BIOS binary.
@@ -340,6 +450,20 @@ class Builder:
         self.soc.init_rom(name="rom", contents=bios_data)
 
     def build(self, **kwargs):
+        # Record timings/memory of the build phases (and profile them with cProfile when enabled)
+        # to profile.json.
+        profiler = BuildProfiler(cprofile=self.profile)
+        profiler.start()
+        try:
+            vns = self._build(**kwargs)
+        finally:
+            profiler.stop()
+            _create_dir(self.output_dir)
+            profiler.write(os.path.join(self.output_dir, "profile.json"))
+        print(profiler.summary(), end="")
+        return vns
+
+    def _build(self, **kwargs):
         # Pass Output Directory to Platform.
         self.soc.platform.output_dir = self.output_dir
 
@@ -359,24 +483,22 @@ class Builder:
             self.soc.platform.sources[i] = (f, language, library)
 
         # Create Software directory.
-        # First check if software needs a full re-build and remove software dir if so.
+        # Software is rebuilt incrementally: objects depend on the generated headers they include
+        # and on the compiler flags (see common.mak).
         if with_bios:
-            software_full_rebuild  = False
-            software_variables_mak = os.path.join(self.generated_dir, "variables.mak")
-            if self.compile_software and os.path.exists(software_variables_mak):
-                old_variables_contents = open(software_variables_mak).read()
-                new_variables_contents = self._get_variables_contents()
-                software_full_rebuild  = (old_variables_contents != new_variables_contents)
-            _create_dir(self.software_dir, remove_if_exists=software_full_rebuild)
+            _create_dir(self.software_dir)
 
         # Finalize the SoC.
-        self.soc.finalize()
+        with profile_phase("finalize"):
+            self.soc.finalize()
 
         # Generate Software Includes/Files.
-        self._generate_includes(with_bios=with_bios)
+        with profile_phase("includes"):
+            self._generate_includes(with_bios=with_bios)
 
         # Export SoC Mapping.
-        self._generate_csr_map()
+        with profile_phase("csr_map"):
+            self._generate_csr_map()
 
         # Compile the BIOS when the SoC uses it.
         if self.soc.cpu_type is not None:
@@ -391,8 +513,9 @@ class Builder:
                 if use_bios:
                     self.soc.check_bios_requirements()
                     self._check_meson()
-                self._prepare_rom_software()
-                self._generate_rom_software(compile_bios=use_bios)
+                with profile_phase("software", python=False):
+                    self._prepare_rom_software()
+                    self._generate_rom_software(compile_bios=use_bios)
 
                 # Initialize Memories.
                 # Allow User Design to optionally initialize Memories through SoC.init_ram/init_rom.
@@ -411,16 +534,22 @@ class Builder:
 
         kwargs["build_backend"] = self.build_backend
 
+        # Only pass verilog_cache when enabled (opt-in, not supported by all toolchains).
+        if self.verilog_cache:
+            kwargs["verilog_cache"] = True
+
         # Build SoC and pass Verilog Name Space to do_exit.
-        vns = self.soc.build(build_dir=self.gateware_dir, **kwargs)
+        with profile_phase("gateware"):
+            vns = self.soc.build(build_dir=self.gateware_dir, **kwargs)
         self.soc.do_exit(vns=vns)
 
         # Generate SoC Documentation.
         if self.generate_doc:
             from litex.soc.doc import generate_docs
             doc_dir = os.path.join(self.output_dir, "doc")
-            generate_docs(self.soc, doc_dir)
-            os.system(f"sphinx-build -M html {doc_dir} {doc_dir}/_build")
+            with profile_phase("doc"):
+                generate_docs(self.soc, doc_dir)
+                os.system(f"sphinx-build -M html {doc_dir} {doc_dir}/_build")
 
         return vns
 
@@ -447,11 +576,13 @@ def builder_args(parser):
     builder_group.add_argument("--no-compile",            action="store_true", help="Disable Software and Gateware compilation.")
     builder_group.add_argument("--no-compile-software",   action="store_true", help="Disable Software compilation only.")
     builder_group.add_argument("--no-compile-gateware",   action="store_true", help="Disable Gateware compilation only.")
+    builder_group.add_argument("--verilog-cache",         action="store_true", help="Reuse the generated Verilog when the design is unchanged (.v.cache).")
     builder_group.add_argument("--soc-csv", "--csr-csv",  default=None,        help="Write SoC mapping to the specified CSV file.")
     builder_group.add_argument("--soc-json","--csr-json", default=None,        help="Write SoC mapping to the specified JSON file.")
     builder_group.add_argument("--soc-svd", "--csr-svd",  default=None,        help="Write SoC mapping to the specified SVD file.")
     builder_group.add_argument("--memory-x",              default=None,        help="Write SoC Memory Regions to the specified Memory-X file.")
     builder_group.add_argument("--doc",                   action="store_true", help="Generate SoC Documentation.")
+    builder_group.add_argument("--profile",               action="store_true", help="Profile the build with cProfile (to profile.prof/profile.txt, SoC elaboration excluded).")
     bios_group = parser.add_argument_group(title="BIOS options") # FIXME: Move?
     bios_group.add_argument("--bios-lto",     action="store_true", help="Enable BIOS LTO (Link Time Optimization) compilation.")
     bios_group.add_argument("--bios-format",  default="integer",   help="Select BIOS printf format.",  choices=["integer", "float", "double"])
@@ -467,11 +598,13 @@ def builder_argdict(args):
         "build_backend"    : args.build_backend,
         "compile_software" : (not args.no_compile) and (not args.no_compile_software),
         "compile_gateware" : (not args.no_compile) and (not args.no_compile_gateware),
+        "verilog_cache"    : args.verilog_cache,
         "csr_csv"          : args.soc_csv,
         "csr_json"         : args.soc_json,
         "csr_svd"          : args.soc_svd,
         "memory_x"         : args.memory_x,
         "generate_doc"     : args.doc,
+        "profile"          : args.profile,
         "bios_lto"         : args.bios_lto,
         "bios_format"      : args.bios_format,
         "bios_console"     : args.bios_console,
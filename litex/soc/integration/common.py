@@ -5,10 +5,11 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import sys
 import math
 import json
 import time
-import struct
+import array
 import datetime
 
 from migen import *
@@ -64,28 +65,41 @@ def get_mem_data(filename_or_regions, data_width=32, endianness="big", mem_size=
 
     # Fill data.
     bytes_per_data = data_width//8
-    data           = [0]*math.ceil(data_size/bytes_per_data)
+    data_bytes     = bytearray(math.ceil(data_size/bytes_per_data)*bytes_per_data)
     for filename, base in regions.items():
-        base = int(base, 16)
+        base = (int(base, 16) - offset)//bytes_per_data*bytes_per_data
+        size = os.path.getsize(filename)
+        end  = base + math.ceil(size/bytes_per_data)*bytes_per_data
+        if end > len(data_bytes):
+            data_bytes.extend(bytes(end - len(data_bytes)))
+        # Read file directly into the buffer and zero-pad last data word.
         with open(filename, "rb") as f:
-            i = 0
-            while True:
-                w = f.read(bytes_per_data)
-                if not w:
-                    break
-                if len(w) != bytes_per_data:
-                    for _ in range(len(w), bytes_per_data):
-                        w += b'\x00'
-                unpack_order = {
-                    "little": "<I",
-                    "big":    ">I"
-                }[endianness]
-                data[(base - offset)//bytes_per_data + i] = 0
-                for filled_data_width in range(0, data_width, 32):
-                    cur_byte = filled_data_width//8
-                    data[(base - offset)//bytes_per_data + i] |= (struct.unpack(unpack_order, w[cur_byte:cur_byte+4])[0] << filled_data_width)
-                i += 1
-    return data
+            f.readinto(memoryview(data_bytes)[base:base + size])
+        data_bytes[base + size:end] = bytes(end - base - size)
+    return get_mem_data_from_bytes(data_bytes, data_width, endianness)
+
+def get_mem_data_from_bytes(data_bytes, data_width=32, endianness="big"):
+    # Convert memory content to data_width words: each 32-bit chunk of a word is read with the given
+    # endianness, the first chunk being the least significant one.
+    assert data_width % 32 == 0
+    assert endianness in ["big", "little"]
+    assert len(data_bytes) % (data_width//8) == 0
+
+    # Read 32-bit chunks and convert them to little-endian.
+    chunks = array.array("I")
+    assert chunks.itemsize == 4
+    chunks.frombytes(data_bytes)
+    if endianness != sys.byteorder:
+        chunks.byteswap()
+    if data_width == 32:
+        return chunks.tolist()
+
+    # Assemble wider words from their little-endian chunks.
+    if sys.byteorder != "little":
+        chunks.byteswap()
+    buf = chunks.tobytes()
+    n   = data_width//8
+    return [int.from_bytes(buf[i:i + n], "little") for i in range(0, len(buf), n)]
 
 def get_boot_address(filename_or_regions, offset=0):
     # Create memory regions.
@@ -1971,6 +1971,7 @@ class LiteXSoC(SoC):
         arp_entries             = 1,
         udp_port                = 1234,
         buffer_depth            = 16,
+        with_burst              = False,
         with_ip_broadcast       = True,
         with_timing_constraints = True,
         with_ethmac             = False,
@@ -2018,7 +2019,11 @@ class LiteXSoC(SoC):
 
         # Etherbone
         self.check_if_exists(name)
-        etherbone = LiteEthEtherbone(ethcore.udp, udp_port, buffer_depth=buffer_depth, cd=etherbone_cd)
+        etherbone = LiteEthEtherbone(ethcore.udp, udp_port,
+            buffer_depth = buffer_depth,
+            cd           = etherbone_cd,
+            with_burst   = with_burst,
+        )
         self.add_module(name=name, module=etherbone)
         self.bus.add_master(name=name, master=etherbone.wishbone.bus)
 
@@ -35,6 +35,7 @@ CSR and memory attributes and return their list.
 """
 
 from enum import IntEnum
+from contextlib import contextmanager
 
 from migen import *
 from migen.util.misc import xdir
@@ -487,8 +488,7 @@ def _sort_gathered_items(items):
 
     # Eventually extend with fixed items:
     for item in fixed_items:
-        if item.n > items_length:
-            items_length = (item.n + 1)
+        items_length = max(items_length, item.n + 1)
 
     # Create list of sorted items:
     # ----------------------------
@@ -504,13 +504,10 @@ def _sort_gathered_items(items):
             raise ValueError(f"CSR conflict on location {item.n} between {csr0} and {csr1}.")
         sorted_items[item.n] = item
 
-    # Fill variable items in empty locations.
-    while len(variable_items):
-        item = variable_items.pop(0)
-        for i in range(items_length):
-            if sorted_items[i] is None:
-                sorted_items[i] = item
-                break
+    # Fill variable items in empty locations (in a single pass over the locations).
+    free_locations = (i for i in range(items_length) if sorted_items[i] is None)
+    for item, i in zip(variable_items, free_locations):
+        sorted_items[i] = item
 
     # Fill remaining location with reserved CSR.
     for i in range(items_length):
@@ -524,26 +521,99 @@ def _sort_gathered_items(items):
     # Return.
     return sorted_items
 
-def _make_gatherer(method, cls, prefix_cb):
-    def gatherer(self, sort=False):
-        try:
-            exclude = self.autocsr_exclude
-        except AttributeError:
-            exclude = {}
+# AutoCSR Collection -------------------------------------------------------------------------------
+
+# The memories, CSRs and constants of an AutoCSR module are gathered together in a single traversal
+# of its submodules. Inside an autocsr_collection() block, the result of each module is also
+# memoized so that collecting the different items of a module (or of modules sharing submodules)
+# does not traverse the same modules again: modules must not be modified inside the block.
+
+_gatherers = [
+    # Method,         Items class,  Prefix callback.
+    ("get_memories",  Memory,       memprefix),
+    ("get_csrs",      _CSRBase,     csrprefix),
+    ("get_constants", CSRConstant,  csrprefix),
+]
+_gatherer_memo = None
+
+@contextmanager
+def autocsr_collection():
+    global _gatherer_memo
+    if _gatherer_memo is not None:
+        yield
+        return
+    _gatherer_memo = {}
+    try:
+        yield
+    finally:
+        _gatherer_memo = None
+
+_gatherer_types = {}
+
+def _gatherer_type(t):
+    # Return how the items of the objects of type t are gathered: as an item (index of the item
+    # class), as an AutoCSR module ("autocsr"), through their own gatherers ("methods") or not
+    # at all (None). Types with a __getattr__ are always checked for gatherers at instance level.
+    try:
+        return _gatherer_types[t]
+    except KeyError:
+        pass
+    kind = None
+    for i, (method, cls, prefix_cb) in enumerate(_gatherers):
+        if issubclass(t, cls):
+            kind = i
+            break
+    else:
+        if issubclass(t, AutoCSR) and all(getattr(t, method) is getattr(AutoCSR, method)
+            for method, _, _ in _gatherers):
+            kind = "autocsr"
+        elif hasattr(t, "__getattr__") or any(hasattr(t, method) for method, _, _ in _gatherers):
+            kind = "methods"
+    _gatherer_types[t] = kind
+    return kind
+
+def _gather(self):
+    # Return the (memories, CSRs, constants) lists of an AutoCSR module, sorted by DUID.
+    if _gatherer_memo is not None:
         try:
-            prefixed = self.__prefixed
-        except AttributeError:
-            prefixed = self.__prefixed = set()
-        r = []
-        for k, v in xdir(self, True):
-            if k not in exclude:
-                if isinstance(v, cls):
-                    r.append(v)
-                elif hasattr(v, method) and callable(getattr(v, method)):
-                    items = getattr(v, method)()
-                    prefix_cb(k + "_", items, prefixed)
-                    r += items
-        r = sorted(r, key=lambda x: x.duid)
+            return _gatherer_memo[id(self)][1]
+        except KeyError:
+            pass
+    try:
+        exclude = self.autocsr_exclude
+    except AttributeError:
+        exclude = {}
+    try:
+        prefixed = self.__prefixed
+    except AttributeError:
+        prefixed = self.__prefixed = set()
+    r = ([], [], [])
+    for k, v in xdir(self, True):
+        kind = _gatherer_type(type(v))
+        if kind is None or k in exclude:
+            continue
+        if kind == "autocsr":
+            for items, gathered, (method, cls, prefix_cb) in zip(r, _gather(v), _gatherers):
+                prefix_cb(k + "_", gathered, prefixed)
+                items.extend(gathered)
+        elif kind == "methods":
+            for items, (method, cls, prefix_cb) in zip(r, _gatherers):
+                if hasattr(v, method) and callable(getattr(v, method)):
+                    gathered = getattr(v, method)()
+                    prefix_cb(k + "_", gathered, prefixed)
+                    items.extend(gathered)
+        else:
+            r[kind].append(v)
+    r = tuple(sorted(items, key=lambda x: x.duid) for items in r)
+    if _gatherer_memo is not None:
+        # Keep a reference on the module to ensure its id is not reused.
+        _gatherer_memo[id(self)] = (self, r)
+    return r
+
+def _make_gatherer(method):
+    index = [m for m, _, _ in _gatherers].index(method)
+    def gatherer(self, sort=False):
+        r = list(_gather(self)[index])
         if sort:
             r = _sort_gathered_items(r)
         return r
@@ -560,9 +630,9 @@ class AutoCSR:
     they will be called by the``AutoCSR`` methods and their CSR and memories added to the lists returned,
     with the child objects' names as prefixes.
     """
-    get_memories  = _make_gatherer(method="get_memories",  cls=Memory,      prefix_cb=memprefix)
-    get_csrs      = _make_gatherer(method="get_csrs",      cls=_CSRBase,    prefix_cb=csrprefix)
-    get_constants = _make_gatherer(method="get_constants", cls=CSRConstant, prefix_cb=csrprefix)
+    get_memories  = _make_gatherer(method="get_memories")
+    get_csrs      = _make_gatherer(method="get_csrs")
+    get_constants = _make_gatherer(method="get_constants")
 
 
 class GenericBank(Module):
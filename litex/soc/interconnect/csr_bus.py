@@ -246,62 +246,64 @@ class CSRBankArray(Module):
         self.srams     = []
         self.constants = []
 
-        for name, obj in xdir(self.source, True):
-
-            # Collect CSR Registers.
-            # ---------------------
-            csrs = []
-            if hasattr(obj, "get_csrs"): # FIXME: Simplify.
-                if "sort" in obj.get_csrs.__code__.co_varnames:
-                    csrs = obj.get_csrs(sort=True)
-                else:
-                    csrs = obj.get_csrs()
-
-            # Collect CSR Memories.
-            # ---------------------
-            if hasattr(obj, "get_memories"):
-                memories = obj.get_memories()
-                for memory in memories:
-                    if isinstance(memory, tuple):
-                        read_only, memory = memory
+        # Collect the CSRs/Memories/Constants of all the objects in a single traversal.
+        with csr.autocsr_collection():
+            for name, obj in xdir(self.source, True):
+
+                # Collect CSR Registers.
+                # ---------------------
+                csrs = []
+                if hasattr(obj, "get_csrs"): # FIXME: Simplify.
+                    if "sort" in obj.get_csrs.__code__.co_varnames:
+                        csrs = obj.get_csrs(sort=True)
                     else:
-                        read_only = False
-                    mapaddr = self.address_map(name, memory)
+                        csrs = obj.get_csrs()
+
+                # Collect CSR Memories.
+                # ---------------------
+                if hasattr(obj, "get_memories"):
+                    memories = obj.get_memories()
+                    for memory in memories:
+                        if isinstance(memory, tuple):
+                            read_only, memory = memory
+                        else:
+                            read_only = False
+                        mapaddr = self.address_map(name, memory)
+                        if mapaddr is None:
+                            continue
+                        sram_bus = Interface(*ifargs, **ifkwargs)
+                        mmap = SRAM(memory, mapaddr,
+                            read_only = read_only,
+                            bus       = sram_bus,
+                            paging    = self.paging)
+                        self.submodules += mmap
+                        csrs += mmap.get_csrs()
+                        self.srams.append((name, memory, mapaddr, mmap))
+
+                # Collect CSR Constants.
+                # ----------------------
+                if hasattr(obj, "get_constants"): # FIXME: Simplify.
+                    if "sort" in obj.get_constants.__code__.co_varnames:
+                        for constant in obj.get_constants(sort=True):
+                            self.constants.append((name, constant))
+                    else:
+                        for constant in obj.get_constants():
+                            self.constants.append((name, constant))
+
+
+                # Create CSRBank with CSRs found.
+                # -------------------------------
+                if csrs:
+                    mapaddr = self.address_map(name, None)
                     if mapaddr is None:
                         continue
-                    sram_bus = Interface(*ifargs, **ifkwargs)
-                    mmap = SRAM(memory, mapaddr,
-                        read_only = read_only,
-                        bus       = sram_bus,
-                        paging    = self.paging)
-                    self.submodules += mmap
-                    csrs += mmap.get_csrs()
-                    self.srams.append((name, memory, mapaddr, mmap))
-
-            # Collect CSR Constants.
-            # ----------------------
-            if hasattr(obj, "get_constants"): # FIXME: Simplify.
-                if "sort" in obj.get_constants.__code__.co_varnames:
-                    for constant in obj.get_constants(sort=True):
-                        self.constants.append((name, constant))
-                else:
-                    for constant in obj.get_constants():
-                        self.constants.append((name, constant))
-
-
-            # Create CSRBank with CSRs found.
-            # -------------------------------
-            if csrs:
-                mapaddr = self.address_map(name, None)
-                if mapaddr is None:
-                    continue
-                bank_bus = Interface(*ifargs, **ifkwargs)
-                rmap = CSRBank(csrs, mapaddr,
-                    bus                = bank_bus,
-                    paging             = self.paging,
-                    ordering           = self.ordering)
-                self.submodules += rmap
-                self.banks.append((name, csrs, mapaddr, rmap))
+                    bank_bus = Interface(*ifargs, **ifkwargs)
+                    rmap = CSRBank(csrs, mapaddr,
+                        bus                = bank_bus,
+                        paging             = self.paging,
+                        ordering           = self.ordering)
+                    self.submodules += rmap
+                    self.banks.append((name, csrs, mapaddr, rmap))
 
     def get_rmaps(self):
         return [rmap for name, csrs, mapaddr, rmap in self.banks]
@@ -76,3 +76,12 @@ endef
 define assemble
 $(CC) -c $(CFLAGS) -o $@ $<
 endef
+
+# Compiler flags, only rewritten when they change: objects depending on .compile_flags are rebuilt
+# when the CPU/toolchain configuration changes (dependencies on headers are in the *.d files).
+COMPILE_FLAGS = $(CC_normal) $(CX_normal) $(CFLAGS) $(CXXFLAGS)
+
+.compile_flags: .FORCE
+	@echo '$(COMPILE_FLAGS)' | cmp -s - $@ || echo '$(COMPILE_FLAGS)' > $@
+
+.FORCE:
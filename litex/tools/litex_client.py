@@ -12,17 +12,49 @@ import time
 import threading
 import argparse
 import socket
+import struct
+import collections
 
-from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord
-from litex.tools.remote.etherbone import EtherboneReads, EtherboneWrites
 from litex.tools.remote.etherbone import EtherboneIPC
-from litex.tools.remote.csr_builder import CSRBuilder
+from litex.tools.remote.etherbone import encode_etherbone_reads, encode_etherbone_writes, decode_etherbone_writes
+from litex.tools.remote.etherbone import unpack_words
+from litex.tools.remote.csr_builder import CSRBuilder, swap_word_bytes, block_bursts, pad_block
+
+# Remote Future ------------------------------------------------------------------------------------
+
+class RemoteFuture:
+    """Result of an asynchronous access, available once its response has been received.
+
+    Responses are received on demand: calling ``result`` on a pending future receives responses
+    until its own one is available."""
+    def __init__(self, client, value=None, done=False):
+        self.client = client
+        self.value  = value
+        self._done  = done
+
+    def done(self):
+        return self._done
+
+    def set_result(self, value):
+        self.value = value
+        self._done = True
+
+    def result(self):
+        if not self._done:
+            self.client.wait(self)
+        return self.value
 
 # Remote Client ------------------------------------------------------------------------------------
 
 class RemoteClient(EtherboneIPC, CSRBuilder):
+    """Etherbone client connecting to a litex_server.
+
+    Accesses are pipelined: up to ``window`` reads can be in flight, each tagged with a unique
+    ``base_ret_addr`` that the server returns in its response. ``read_async``/``write_async``
+    return RemoteFutures (``gather`` collects their results), ``read``/``write`` are their blocking
+    versions."""
     def __init__(self, host="localhost", port=1234, base_address=0, csr_csv=None, csr_data_width=None,
-        csr_bus_address_width=None, debug=False):
+        csr_bus_address_width=None, debug=False, window=64):
         # If csr_csv set to None and local csr.csv file exists, use it.
         if csr_csv is None and os.path.exists("csr.csv"):
             csr_csv = "csr.csv"
@@ -41,6 +73,10 @@ class RemoteClient(EtherboneIPC, CSRBuilder):
         self.debug        = debug
         self.binded       = False
         self.base_address = base_address if base_address is not None else 0
+        self.window       = max(window, 1)
+        self.lock         = threading.RLock()
+        self.pending      = collections.OrderedDict() # Tag -> (Future, Addr, Length) of in-flight reads.
+        self.tag          = 0
 
     def _receive_server_info(self):
         info = str(self.socket.recv(128))
@@ -53,13 +89,18 @@ class RemoteClient(EtherboneIPC, CSRBuilder):
         if self.binded:
             return
         self.socket = socket.create_connection((self.host, self.port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.socket.settimeout(2.0)
         self._receive_server_info()
+        self.pending.clear()
         self.binded = True
 
     def close(self):
         if not self.binded:
             return
+        if getattr(self, "csr_cache", None) is not None:
+            self.csr_cache.flush()
+        self.flush()
         self.socket.close()
         del self.socket
         self.binded = False
@@ -73,64 +114,141 @@ class RemoteClient(EtherboneIPC, CSRBuilder):
         except (TimeoutError, socket.error):
             pass
 
-    def read(self, addr, length=None, burst="incr"):
-        length_int = 1 if length is None else length
-        addr_size  = self.csr_bus_address_width // 8
-        # Prepare packet
-        record = EtherboneRecord(addr_size)
-        incr = (burst == "incr")
-        record.reads  = EtherboneReads(
-            addr_size = addr_size,
-            addrs     = [self.base_address + addr + 4*incr*j for j in range(length_int)]
-        )
-        record.rcount = len(record.reads)
+    # Pipelined Accesses ---------------------------------------------------------------------------
 
-        # Send packet
-        packet = EtherbonePacket(self.csr_bus_address_width)
-        packet.records = [record]
-        packet.encode()
-        self.send_packet(self.socket, packet)
+    def _next_tag(self):
+        # Tags are returned by the server in the response's base address, 0 is kept for servers not
+        # returning them (responses are then matched in order).
+        self.tag = self.tag % (2**self.csr_bus_address_width - 1) + 1
+        return self.tag
 
-        # Receive response
-        response = self.receive_packet(self.socket, addr_size)
+    def _receive_response(self):
+        addr_size = self.csr_bus_address_width // 8
+        response  = self.receive_packet(self.socket, addr_size)
         if response == 0:
-            # Handle error by returning default values
+            # Handle error by returning default values for all in-flight reads.
             if self.debug:
                 print("Timeout occurred during read. Returning default values.")
             self.clear_socket_buffer()
-            return 0 if length is None else [0] * length_int
+            for future, addr, length, raw in self.pending.values():
+                if raw:
+                    future.set_result(bytes(4*length))
+                else:
+                    future.set_result(0 if length is None else [0] * length)
+            self.pending.clear()
+            return
 
-        packet = EtherbonePacket(
-            addr_width = self.csr_bus_address_width,
-            init       = response
-        )
-        packet.decode()
-        datas = packet.records.pop().writes.get_datas()
+        tag, datas = decode_etherbone_writes(response, addr_size)
+        if tag not in self.pending:
+            if tag != 0:
+                # Late response to a read already resolved (after a timeout): drop it.
+                if self.debug:
+                    print(f"WARNING: dropping response with unknown tag 0x{tag:08x}.")
+                return
+            # Untagged response: match it with the oldest in-flight read.
+            if not self.pending:
+                return
+            tag = next(iter(self.pending))
+        future, addr, length, raw = self.pending.pop(tag)
+        if raw:
+            future.set_result(datas)
+            return
+        datas = unpack_words(datas).tolist()
         if self.debug:
             for i, data in enumerate(datas):
                 print("read 0x{:08x} @ 0x{:08x}".format(data, self.base_address + addr + 4*i))
-        return datas[0] if length is None else datas
+        future.set_result(datas[0] if length is None else datas)
 
-    def write(self, addr, datas):
-        datas = datas if isinstance(datas, list) else [datas]
-        addr_size = self.csr_bus_address_width // 8
-        record = EtherboneRecord(addr_size)
-        record.writes = EtherboneWrites(
-            base_addr = self.base_address + addr,
-            addr_size = addr_size,
-            datas     = [d for d in datas]
-        )
-        record.wcount = len(record.writes)
+    def wait(self, future):
+        with self.lock:
+            while not future.done():
+                self._receive_response()
+
+    def flush(self):
+        with self.lock:
+            while self.pending:
+                self._receive_response()
+
+    def gather(self, *futures):
+        return [future.result() for future in futures]
 
-        packet = EtherbonePacket(self.csr_bus_address_width)
-        packet.records = [record]
-        packet.encode()
-        self.send_packet(self.socket, packet)
+    def _read_async(self, addr, length=None, burst="incr", raw=False):
+        length_int = 1 if length is None else length
+        with self.lock:
+            # Limit the number of in-flight reads.
+            while len(self.pending) >= self.window:
+                self._receive_response()
+
+            # Send packet
+            tag = self._next_tag()
+            self.socket.sendall(encode_etherbone_reads(
+                addr_width    = self.csr_bus_address_width,
+                base_ret_addr = tag,
+                addr          = self.base_address + addr,
+                length        = length_int,
+                burst         = burst))
+
+            future = RemoteFuture(self)
+            self.pending[tag] = (future, addr, length, raw)
+            return future
+
+    def read_async(self, addr, length=None, burst="incr"):
+        return self._read_async(addr, length, burst)
+
+    def write_async(self, addr, datas):
+        datas = datas if isinstance(datas, list) else [datas]
+        packet = encode_etherbone_writes(
+            addr_width = self.csr_bus_address_width,
+            base_addr  = self.base_address + addr,
+            datas      = datas)
+        with self.lock:
+            self.socket.sendall(packet)
 
         if self.debug:
             for i, data in enumerate(datas):
                 print("write 0x{:08x} @ 0x{:08x}".format(data, self.base_address + addr + 4*i))
 
+        # Writes are not acknowledged: complete once sent.
+        return RemoteFuture(self, done=True)
+
+    # Block Accesses -------------------------------------------------------------------------------
+
+    def read_block(self, addr, nbytes, progress=None):
+        nwords = (nbytes + 3)//4
+        data   = bytearray(4*nwords)
+        bursts = collections.deque()
+        def complete(wait):
+            while bursts and (wait or bursts[0][2].done()):
+                offset, length, future = bursts.popleft()
+                data[4*offset:4*(offset + length)] = swap_word_bytes(future.result())
+                if progress is not None:
+                    progress(min(4*(offset + length), nbytes))
+        for burst_addr, offset, length in block_bursts(addr, nwords, self.max_burst_length):
+            bursts.append((offset, length, self._read_async(burst_addr, length, raw=True)))
+            complete(wait=False)
+        complete(wait=True)
+        return bytes(memoryview(data)[:nbytes])
+
+    def write_block(self, addr, buffer, progress=None):
+        data = swap_word_bytes(pad_block(buffer))
+        for burst_addr, offset, length in block_bursts(addr, len(data)//4, self.max_burst_length):
+            packet = encode_etherbone_writes(
+                addr_width = self.csr_bus_address_width,
+                base_addr  = self.base_address + burst_addr,
+                datas      = data[4*offset:4*(offset + length)])
+            with self.lock:
+                self.socket.sendall(packet)
+            if progress is not None:
+                progress(min(4*(offset + length), len(buffer)))
+
+    # Blocking Accesses ----------------------------------------------------------------------------
+
+    def read(self, addr, length=None, burst="incr"):
+        return self.read_async(addr, length, burst).result()
+
+    def write(self, addr, datas):
+        self.write_async(addr, datas)
+
 # Utils --------------------------------------------------------------------------------------------
 
 def reg2addr(host, csr_csv, reg):
@@ -160,7 +278,7 @@ def dump_registers(host, csr_csv, port, filter=None, binary=False):
     bus = RemoteClient(host=host, csr_csv=csr_csv, port=port)
     bus.open()
 
-    for name, register in bus.regs.__dict__.items():
+    for name, register in bus.regs.d.items():
         if (filter is None) or filter in name:
             register_value = {
                 True  : f"0b{register.read():032b}",
@@ -170,22 +288,46 @@ def dump_registers(host, csr_csv, port, filter=None, binary=False):
 
     bus.close()
 
+class TransferProgress:
+    """Progress/throughput report of a block transfer (called with the number of bytes done)."""
+    def __init__(self, desc, total, interval=0.25):
+        self.desc     = desc
+        self.total    = total
+        self.interval = interval
+        self.start    = time.time()
+        self.last     = 0
+
+    def __call__(self, done):
+        now = time.time()
+        if (now - self.last) < self.interval and done != self.total:
+            return
+        self.last = now
+        elapsed   = max(now - self.start, 1e-6)
+        percent   = 100*done/self.total if self.total else 100
+        print("\r{}: {}/{} bytes ({:3.0f}%) {:.2f} KB/s".format(
+            self.desc, done, self.total, percent, done/elapsed/1024), end="", flush=True)
+        if done == self.total:
+            print(" in {:.2f}s".format(elapsed))
+
 def read_memory(host, csr_csv, port, addr, length, binary=False, file=None, endianness="little"):
     bus = RemoteClient(host=host, csr_csv=csr_csv, port=port)
     bus.open()
 
+    length = 4*(length//4)
     if file:
         # Read from memory and write to file in binary mode
+        data = bus.read_block(addr, length, progress=TransferProgress("Read", length))
+        if endianness == "big":
+            data = swap_word_bytes(data)
         with open(file, 'wb') as f:
-            for offset in range(length // 4):
-                data = bus.read(addr + 4 * offset)
-                f.write(data.to_bytes(4, byteorder=endianness))
+            f.write(data)
     else:
         # Print to console
-        for offset in range(length // 4):
+        data = bus.read_block(addr, length)
+        for offset, (value,) in enumerate(struct.iter_unpack("<I", data)):
             register_value = {
-                True  : f"0b{bus.read(addr + 4 * offset):032b}",
-                False : f"0x{bus.read(addr + 4 * offset):08x}",
+                True  : f"0b{value:032b}",
+                False : f"0x{value:08x}",
             }[binary]
             print(f"0x{addr + 4 * offset:08x} : {register_value}")
 
@@ -202,10 +344,13 @@ def write_memory(host, csr_csv, port, addr, data, file=None, length=None, endian
                 data = f.read(length)
             else:
                 data = f.read()
-            # Write data in 32-bit chunks
-            for i in range(0, len(data), 4):
-                word = int.from_bytes(data[i:i + 4], byteorder=endianness)
-                bus.write(addr + i, word)
+        if endianness == "big":
+            # Partial last word is right-aligned in big-endian.
+            remaining = len(data) % 4
+            if remaining:
+                data = data[:-remaining] + bytes(4 - remaining) + data[-remaining:]
+            data = swap_word_bytes(data)
+        bus.write_block(addr, data, progress=TransferProgress("Write", len(data)))
     else:
         # Write single data value to memory
         bus.write(addr, data)
@@ -300,16 +445,7 @@ def run_gui(host, csr_csv, port):
         if length <= 0:
             return []
 
-        aligned_len = (length + 3) & ~3  # Round up to nearest multiple of 4
-        words       = bus.read(base, aligned_len // 4, burst="incr")
-        out         = []
-
-        for word in words:
-            for byte_idx in range(4):
-                byte_val = (word >> (8 * byte_idx)) & 0xff
-                out.append(byte_val)
-
-        return out[:length]
+        return list(bus.read_block(base, length))
 
     def _printable_chr(bval):
         c = chr(bval)
@@ -363,13 +499,13 @@ def run_gui(host, csr_csv, port):
         dpg.add_text("CSR Registers:")
         with dpg.filter_set(id="csr_filter"):
             def reg_callback(tag, data):
-                for name, reg in  bus.regs.__dict__.items():
+                for name, reg in  bus.regs.d.items():
                     if (tag == name):
                         try:
                             reg.write(int(data, 0))
                         except:
                             pass
-            for name, reg in bus.regs.__dict__.items():
+            for name, reg in bus.regs.d.items():
                 dpg.add_input_text(
                     indent     = 16,
                     label      = f"0x{reg.addr:08x} - {name}",
@@ -563,7 +699,7 @@ def run_gui(host, csr_csv, port):
             now = time.time()
 
             # CSR Update.
-            for name, reg in bus.regs.__dict__.items():
+            for name, reg in bus.regs.d.items():
                 value = reg.read()
                 dpg.set_value(item=name, value=f"0x{value:x}")
 
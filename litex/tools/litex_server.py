@@ -12,11 +12,15 @@ import argparse
 
 import os
 import sys
-import socket
 import time
+import struct
+import socket
+import asyncio
 import threading
+import collections
 
-from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord, EtherboneWrites
+from litex.tools.remote.etherbone import etherbone_magic
+from litex.tools.remote.etherbone import encode_etherbone_packet, encode_etherbone_record, decode_etherbone_packet
 from litex.tools.remote.etherbone import EtherboneIPC
 
 # Read Merger --------------------------------------------------------------------------------------
@@ -67,15 +71,78 @@ def _read_merger(addrs, max_length=256, bursts=["incr", "fixed"]):
             burst_type   = "incr"
     yield (burst_base, burst_length, burst_type)
 
+# Remote Server Client -----------------------------------------------------------------------------
+
+class RemoteServerClient:
+    """Server side state of a connected client: queued records, priority and counters."""
+    def __init__(self, name, writer, priority=0):
+        self.name     = name
+        self.writer   = writer
+        self.priority = priority
+        self.queue    = collections.deque() # (Arrival time, Record) of the records to serve.
+        self.closed   = False
+
+        # Counters.
+        self.start_time    = time.perf_counter()
+        self.records       = 0
+        self.reads         = 0
+        self.writes        = 0
+        self.latency_total = 0.0
+        self.latency_max   = 0.0
+
+    def update(self, record, latency):
+        self.records       += 1
+        self.reads         += record.rcount
+        self.writes        += record.wcount
+        self.latency_total += latency
+        self.latency_max    = max(self.latency_max, latency)
+
+    def stats(self):
+        duration = time.perf_counter() - self.start_time
+        return {
+            "client"         : self.name,
+            "priority"       : self.priority,
+            "queued"         : len(self.queue),
+            "records"        : self.records,
+            "reads"          : self.reads,
+            "writes"         : self.writes,
+            "accesses/s"     : (self.reads + self.writes)/duration if duration else 0.0,
+            "latency_avg_ms" : 1e3*self.latency_total/self.records if self.records else 0.0,
+            "latency_max_ms" : 1e3*self.latency_max,
+        }
+
+    def __repr__(self):
+        return ("{client}: {records} records, {reads} reads, {writes} writes, {accesses/s:.0f} accesses/s, "
+            "latency avg/max: {latency_avg_ms:.3f}/{latency_max_ms:.3f}ms").format(**self.stats())
+
 # Remote Server ------------------------------------------------------------------------------------
 
 class RemoteServer(EtherboneIPC):
-    def __init__(self, comm, bind_ip, bind_port=1234, addr_width=32):
+    """Etherbone TCP server sharing a comm bridge between clients.
+
+    Clients are handled by a single asyncio event loop that queues their records in per-client
+    queues. A scheduler thread (comm accesses being blocking) waits for queued records and serves
+    them on the comm, either in round-robin order ("round-robin") or by decreasing client priority
+    with round-robin between clients of equal priority ("priority").
+
+    The records queued when the comm becomes available are served together, in scheduling order,
+    with their consecutive accesses coalesced in the largest bursts supported by the comm (as
+    advertised by its read_burst_length/read_bursts/write_burst_length attributes). To bound the
+    latency seen by the other clients, a batch is limited to about one read burst of accesses.
+    """
+    def __init__(self, comm, bind_ip, bind_port=1234, addr_width=32, scheduling="round-robin", priorities={}):
+        assert scheduling in ["round-robin", "priority"]
         self.comm       = comm
         self.bind_ip    = bind_ip
         self.bind_port  = bind_port
-        self.lock       = False
+        self.lock       = threading.Lock()
         self.addr_width = addr_width
+        self.scheduling = scheduling
+        self.priorities = priorities # Client IP address -> Priority (higher first, default 0).
+        self.clients    = []         # Connected clients, in round-robin order.
+        self.requests   = threading.Condition()
+        self.running    = False
+        self.loop       = None
 
     def open(self):
         if hasattr(self, "socket"):
@@ -91,89 +158,216 @@ class RemoteServer(EtherboneIPC):
         self.comm.open()
 
     def close(self):
+        if self.loop is not None:
+            with self.requests:
+                self.running = False
+                self.requests.notify()
+            self.loop.call_soon_threadsafe(self.serve_task.cancel)
+            self.serve_thread.join()
+            self.schedule_thread.join()
+            self.loop = None
         self.comm.close()
         if not hasattr(self, "socket"):
             return
         self.socket.close()
         del self.socket
 
-    def _send_server_info(self, client_socket):
+    def stats(self):
+        """Returns the counters of the connected clients."""
+        with self.requests:
+            return [client.stats() for client in self.clients]
+
+    def _send_server_info(self, writer):
         # FIXME: Formalize info/improve.
         info = []
         info.append(f"{self.comm.__class__.__name__}")
         info.append(f"{self.bind_ip}")
         info.append(f"{self.bind_port}")
         info = ":".join(info)
-        client_socket.sendall(bytes(info, "UTF-8"))
-
-    def _serve_thread(self):
+        writer.write(bytes(info, "UTF-8"))
+
+    def _serve_records(self, records):
+        # Serve the records in order, coalescing their consecutive accesses in bursts, and return
+        # the response of each record (None for records without reads).
+        read_burst_length  = getattr(self.comm, "read_burst_length",  1)
+        read_bursts        = getattr(self.comm, "read_bursts",        ["incr"])
+        write_burst_length = getattr(self.comm, "write_burst_length", 255)
+
+        reads       = [] # Addresses of the pending reads.
+        read_datas  = [] # Datas of the served reads, in order.
+        write_addr  = 0
+        write_datas = [] # Datas of the pending write burst.
+
+        def flush_reads():
+            for addr, length, burst in _read_merger(reads,
+                max_length  = read_burst_length,
+                bursts      = read_bursts):
+                read_datas.extend(self.comm.read(addr, length, burst))
+            reads.clear()
+
+        def flush_writes():
+            if write_datas:
+                self.comm.write(write_addr, write_datas[:])
+                write_datas.clear()
+
+        # Serve the records (with hardware lock/reservation).
+        with self.lock:
+            for record in records:
+                # Handle Etherbone writes.
+                if record.wcount:
+                    if reads:
+                        flush_reads()
+                    addr  = record.base_addr
+                    datas = record.datas.tolist()
+                    while datas:
+                        # Start a new burst if not contiguous with the pending one or if full.
+                        if (addr != write_addr + 4*len(write_datas)) or (len(write_datas) == write_burst_length):
+                            flush_writes()
+                            write_addr = addr
+                        length = min(len(datas), write_burst_length - len(write_datas))
+                        write_datas.extend(datas[:length])
+                        datas  = datas[length:]
+                        addr  += 4*length
+
+                # Handle Etherbone reads.
+                if record.rcount:
+                    flush_writes()
+                    reads.extend(record.addrs.tolist())
+            flush_writes()
+            if reads:
+                flush_reads()
+
+        # Return the read datas to the requested base address (used by clients to match
+        # responses with their in-flight requests).
+        responses = []
+        offset    = 0
+        for record in records:
+            response = None
+            if record.rcount:
+                response = encode_etherbone_packet(self.addr_width, [encode_etherbone_record(
+                    addr_size = self.addr_width // 8,
+                    base_addr = record.base_ret_addr,
+                    datas     = read_datas[offset:offset + record.rcount])])
+                offset += record.rcount
+            responses.append(response)
+        return responses
+
+    # Scheduling -----------------------------------------------------------------------------------
+
+    def _next_client(self):
+        # Must be called with the requests condition held.
+        clients = [client for client in self.clients if client.queue]
+        if not clients:
+            return None
+        if self.scheduling == "priority":
+            priority = max(client.priority for client in clients)
+            clients  = [client for client in clients if client.priority == priority]
+        # Move the selected client to the end of the round-robin order.
+        client = clients[0]
+        self.clients.remove(client)
+        self.clients.append(client)
+        return client
+
+    def _send_response(self, client, response):
+        # Called from the event loop.
+        if not client.closed:
+            client.writer.write(response)
+
+    def _schedule(self):
         while True:
-            client_socket, addr = self.socket.accept()
-            self._send_server_info(client_socket)
-            print("Connected with " + addr[0] + ":" + str(addr[1]))
+            # Wait for the next records to serve.
+            with self.requests:
+                client = self._next_client()
+                while client is None and self.running:
+                    self.requests.wait()
+                    client = self._next_client()
+                if not self.running:
+                    return
+                batch    = []
+                accesses = 0
+                while client is not None and accesses < getattr(self.comm, "read_burst_length", 1):
+                    arrival, record = client.queue.popleft()
+                    batch.append((client, arrival, record))
+                    accesses += record.wcount + record.rcount
+                    client    = self._next_client()
+
+            # Serve them.
             try:
-                # Serve Etherbone reads/writes.
-                while True:
-                    # Receive packet.
-                    try:
-                        packet = self.receive_packet(client_socket, self.addr_width // 8)
-                        if packet == 0:
-                            break
-                    except:
-                        break
-                    # Decode Packet.
-                    packet = EtherbonePacket(self.addr_width, packet)
-                    packet.decode()
-
-                    # Get Packet's Record.
-                    record = packet.records.pop()
-
-                    # Hardware lock/reservation.
-                    while self.lock:
-                        time.sleep(0.01)
-                    self.lock = True
-
-                    # Handle Etherbone writes.
-                    if record.writes != None:
-                        self.comm.write(record.writes.base_addr, record.writes.get_datas())
-
-                    # Handle Etherbone reads.
-                    if record.reads != None:
-                        max_length = {
-                            "CommUART": 256,
-                            "CommUDP":    1,
-                        }.get(self.comm.__class__.__name__, 1)
-                        bursts = {
-                            "CommUART": ["incr", "fixed"]
-                        }.get(self.comm.__class__.__name__, ["incr"])
-                        reads = []
-                        for addr, length, burst in _read_merger(record.reads.get_addrs(),
-                            max_length  = max_length,
-                            bursts      = bursts):
-                            reads += self.comm.read(addr, length, burst)
-
-                        addr_size = self.addr_width // 8
-                        record = EtherboneRecord(addr_size)
-                        record.writes = EtherboneWrites(addr_size=addr_size, datas=reads)
-                        record.wcount = len(record.writes)
-
-                        packet = EtherbonePacket(self.addr_width)
-                        packet.records = [record]
-                        packet.encode()
-                        self.send_packet(client_socket, packet)
-
-                    # Release hardware lock.
-                    self.lock = False
-
-            finally:
-                print("Disconnect")
-                client_socket.close()
-
-    def start(self, nthreads):
-        for i in range(nthreads):
-            self.serve_thread = threading.Thread(target=self._serve_thread)
-            self.serve_thread.setDaemon(True)
-            self.serve_thread.start()
+                responses = self._serve_records([record for client, arrival, record in batch])
+            except Exception as e:
+                print(f"Error while serving records: {e}")
+                for client in {client for client, arrival, record in batch}:
+                    self.loop.call_soon_threadsafe(client.writer.close)
+                continue
+            for (client, arrival, record), response in zip(batch, responses):
+                if response is not None:
+                    self.loop.call_soon_threadsafe(self._send_response, client, response)
+                client.update(record, time.perf_counter() - arrival)
+
+    # Clients --------------------------------------------------------------------------------------
+
+    async def _serve_client(self, reader, writer):
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        addr = writer.get_extra_info("peername")
+        self._send_server_info(writer)
+        print("Connected with " + addr[0] + ":" + str(addr[1]))
+        client = RemoteServerClient(
+            name     = addr[0] + ":" + str(addr[1]),
+            writer   = writer,
+            priority = self.priorities.get(addr[0], 0))
+        with self.requests:
+            self.clients.append(client)
+        try:
+            while True:
+                # Receive packet.
+                packet = await self.receive_packet_async(reader, self.addr_width // 8)
+                if packet == 0:
+                    break
+                # Decode it and queue its records.
+                header, records = decode_etherbone_packet(packet)
+                if header["magic"] != etherbone_magic:
+                    # Also the symptom of packets with several records sent without their number
+                    # of records in the packet header (see encode_etherbone_packet's framed).
+                    raise ValueError("Invalid Etherbone packet (packets with several records must be framed).")
+                with self.requests:
+                    arrival = time.perf_counter()
+                    client.queue.extend((arrival, record) for record in records)
+                    self.requests.notify()
+                # Stop receiving from clients that do not read their responses.
+                await writer.drain()
+        except ConnectionError:
+            pass
+        except (ValueError, struct.error) as e:
+            print(f"Error from {client}: {e}")
+        finally:
+            print(f"Disconnect ({client})")
+            with self.requests:
+                client.closed = True
+                self.clients.remove(client)
+            writer.close()
+
+    async def _serve(self):
+        server = await asyncio.start_server(self._serve_client, sock=self.socket)
+        async with server:
+            await server.serve_forever()
+
+    def _run(self):
+        try:
+            self.loop.run_until_complete(self.serve_task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.loop.close()
+
+    def start(self, nthreads=1):
+        # nthreads is kept for compatibility: clients are all handled by the same event loop.
+        self.running         = True
+        self.loop            = asyncio.new_event_loop()
+        self.serve_task      = self.loop.create_task(self._serve())
+        self.serve_thread    = threading.Thread(target=self._run, daemon=True)
+        self.schedule_thread = threading.Thread(target=self._schedule, daemon=True)
+        self.serve_thread.start()
+        self.schedule_thread.start()
 
 # Run ----------------------------------------------------------------------------------------------
 
@@ -184,6 +378,8 @@ def main():
     parser.add_argument("--bind-port",       default=1234,           help="Host bind port.")
     parser.add_argument("--addr-width",      default=32,             help="bus address width.")
     parser.add_argument("--debug",           action="store_true",    help="Enable debug.")
+    parser.add_argument("--scheduling",      default="round-robin",  help="Clients scheduling (round-robin or priority).", choices=["round-robin", "priority"])
+    parser.add_argument("--priority",        default=[],             help="Client priority as IP=PRIORITY (higher first).", action="append")
 
     # UART arguments
     parser.add_argument("--uart",            action="store_true",    help="Select UART interface.")
@@ -281,9 +477,16 @@ def main():
         parser.print_help()
         exit()
 
-    server = RemoteServer(comm, args.bind_ip, int(args.bind_port), addr_width=int(args.addr_width))
+    priorities = {}
+    for priority in args.priority:
+        ip, priority = priority.split("=")
+        priorities[ip] = int(priority)
+    server = RemoteServer(comm, args.bind_ip, int(args.bind_port),
+        addr_width = int(args.addr_width),
+        scheduling = args.scheduling,
+        priorities = priorities)
     server.open()
-    server.start(4)
+    server.start()
     try:
         import time
         while True: time.sleep(100)
@@ -149,6 +149,19 @@ _io = [
     )
 ]
 
+def sim_ram_io(name, bus):
+    # Wishbone slave served by the "ram" sim module.
+    return [(name, 0,
+        Subsignal("adr",   Pins(len(bus.adr))),
+        Subsignal("dat_w", Pins(len(bus.dat_w))),
+        Subsignal("dat_r", Pins(len(bus.dat_r))),
+        Subsignal("sel",   Pins(len(bus.sel))),
+        Subsignal("cyc",   Pins(1)),
+        Subsignal("stb",   Pins(1)),
+        Subsignal("ack",   Pins(1)),
+        Subsignal("we",    Pins(1)),
+    )]
+
 # Platform -----------------------------------------------------------------------------------------
 
 class Platform(SimPlatform):
@@ -183,6 +196,7 @@ class SimSoC(SoCCore):
         sim_debug              = False,
         trace_reset_on         = False,
         with_jtag              = False,
+        sim_ram_size           = 0,
         **kwargs):
 
         # Platform ---------------------------------------------------------------------------------
@@ -206,8 +220,34 @@ class SimSoC(SoCCore):
         #self.add_config("BIOS_NO_BUILD_TIME")
         #self.add_config("BIOS_NO_CRC")
 
+        # Main RAM (Sim Module) --------------------------------------------------------------------
+        if sim_ram_size:
+            # Main RAM provided by the "ram" sim module, initialized at simulation startup.
+            assert self.bus.standard == "wishbone"
+            main_ram_bus = wishbone.Interface(
+                data_width    = self.bus.data_width,
+                address_width = self.bus.address_width,
+            )
+            platform.add_extension(sim_ram_io("main_ram", main_ram_bus))
+            main_ram_pads = platform.request("main_ram")
+            self.comb += [
+                main_ram_pads.adr.eq(main_ram_bus.adr),
+                main_ram_pads.dat_w.eq(main_ram_bus.dat_w),
+                main_ram_pads.sel.eq(main_ram_bus.sel),
+                main_ram_pads.cyc.eq(main_ram_bus.cyc),
+                main_ram_pads.stb.eq(main_ram_bus.stb),
+                main_ram_pads.we.eq(main_ram_bus.we),
+                main_ram_bus.dat_r.eq(main_ram_pads.dat_r),
+                main_ram_bus.ack.eq(main_ram_pads.ack),
+            ]
+            self.bus.add_slave("main_ram", main_ram_bus, SoCRegion(
+                origin = self.mem_map["main_ram"],
+                size   = sim_ram_size,
+                mode   = "rwx",
+            ))
+
         # SDRAM ------------------------------------------------------------------------------------
-        if not self.integrated_main_ram_size and with_sdram:
+        if not self.integrated_main_ram_size and not sim_ram_size and with_sdram:
             sdram_clk_freq = int(100e6) # FIXME: use 100MHz timings
             if sdram_spd_data is None:
                 sdram_module_cls = getattr(litedram_modules, sdram_module)
@@ -424,6 +464,7 @@ def sim_args(parser):
     # ROM / RAM.
     parser.add_argument("--rom-init",             default=None,            help="ROM init file (.bin or .json).")
     parser.add_argument("--ram-init",             default=None,            help="RAM init file (.bin or .json).")
+    parser.add_argument("--ram-init-runtime",     action="store_true",     help="Load RAM init file(s) at simulation startup (mmap) instead of embedding them in the gateware.")
 
     # DRAM.
     parser.add_argument("--with-sdram",           action="store_true",     help="Enable SDRAM support.")
@@ -503,8 +544,27 @@ def main():
 
     # RAM / SDRAM.
     ram_boot_address = None
+    if args.ram_init_runtime and not args.integrated_main_ram_size:
+        parser.error("--ram-init-runtime is only supported with --integrated-main-ram-size (not with --with-sdram).")
     soc_kwargs["integrated_main_ram_size"] = args.integrated_main_ram_size
-    if args.integrated_main_ram_size:
+    if args.integrated_main_ram_size and args.ram_init_runtime:
+        # Main RAM provided by the "ram" sim module: images are mapped at simulation startup, the
+        # gateware (and simulation build) don't depend on their content.
+        soc_kwargs["integrated_main_ram_size"] = 0
+        soc_kwargs["sim_ram_size"]             = args.integrated_main_ram_size
+        images = []
+        if args.ram_init is not None:
+            for filename, base in get_mem_regions(args.ram_init, conf_soc.mem_map["main_ram"]).items():
+                images.append([os.path.abspath(filename), int(base, 16) - conf_soc.mem_map["main_ram"]])
+            ram_boot_address = get_boot_address(args.ram_init)
+        sim_config.add_module("ram", "main_ram", args={
+            "base"       : conf_soc.mem_map["main_ram"],
+            "size"       : args.integrated_main_ram_size,
+            "data_width" : conf_soc.bus.data_width,
+            "endianness" : conf_soc.cpu.endianness,
+            "images"     : images,
+        })
+    elif args.integrated_main_ram_size:
         if args.ram_init is not None:
             soc_kwargs["integrated_main_ram_init"] = get_mem_data(args.ram_init,
                 data_width = conf_soc.bus.data_width,
@@ -572,6 +632,9 @@ def main():
         trace_reset_on         = int(float(args.trace_start)) > 0 or int(float(args.trace_end)) > 0,
         spi_flash_init         = None if args.spi_flash_init is None else get_mem_data(args.spi_flash_init, endianness="big"),
         **soc_kwargs)
+    if args.ram_init_runtime and args.ram_init is not None:
+        # Skip Main RAM test to avoid corrupting pre-initialized contents.
+        soc.add_config("MAIN_RAM_INIT", 1)
     if ram_boot_address is not None:
         if ram_boot_address == 0:
             ram_boot_address = conf_soc.mem_map["main_ram"]
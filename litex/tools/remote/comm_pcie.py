@@ -5,14 +5,18 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+import sys
 import ctypes
 import mmap
+from array import array
 
-from litex.tools.remote.csr_builder import CSRBuilder
+from litex.tools.remote.csr_builder import CSRBuilder, pad_block
 
 # CommPCIe -----------------------------------------------------------------------------------------
 
 class CommPCIe(CSRBuilder):
+    read_burst_length = 255
+
     def __init__(self, bar, csr_csv=None, debug=False):
         CSRBuilder.__init__(self, comm=self, csr_csv=csr_csv)
         if "/sys/bus/pci/devices" not in bar:
@@ -63,3 +67,27 @@ class CommPCIe(CSRBuilder):
             ctypes.c_uint32.from_buffer(self.mmap, addr + 4*i).value = value
             if self.debug:
                 print("write 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+
+    def read_block(self, addr, nbytes, progress=None):
+        # 32-bit accesses to the BAR, copied in a single array.
+        nwords = (nbytes + 3)//4
+        with memoryview(self.mmap) as mv:
+            words = array("I", mv[addr:addr + 4*nwords].cast("I"))
+        if sys.byteorder == "big":
+            words.byteswap()
+        if progress is not None:
+            progress(nbytes)
+        return words.tobytes()[:nbytes]
+
+    def write_block(self, addr, buffer, progress=None):
+        words = array("I")
+        words.frombytes(pad_block(buffer))
+        if sys.byteorder == "big":
+            words.byteswap()
+        with memoryview(self.mmap) as mv:
+            bar = mv[addr:addr + 4*len(words)].cast("I")
+            for i, value in enumerate(words):
+                bar[i] = value
+            bar.release()
+        if progress is not None:
+            progress(len(buffer))
@@ -7,7 +7,7 @@
 import serial
 import struct
 
-from litex.tools.remote.csr_builder import CSRBuilder
+from litex.tools.remote.csr_builder import CSRBuilder, swap_word_bytes, block_bursts, pad_block
 
 # Constants ----------------------------------------------------------------------------------------
 
@@ -19,6 +19,9 @@ CMD_READ_BURST_FIXED  = 0x04
 # CommUART -----------------------------------------------------------------------------------------
 
 class CommUART(CSRBuilder):
+    read_burst_length = 255
+    read_bursts       = ["incr", "fixed"]
+
     def __init__(self, port, baudrate=115200, csr_csv=None, debug=False, addr_width=32):
         CSRBuilder.__init__(self, comm=self, csr_csv=csr_csv)
         self.port       = serial.serial_for_url(port, baudrate)
@@ -93,3 +96,32 @@ class CommUART(CSRBuilder):
                     print("write 0x{:08x} @ 0x{:08x}".format(value, addr + offset, 4*i))
             offset += size
             length -= size
+
+    def _read_command(self, addr, length):
+        return bytes([CMD_READ_BURST_INCR, length]) + (addr//4).to_bytes(self.addr_bytes, byteorder="big")
+
+    def read_block(self, addr, nbytes, progress=None):
+        self._flush()
+        nwords = (nbytes + 3)//4
+        data   = bytearray(4*nwords)
+        bursts = list(block_bursts(addr, nwords, self.max_burst_length))
+        # Pipeline commands: the next burst is requested before receiving the current one.
+        if bursts:
+            self._write(self._read_command(bursts[0][0], bursts[0][2]))
+        for n, (burst_addr, offset, length) in enumerate(bursts):
+            if n + 1 < len(bursts):
+                self._write(self._read_command(bursts[n + 1][0], bursts[n + 1][2]))
+            data[4*offset:4*(offset + length)] = swap_word_bytes(self._read(4*length))
+            if progress is not None:
+                progress(min(4*(offset + length), nbytes))
+        return bytes(memoryview(data)[:nbytes])
+
+    def write_block(self, addr, buffer, progress=None):
+        self._flush()
+        data = swap_word_bytes(pad_block(buffer))
+        for burst_addr, offset, length in block_bursts(addr, len(data)//4, 8):
+            self._write(bytes([CMD_WRITE_BURST_INCR, length]) +
+                (burst_addr//4).to_bytes(self.addr_bytes, byteorder="big") +
+                data[4*offset:4*(offset + length)])
+            if progress is not None:
+                progress(min(4*(offset + length), len(buffer)))
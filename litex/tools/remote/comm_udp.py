@@ -8,15 +8,20 @@
 import socket
 import time
 
-from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord
-from litex.tools.remote.etherbone import EtherboneReads, EtherboneWrites
+from litex.tools.remote.etherbone import EtherbonePacket
+from litex.tools.remote.etherbone import encode_etherbone_reads, encode_etherbone_writes
+from litex.tools.remote.etherbone import decode_etherbone_packet, decode_etherbone_writes
 
-from litex.tools.remote.csr_builder import CSRBuilder
+from litex.tools.remote.csr_builder import CSRBuilder, swap_word_bytes, block_bursts, pad_block
 
 # CommUDP ------------------------------------------------------------------------------------------
 
 class CommUDP(CSRBuilder):
-    def __init__(self, server="192.168.1.50", port=1234, csr_csv=None, debug=False, timeout=1.0, addr_width=32):
+    # Maximum number of in-flight read bursts during block reads.
+    block_window = 4
+
+    def __init__(self, server="192.168.1.50", port=1234, csr_csv=None, debug=False, timeout=1.0, addr_width=32,
+        buffer_depth=16):
         CSRBuilder.__init__(self, comm=self, csr_csv=csr_csv)
         self.server = server
         self.port   = port
@@ -24,6 +29,9 @@ class CommUDP(CSRBuilder):
         self.timeout= timeout
         self.read_counter = 0
         self.addr_width   = addr_width
+        # Depth (in words) of the Etherbone core's record buffers (buffer_depth of add_etherbone):
+        # block accesses are split so that a record (and all the in-flight reads) fit in it.
+        self.buffer_depth = buffer_depth
 
     def open(self, probe=True):
         if hasattr(self, "socket"):
@@ -90,16 +98,8 @@ class CommUDP(CSRBuilder):
         for r in range(retries):
             self.read_counter += 1
 
-            record = EtherboneRecord(addr_size=self.addr_width//8)
-            record.reads = EtherboneReads(addr_size=self.addr_width//8, addrs=[addr+4*j for j in range(length_int)])
-            record.rcount = len(record.reads)
-            record.reads.base_ret_addr = self.read_counter
-
-            packet = EtherbonePacket(addr_width=self.addr_width)
-            packet.records = [record]
-            packet.encode()
-
-            self.socket.sendto(packet.bytes, (self.server, self.port))
+            packet = encode_etherbone_reads(self.addr_width, self.read_counter, addr, length_int)
+            self.socket.sendto(packet, (self.server, self.port))
 
             timed_out = False
             while True:
@@ -111,15 +111,14 @@ class CommUDP(CSRBuilder):
                     timed_out = True
                     break
 
-                packet = EtherbonePacket(self.addr_width, datas)
-                packet.decode()
-                record = packet.records.pop()
-                datas = record.writes.get_datas()
-                if record.writes.base_addr == self.read_counter:
+                header, records = decode_etherbone_packet(datas)
+                record = records.pop()
+                datas  = record.datas.tolist()
+                if record.base_addr == self.read_counter:
                     break
                 else:
                     if self.debug:
-                        print(f"WARNING: request/response id mismatch: 0x{self.read_counter:08x} != 0x{record.writes.base_addr:08x}")
+                        print(f"WARNING: request/response id mismatch: 0x{self.read_counter:08x} != 0x{record.base_addr:08x}")
 
             if not timed_out:
                 break
@@ -135,17 +134,66 @@ class CommUDP(CSRBuilder):
 
     def write(self, addr, datas):
         datas = datas if isinstance(datas, list) else [datas]
-        length = len(datas)
-        record = EtherboneRecord(addr_size=self.addr_width//8)
-        record.writes = EtherboneWrites(addr_size=self.addr_width//8, base_addr=addr, datas=iter(datas))
-        record.wcount = len(record.writes)
-
-        packet = EtherbonePacket(self.addr_width)
-        packet.records = [record]
-        packet.encode()
-
-        self.socket.sendto(packet.bytes, (self.server, self.port))
+        packet = encode_etherbone_writes(self.addr_width, addr, datas)
+        self.socket.sendto(packet, (self.server, self.port))
 
         if self.debug:
             for i, value in enumerate(datas):
                 print("write 0x{:08x} @ 0x{:08x}".format(value, addr + 4*i))
+
+    def _block_burst_length(self, window=1):
+        # Burst length (in words) allowing window bursts to be buffered by the Etherbone core.
+        return max(1, min(self.max_burst_length, self.buffer_depth//window))
+
+    def read_block(self, addr, nbytes, progress=None):
+        nwords  = (nbytes + 3)//4
+        data    = bytearray(4*nwords)
+        length  = self._block_burst_length(self.block_window)
+        window  = max(1, min(self.block_window, self.buffer_depth//length))
+        bursts  = list(block_bursts(addr, nwords, length))
+        pending = {} # Tag -> Burst of in-flight reads.
+        done    = 0
+        retries = 10
+        while bursts or pending:
+            # Keep up to window bursts in flight, each tagged with its own read counter.
+            while bursts and len(pending) < window:
+                burst = bursts.pop(0)
+                self.read_counter += 1
+                pending[self.read_counter] = burst
+                burst_addr, offset, length = burst
+                self.socket.sendto(encode_etherbone_reads(self.addr_width, self.read_counter,
+                    burst_addr, length), (self.server, self.port))
+
+            try:
+                datas, dummy = self.socket.recvfrom(8192)
+            except socket.timeout:
+                # Re-issue all in-flight bursts.
+                retries -= 1
+                if self.debug:
+                    print("socket timeout, retrying ({}/{})".format(10 - retries, 10))
+                if retries == 0:
+                    raise socket.timeout
+                bursts = list(pending.values()) + bursts
+                pending.clear()
+                continue
+
+            tag, datas = decode_etherbone_writes(datas, self.addr_width//8)
+            burst = pending.pop(tag, None)
+            if burst is None:
+                if self.debug:
+                    print(f"WARNING: unexpected response id: 0x{tag:08x}")
+                continue
+            burst_addr, offset, length = burst
+            data[4*offset:4*(offset + length)] = swap_word_bytes(datas)
+            done += 4*length
+            if progress is not None:
+                progress(min(done, nbytes))
+        return bytes(memoryview(data)[:nbytes])
+
+    def write_block(self, addr, buffer, progress=None):
+        data = swap_word_bytes(pad_block(buffer))
+        for burst_addr, offset, length in block_bursts(addr, len(data)//4, self._block_burst_length()):
+            self.socket.sendto(encode_etherbone_writes(self.addr_width, burst_addr,
+                data[4*offset:4*(offset + length)]), (self.server, self.port))
+            if progress is not None:
+                progress(min(4*(offset + length), len(buffer)))
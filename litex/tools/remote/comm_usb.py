@@ -62,6 +62,8 @@ from litex.tools.remote.csr_builder import CSRBuilder
 # CommUSB ------------------------------------------------------------------------------------------
 
 class CommUSB(CSRBuilder):
+    read_burst_length = 255
+
     def __init__(self, vid=None, pid=None, max_retries=10, csr_csv=None, debug=False):
         CSRBuilder.__init__(self, comm=self, csr_csv=csr_csv)
         self.vid         = vid
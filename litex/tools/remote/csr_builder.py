@@ -5,7 +5,14 @@
 # Copyright (c) 2016 Tim 'mithro' Ansell <mithro@mithis.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import os
 import csv
+import sys
+import json
+import hashlib
+import tempfile
+from array import array
+from fnmatch import fnmatch
 
 # CSR Elements -------------------------------------------------------------------------------------
 
@@ -24,6 +31,36 @@ class CSRElements:
             pass
         raise AttributeError("No such element " + attr)
 
+class CSRRegisters(CSRElements):
+    """Registers of a CSRMap, CSRRegister objects being created on first access."""
+    __slots__ = ("_csr_map", "_readfn", "_writefn", "_data_width")
+
+    def __init__(self, csr_map, readfn, writefn, data_width):
+        CSRElements.__init__(self, {})
+        self._csr_map    = csr_map
+        self._readfn     = readfn
+        self._writefn    = writefn
+        self._data_width = data_width
+
+    def _register(self, name):
+        addr, length, mode = self._csr_map.register(name)
+        return CSRRegister(self._readfn, self._writefn, name, addr, length, self._data_width, mode)
+
+    @property
+    def d(self):
+        if len(self.__dict__) != len(self._csr_map.names):
+            # Create the remaining registers, keeping the csr.csv order.
+            regs = self.__dict__
+            self.__dict__ = {name: regs[name] if name in regs else self._register(name)
+                for name in self._csr_map.names}
+        return self.__dict__
+
+    def __getattr__(self, attr):
+        if not attr.startswith("_") and attr in self._csr_map.index:
+            register = self.__dict__[attr] = self._register(attr)
+            return register
+        raise AttributeError("No such element " + attr)
+
 class CSRRegister:
     def __init__(self, readfn, writefn, name, addr, length, data_width, mode):
         self.readfn     = readfn
@@ -61,12 +98,328 @@ class CSRMemoryRegion:
         self.size = size
         self.type = type
 
+# CSR Map ------------------------------------------------------------------------------------------
+
+class CSRMap:
+    """CSR map (bases, registers, constants and memory regions) of a SoC.
+
+    Loaded from a csr.csv or csr.json file in a single pass. Registers are stored in a compact
+    table (names, addresses, lengths and modes, in file order) indexed by name and by address.
+
+    The parsed map is cached in a JSON sidecar file (<filename>.cache.json) keyed on the file's
+    modification time, size and content hash: the sidecar is used when the modification time and
+    size match, or when the content is unchanged (ex: file rewritten by a new build), and the file
+    is parsed otherwise. The maps are also memoized for the current process.
+    """
+    version = 1
+    _maps   = {} # (Path, Modification time, Size) -> CSRMap.
+
+    def __init__(self, bases=None, constants=None, memories=None, names=None, addrs=(), lengths=(), modes=None):
+        self.bases     = {} if bases     is None else bases     # Name -> Address.
+        self.constants = {} if constants is None else constants # Name -> Value.
+        self.memories  = {} if memories  is None else memories  # Name -> (Base, Size, Type).
+        self.names     = [] if names     is None else names     # Register names.
+        self.addrs     = array("Q", addrs)                      # Register addresses.
+        self.lengths   = array("H", lengths)                    # Register lengths (in words).
+        self.modes     = [] if modes     is None else modes     # Register modes ("rw", "ro").
+        self._index     = None
+        self._addresses = None
+
+    @property
+    def index(self):
+        """Register Name -> Register index."""
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self.names)}
+        return self._index
+
+    def register(self, name):
+        """Returns (addr, length, mode) of the register name."""
+        i = self.index[name]
+        return self.addrs[i], self.lengths[i], self.modes[i]
+
+    def register_at(self, addr):
+        """Returns the name of the register at addr (or None)."""
+        if self._addresses is None:
+            self._addresses = {}
+            for name, base, length in zip(self.names, self.addrs, self.lengths):
+                for i in range(length):
+                    self._addresses.setdefault(base + 4*i, name)
+        return self._addresses.get(addr & ~0x3)
+
+    @staticmethod
+    def parse_csv(data):
+        bases, constants, memories = {}, {}, {}
+        names, addrs, lengths, modes = [], [], [], []
+        for row in csv.reader(data.splitlines()):
+            if not row or row[0].startswith("#"):
+                continue
+            group, name, value, length, mode = row
+            if group == "csr_register":
+                names.append(name)
+                addrs.append(int(value, 16))
+                lengths.append(int(length))
+                modes.append(sys.intern(mode))
+            elif group == "csr_base":
+                bases[name] = int(value, 16)
+            elif group == "constant":
+                try:
+                    constants[name] = int(value)
+                except:
+                    constants[name] = value
+            elif group == "memory_region":
+                memories[name] = (int(value, 16), int(length), mode)
+        return CSRMap(bases, constants, memories, names, addrs, lengths, modes)
+
+    @staticmethod
+    def parse_json(data):
+        d = json.loads(data)
+        registers = d.get("csr_registers", {})
+        return CSRMap(
+            bases     = dict(d.get("csr_bases", {})),
+            constants = dict(d.get("constants", {})),
+            memories  = {name: (m["base"], m["size"], m["type"]) for name, m in d.get("memories", {}).items()},
+            names     = list(registers.keys()),
+            addrs     = [r["addr"] for r in registers.values()],
+            lengths   = [r["size"] for r in registers.values()],
+            modes     = [sys.intern(r["type"]) for r in registers.values()])
+
+    def to_dict(self):
+        return {
+            "bases"     : self.bases,
+            "constants" : self.constants,
+            "memories"  : self.memories,
+            "names"     : self.names,
+            "addrs"     : self.addrs.tolist(),
+            "lengths"   : self.lengths.tolist(),
+            "modes"     : self.modes,
+        }
+
+    @staticmethod
+    def from_dict(d):
+        return CSRMap(
+            bases     = d["bases"],
+            constants = d["constants"],
+            memories  = {name: tuple(m) for name, m in d["memories"].items()},
+            names     = d["names"],
+            addrs     = d["addrs"],
+            lengths   = d["lengths"],
+            modes     = [sys.intern(mode) for mode in d["modes"]])
+
+    @classmethod
+    def load(cls, filename, cache=True):
+        st  = os.stat(filename)
+        key = (os.path.abspath(filename), st.st_mtime_ns, st.st_size)
+        if cache and key in cls._maps:
+            return cls._maps[key]
+
+        # Sidecar with matching modification time/size.
+        sidecar = filename + ".cache.json"
+        cached  = cls._read_sidecar(sidecar) if cache else None
+        if cached is not None and (cached["mtime_ns"], cached["size"]) == (st.st_mtime_ns, st.st_size):
+            csr_map = cached["map"]
+        else:
+            # Sidecar with matching content hash, or parse.
+            with open(filename, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if cached is not None and cached["sha256"] == digest:
+                csr_map = cached["map"]
+            elif filename.endswith(".json"):
+                csr_map = cls.parse_json(data)
+            else:
+                csr_map = cls.parse_csv(data.decode())
+            if cache:
+                cls._write_sidecar(sidecar, {
+                    "version"  : cls.version,
+                    "mtime_ns" : st.st_mtime_ns,
+                    "size"     : st.st_size,
+                    "sha256"   : digest,
+                    "map"      : csr_map.to_dict(),
+                })
+        if cache:
+            cls._maps[key] = csr_map
+        return csr_map
+
+    @classmethod
+    def _read_sidecar(cls, sidecar):
+        # Missing, stale (other version) or invalid sidecars are ignored.
+        try:
+            with open(sidecar, "rb") as f:
+                d = json.load(f)
+            if d["version"] != cls.version:
+                return None
+            return {
+                "mtime_ns" : d["mtime_ns"],
+                "size"     : d["size"],
+                "sha256"   : d["sha256"],
+                "map"      : cls.from_dict(d["map"]),
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, OverflowError):
+            return None
+
+    @staticmethod
+    def _write_sidecar(sidecar, d):
+        # Written atomically (concurrent loads), the sidecar being optional (ex: read-only directory).
+        try:
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(sidecar)), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(d, f)
+                os.replace(tmp, sidecar)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+# CSR Access Cache ---------------------------------------------------------------------------------
+
+class CSRAccessCache:
+    """Read-cache and write-combining layer for CSR register accesses.
+
+    Installed on the registers by CSRBuilder.enable_csr_cache, it reduces the number of bridge
+    transactions:
+
+    - Registers are cached according to their csr.csv mode: "rw" (storage) registers keep the
+      values written/read, "ro" (status) registers are only cached when declared as constants
+      (ex: identifier). Registers matching uncached (ex: raw CSRs with side effects on reads) are
+      never cached. Patterns are fnmatch patterns on the register names.
+    - Writes are deferred and writes to adjacent addresses merged in bursts. Pending writes are
+      issued (in order) on flush() or before any read going to the hardware (read barrier).
+    - Raw (non-register) accesses wrapped with raw_access() issue the pending writes before
+      going to the hardware and raw writes drop the cached words they overlap.
+
+    The cached values can be dropped with invalidate() (ex: after a SoC reset).
+    """
+    def __init__(self, registers, readfn, writefn, constants=[], uncached=[], max_burst_length=255):
+        self.max_burst_length = max_burst_length
+        self.cacheable = set() # Addresses of the cacheable words.
+        self.values    = {}    # Address -> Cached word.
+        self.writes    = []    # Pending write bursts: [addr, datas].
+        self.readfn    = readfn
+        self.writefn   = writefn
+        self.internal  = 0     # Nesting of the cache's own hardware accesses.
+
+        # Counters.
+        self.hits         = 0 # Reads served from the cache.
+        self.reads        = 0 # Reads issued to the hardware.
+        self.write_bursts = 0 # Write bursts issued to the hardware.
+
+        for register in registers:
+            if any(fnmatch(register.name, pattern) for pattern in uncached):
+                cacheable = False
+            elif any(fnmatch(register.name, pattern) for pattern in constants):
+                cacheable = True
+            else:
+                cacheable = (register.mode == "rw")
+            if cacheable:
+                self.cacheable.update(register.addr + 4*i for i in range(register.length))
+            register.readfn  = self.read
+            register.writefn = self.write
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    def read(self, addr, length=None):
+        length_int = 1 if length is None else length
+        datas = [self.values.get(addr + 4*i) for i in range(length_int)]
+        if None in datas:
+            self.flush()
+            self.internal += 1
+            try:
+                datas = self.readfn(addr, length=length_int)
+            finally:
+                self.internal -= 1
+            for i, data in enumerate(datas):
+                if addr + 4*i in self.cacheable:
+                    self.values[addr + 4*i] = data
+            self.reads += 1
+        else:
+            self.hits += 1
+        return datas[0] if length is None else datas
+
+    def write(self, addr, datas):
+        datas = datas if isinstance(datas, list) else [datas]
+        for i, data in enumerate(datas):
+            if addr + 4*i in self.cacheable:
+                self.values[addr + 4*i] = data
+        # Merge with the last pending burst when adjacent.
+        if self.writes:
+            burst_addr, burst_datas = self.writes[-1]
+            if (burst_addr + 4*len(burst_datas) == addr) and (len(burst_datas) + len(datas) <= self.max_burst_length):
+                burst_datas.extend(datas)
+                return
+        self.writes.append([addr, list(datas)])
+
+    def flush(self):
+        writes, self.writes = self.writes, []
+        self.internal += 1
+        try:
+            for addr, datas in writes:
+                self.writefn(addr, datas)
+                self.write_bursts += 1
+        finally:
+            self.internal -= 1
+
+    def invalidate(self, addr=None, length=1):
+        """Drops the cached words of length words at addr (all the cached words when addr is None)."""
+        if addr is None:
+            self.values.clear()
+        else:
+            for i in range(length):
+                self.values.pop(addr + 4*i, None)
+
+    def raw_access(self, fn, written=None):
+        """Wraps the raw access fn, written (when provided) returning the (addr, length) written."""
+        def access(*args, **kwargs):
+            if not self.internal:
+                self.flush()
+                if written is not None:
+                    self.invalidate(*written(*args, **kwargs))
+            return fn(*args, **kwargs)
+        return access
+
+# Block Helpers ------------------------------------------------------------------------------------
+
+def swap_word_bytes(data):
+    """Reverses the byte order of each 32-bit word of data (big-endian words <-> memory bytes)."""
+    words = array("I")
+    assert words.itemsize == 4
+    words.frombytes(data)
+    words.byteswap()
+    return words.tobytes()
+
+def block_bursts(addr, nwords, max_length):
+    """Splits a block access of nwords at addr in (addr, offset, length) bursts of max_length words."""
+    for offset in range(0, nwords, max_length):
+        yield addr + 4*offset, offset, min(max_length, nwords - offset)
+
+def pad_block(buffer):
+    """Returns buffer as bytes, zero padded to a multiple of 32-bit words."""
+    data = bytes(buffer)
+    if len(data) % 4:
+        data += bytes(4 - len(data) % 4)
+    return data
+
 # CSR Builder --------------------------------------------------------------------------------------
 
 class CSRBuilder:
+    # Maximum number of words per read/write burst (used by block accesses).
+    max_burst_length = 255
+
+    # Burst capabilities of the bridge, used by litex_server to coalesce accesses: maximum length
+    # (in words) of read/write bursts and supported read burst types ("incr"/"fixed").
+    read_burst_length  = 1
+    read_bursts        = ["incr"]
+    write_burst_length = 255
+
     def __init__(self, comm, csr_csv, csr_data_width=None, csr_bus_address_width=None):
         if csr_csv is not None:
-            self.items     = self.get_csr_items(csr_csv)
+            self.csr_csv   = csr_csv
+            self.csr_map   = CSRMap.load(csr_csv)
             self.constants = self.build_constants()
 
             # Load csr_data_width from the constants, otherwise it must be provided
@@ -95,43 +448,85 @@ class CSRBuilder:
             self.regs  = self.build_registers(comm.read, comm.write)
             self.mems  = self.build_memories()
 
+    def enable_csr_cache(self, constants=[], uncached=[]):
+        """Enables the CSRAccessCache layer on the registers and returns it.
+
+        The raw accesses of the comm (read/write, their _async variants and read_block/write_block)
+        are also wrapped, to keep them ordered with the deferred register writes."""
+        registers = self.regs.d.values() if hasattr(self, "regs") else []
+        cache     = CSRAccessCache(registers,
+            readfn           = self.read,
+            writefn          = self.write,
+            constants        = constants,
+            uncached         = uncached,
+            max_burst_length = self.max_burst_length)
+        written = {
+            "write"       : lambda addr, datas: (addr, len(datas) if isinstance(datas, list) else 1),
+            "write_async" : lambda addr, datas: (addr, len(datas) if isinstance(datas, list) else 1),
+            "write_block" : lambda addr, buffer, progress=None: (addr, (len(buffer) + 3)//4),
+        }
+        for name in ["read", "read_async", "read_block", "write", "write_async", "write_block"]:
+            fn = getattr(self, name, None)
+            if fn is not None:
+                setattr(self, name, cache.raw_access(fn, written.get(name)))
+        self.csr_cache = cache
+        return cache
+
     @staticmethod
     def get_csr_items(csr_csv):
         return list(csv.reader(filter(lambda row: row[0] != "#", open(csr_csv))))
 
+    @property
+    def items(self):
+        """Rows of the csr.csv file (read on first access, the CSRs being built from csr_map)."""
+        if not hasattr(self, "_items"):
+            self._items = self.get_csr_items(self.csr_csv)
+        return self._items
+
     def build_bases(self):
-        d = {}
-        for item in self.items:
-            group, name, addr, dummy0, dummy1 = item
-            if group == "csr_base":
-                d[name] = int(addr.replace("0x", ""), 16)
-        return CSRElements(d)
+        return CSRElements(dict(self.csr_map.bases))
 
     def build_registers(self, readfn, writefn):
-        d = {}
-        for item in self.items:
-            group, name, addr, length, mode = item
-            if group == "csr_register":
-                addr = int(addr.replace("0x", ""), 16)
-                length = int(length)
-                d[name] = CSRRegister(readfn, writefn, name, addr, length, self.csr_data_width, mode)
-        return CSRElements(d)
+        return CSRRegisters(self.csr_map, readfn, writefn, self.csr_data_width)
 
     def build_constants(self):
-        d = {}
-        for item in self.items:
-            group, name, value, dummy0, dummy1 = item
-            if group == "constant":
-                try:
-                    d[name] = int(value)
-                except:
-                    d[name] = value
-        return CSRElements(d)
+        return CSRElements(dict(self.csr_map.constants))
 
     def build_memories(self):
         d = {}
-        for item in self.items:
-            group, name, base, size, type = item
-            if group == "memory_region":
-                d[name] = CSRMemoryRegion(int(base, 16), int(size), type)
+        for name, (base, size, type) in self.csr_map.memories.items():
+            d[name] = CSRMemoryRegion(base, size, type)
         return CSRElements(d)
+
+    # Block Accesses -------------------------------------------------------------------------------
+
+    def read_block(self, addr, nbytes, progress=None):
+        """Reads nbytes from addr and returns them as bytes (32-bit words in little-endian order).
+
+        The access is split in bursts of max_burst_length words; progress, when provided, is called
+        with the number of bytes read after each burst. Comms override it with faster, pipelined
+        implementations."""
+        nwords = (nbytes + 3)//4
+        words  = array("I")
+        for burst_addr, offset, length in block_bursts(addr, nwords, self.max_burst_length):
+            words.extend(self.read(burst_addr, length))
+            if progress is not None:
+                progress(min(4*(offset + length), nbytes))
+        if sys.byteorder == "big":
+            words.byteswap()
+        return words.tobytes()[:nbytes]
+
+    def write_block(self, addr, buffer, progress=None):
+        """Writes buffer (32-bit words in little-endian order, zero padded) to addr.
+
+        The access is split in bursts of max_burst_length words; progress, when provided, is called
+        with the number of bytes written after each burst."""
+        data  = pad_block(buffer)
+        words = array("I")
+        words.frombytes(data)
+        if sys.byteorder == "big":
+            words.byteswap()
+        for burst_addr, offset, length in block_bursts(addr, len(words), self.max_burst_length):
+            self.write(burst_addr, words[offset:offset + length].tolist())
+            if progress is not None:
+                progress(min(4*(offset + length), len(buffer)))
@@ -5,8 +5,11 @@
 # Copyright (c) 2017 Tim Ansell <mithro@mithis.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import sys
 import math
 import struct
+from array import array
+from collections import namedtuple
 
 from litex.soc.interconnect.packet import HeaderField, Header
 
@@ -62,6 +65,129 @@ unpack_uint32_from = struct.Struct('>I').unpack
 pack_to_uint64 = struct.Struct('>Q').pack
 unpack_uint64_from = struct.Struct('>Q').unpack
 
+# Etherbone Codec ----------------------------------------------------------------------------------
+
+# Packets are encoded/decoded in a single pass with precompiled struct formats, addresses/datas
+# being converted from/to arrays of words in bulk (no per-word objects). The Etherbone classes
+# below are built on top of it and kept for compatibility.
+
+# The padding of the packet header (zero in Etherbone) carries the number of records of the packet
+# on streams where packets are not delimited (litex_server's TCP connections): 0 (as sent by the
+# other Etherbone implementations) means that the packet has a single record.
+etherbone_packet_header_struct = struct.Struct(">HBBH2x") # Magic, Version/Flags, Addr/Port Sizes, Records.
+etherbone_record_header_struct = struct.Struct(">BBBB")  # Flags, Byte Enable, WCount, RCount.
+
+etherbone_record_flags = {k: v.offset for k, v in etherbone_record_header_fields.items() if v.byte == 0}
+
+_word_typecodes = {size: [t for t in "BHILQ" if array(t).itemsize == size][0] for size in [1, 2, 4, 8]}
+
+class EtherboneRecordData(namedtuple("EtherboneRecordData",
+    ["flags", "byte_enable", "base_addr", "datas", "base_ret_addr", "addrs"])):
+    """Decoded Etherbone record, datas/addrs being arrays of words (empty when no writes/reads)."""
+    __slots__ = ()
+
+    @property
+    def wcount(self):
+        return len(self.datas)
+
+    @property
+    def rcount(self):
+        return len(self.addrs)
+
+def pack_words(words, size=4):
+    """Packs words (iterable of ints or array) in big-endian bytes of size bytes."""
+    words = array(_word_typecodes[size], words)
+    if sys.byteorder == "little":
+        words.byteswap()
+    return words.tobytes()
+
+def unpack_words(data, size=4):
+    """Unpacks big-endian bytes of size bytes words in an array."""
+    words = array(_word_typecodes[size])
+    words.frombytes(data)
+    if sys.byteorder == "little":
+        words.byteswap()
+    return words
+
+def encode_etherbone_packet_header(addr_size, port_size=4, nr=0, pr=0, pf=0, records=0):
+    return etherbone_packet_header_struct.pack(
+        etherbone_magic,
+        (etherbone_version << 4) | (nr << 2) | (pr << 1) | (pf << 0),
+        (addr_size << 4) | port_size,
+        records)
+
+def decode_etherbone_packet_header(data):
+    magic, flags, sizes, records = etherbone_packet_header_struct.unpack_from(data)
+    return {
+        "magic"     : magic,
+        "version"   : (flags >> 4) & 0xf,
+        "nr"        : (flags >> 2) & 0x1,
+        "pr"        : (flags >> 1) & 0x1,
+        "pf"        : (flags >> 0) & 0x1,
+        "addr_size" : (sizes >> 4) & 0xf,
+        "port_size" : (sizes >> 0) & 0xf,
+        "records"   : records,
+    }
+
+def encode_etherbone_record(addr_size, base_addr=0, datas=(), base_ret_addr=0, addrs=(), byte_enable=0xf, flags=0):
+    """Encodes a record writing datas to base_addr and reading addrs (returned to base_ret_addr).
+
+    datas can also be given as bytes (already encoded big-endian 32-bit words)."""
+    if isinstance(datas, (bytes, bytearray, memoryview)):
+        wdata = datas
+    else:
+        wdata = pack_words(datas)
+    rdata  = pack_words(addrs, addr_size)
+    wcount = len(wdata)//4
+    rcount = len(rdata)//addr_size
+    if wcount > 255 or rcount > 255:
+        raise ValueError(f"Burst size of {max(wcount, rcount)} exceeds maximum of 255 allowed by Etherbone.")
+    record = [etherbone_record_header_struct.pack(flags, byte_enable, wcount, rcount)]
+    if wcount:
+        record += [base_addr.to_bytes(addr_size, "big"), wdata]
+    if rcount:
+        record += [base_ret_addr.to_bytes(addr_size, "big"), rdata]
+    return b"".join(record)
+
+def decode_etherbone_record(data, addr_size, offset=0):
+    """Decodes the record at offset, returns (EtherboneRecordData, offset of the next record)."""
+    flags, byte_enable, wcount, rcount = etherbone_record_header_struct.unpack_from(data, offset)
+    offset += etherbone_record_header_length
+    base_addr, datas = 0, unpack_words(b"")
+    if wcount:
+        base_addr = int.from_bytes(data[offset:offset + addr_size], "big")
+        offset   += addr_size
+        datas     = unpack_words(data[offset:offset + 4*wcount])
+        offset   += 4*wcount
+    base_ret_addr, addrs = 0, unpack_words(b"", addr_size)
+    if rcount:
+        base_ret_addr = int.from_bytes(data[offset:offset + addr_size], "big")
+        offset       += addr_size
+        addrs         = unpack_words(data[offset:offset + rcount*addr_size], addr_size)
+        offset       += rcount*addr_size
+    return EtherboneRecordData(flags, byte_enable, base_addr, datas, base_ret_addr, addrs), offset
+
+def encode_etherbone_packet(addr_width, records, nr=0, pr=0, pf=0, framed=False):
+    """Encodes a packet from records (as encoded by encode_etherbone_record).
+
+    With framed, the number of records is carried in the packet header, as required to send packets
+    with several records to litex_server."""
+    header = encode_etherbone_packet_header(addr_width//8, nr=nr, pr=pr, pf=pf,
+        records = len(records) if framed else 0)
+    return header + b"".join(records)
+
+def decode_etherbone_packet(data):
+    """Decodes a packet, returns (header fields dict, list of EtherboneRecordData)."""
+    header    = decode_etherbone_packet_header(data)
+    addr_size = header["addr_size"]
+    records   = []
+    offset    = etherbone_packet_header_length
+    length    = len(data)
+    while length > offset:
+        record, offset = decode_etherbone_record(data, addr_size, offset)
+        records.append(record)
+    return header, records
+
 # Packet -------------------------------------------------------------------------------------------
 
 class Packet(list):
@@ -114,32 +240,16 @@ class EtherboneWrites(Packet):
     def encode(self):
         if self.encoded:
             raise ValueError
-        ba = bytearray()
-        if self.addr_size == 4:
-            ba += pack_to_uint32(self.base_addr)
-        else:
-            ba += pack_to_uint64(self.base_addr)
-        for write in self.writes:
-            ba += pack_to_uint32(write.data)
-        self.bytes   = ba
+        self.bytes   = self.base_addr.to_bytes(self.addr_size, "big") + pack_words(self.get_datas())
         self.encoded = True
 
     def decode(self):
         if not self.encoded:
             raise ValueError
         ba = self.bytes
-        if self.addr_size == 4:
-            self.base_addr = unpack_uint32_from(ba[:self.addr_size])[0]
-        else:
-            self.base_addr = unpack_uint64_from(ba[:self.addr_size])[0]
-        writes = []
-        offset = self.addr_size
-        length = len(ba)
-        while length > offset:
-            writes.append(EtherboneWrite(unpack_uint32_from(ba[offset:offset+4])[0]))
-            offset += 4
-        self.writes  = writes
-        self.encoded = False
+        self.base_addr = int.from_bytes(ba[:self.addr_size], "big")
+        self.writes    = [EtherboneWrite(data) for data in unpack_words(ba[self.addr_size:])]
+        self.encoded   = False
 
     def __repr__(self):
         r = "Writes\n"
@@ -176,39 +286,16 @@ class EtherboneReads(Packet):
     def encode(self):
         if self.encoded:
             raise ValueError
-        ba = bytearray()
-        if (self.addr_size == 4):
-            ba += pack_to_uint32(self.base_ret_addr)
-        else:
-            ba += pack_to_uint64(self.base_ret_addr)
-        for read in self.reads:
-            if self.addr_size == 4:
-                ba += pack_to_uint32(read.addr)
-            else:
-                ba += pack_to_uint64(read.addr)
-        self.bytes   = ba
+        self.bytes   = self.base_ret_addr.to_bytes(self.addr_size, "big") + pack_words(self.get_addrs(), self.addr_size)
         self.encoded = True
 
     def decode(self):
         if not self.encoded:
             raise ValueError
         ba = self.bytes
-        if self.addr_size == 4:
-            base_ret_addr = unpack_uint32_from(ba[:self.addr_size])[0]
-        else:
-            base_ret_addr = unpack_uint64_from(ba[:self.addr_size])[0]
-        reads  = []
-        offset = self.addr_size
-        length = len(ba)
-        while length > offset:
-            v = ba[offset:offset+self.addr_size]
-            if self.addr_size == 4:
-                reads.append(EtherboneRead(unpack_uint32_from(v)[0]))
-            else:
-                reads.append(EtherboneRead(unpack_uint64_from(v)[0]))
-            offset += self.addr_size
-        self.reads   = reads
-        self.encoded = False
+        self.base_ret_addr = int.from_bytes(ba[:self.addr_size], "big")
+        self.reads         = [EtherboneRead(addr) for addr in unpack_words(ba[self.addr_size:], self.addr_size)]
+        self.encoded       = False
 
     def __repr__(self):
         r = "Reads\n"
@@ -239,34 +326,28 @@ class EtherboneRecord(Packet):
         self.encoded     = init != []
         self.addr_size   = addr_size
 
+    @classmethod
+    def from_data(cls, record, addr_size=4):
+        """Creates a (decoded) EtherboneRecord from an EtherboneRecordData."""
+        r = cls(addr_size)
+        for k, offset in etherbone_record_flags.items():
+            setattr(r, k, (record.flags >> offset) & 0x1)
+        r.byte_enable = record.byte_enable
+        r.wcount      = record.wcount
+        r.rcount      = record.rcount
+        if record.wcount:
+            r.writes = EtherboneWrites(addr_size=addr_size, base_addr=record.base_addr, datas=record.datas)
+        if record.rcount:
+            r.reads = EtherboneReads(addr_size=addr_size, base_ret_addr=record.base_ret_addr, addrs=record.addrs)
+        return r
+
     def decode(self):
         if not self.encoded:
             raise ValueError
-
-        # Decode header
-        header = list(self.bytes[:etherbone_record_header.length])
-        for k, v in sorted(etherbone_record_header.fields.items()):
-            setattr(self, k, get_field_data(v, header))
-        offset = etherbone_record_header.length
-
-        # Decode writes
-        if self.wcount:
-            init_length = (4 * self.wcount) + (self.addr_size)
-            self.writes = EtherboneWrites(
-                addr_size = self.addr_size,
-                init      = self.bytes[offset:offset + init_length])
-            offset += init_length
-            self.writes.decode()
-
-        # Decode reads
-        if self.rcount:
-            init_length = (self.rcount + 1) * self.addr_size
-            self.reads = EtherboneReads(
-                addr_size = self.addr_size,
-                init      = self.bytes[offset:offset + init_length])
-            offset += init_length
-            self.reads.decode()
-
+        record, offset = decode_etherbone_record(self.bytes, self.addr_size)
+        decoded = EtherboneRecord.from_data(record, self.addr_size)
+        for k in ["writes", "reads", "byte_enable", "wcount", "rcount", *etherbone_record_flags.keys()]:
+            setattr(self, k, getattr(decoded, k))
         self.encoded = False
 
     def encode(self):
@@ -277,26 +358,14 @@ class EtherboneRecord(Packet):
         self.wcount = 0 if self.writes is None else len(self.writes.writes)
         self.rcount = 0 if self.reads  is None else len(self.reads.reads)
 
-        ba = bytearray()
-
-        # Encode header
-        header = 0
-        for k, v in sorted(etherbone_record_header.fields.items()):
-            value = int.from_bytes(getattr(self, k).to_bytes(math.ceil(v.width/8), "big"), "little")
-            header += (value << v.offset+(v.byte*8))
-        ba += header.to_bytes(etherbone_record_header.length, "little")
-
-        # Encode writes
-        if self.wcount:
-            self.writes.encode()
-            ba += self.writes.bytes
-
-        # Encode reads
-        if self.rcount:
-            self.reads.encode()
-            ba += self.reads.bytes
-
-        self.bytes   = ba
+        self.bytes = encode_etherbone_record(
+            addr_size     = self.addr_size,
+            base_addr     = 0 if self.writes is None else self.writes.base_addr,
+            datas         = []  if self.writes is None else self.writes.get_datas(),
+            base_ret_addr = 0 if self.reads  is None else self.reads.base_ret_addr,
+            addrs         = []  if self.reads  is None else self.reads.get_addrs(),
+            byte_enable   = self.byte_enable,
+            flags         = sum(getattr(self, k) << offset for k, offset in etherbone_record_flags.items()))
         self.encoded = True
 
     def __repr__(self, n=0):
@@ -336,25 +405,10 @@ class EtherbonePacket(Packet):
         if not self.encoded:
             raise ValueError
 
-        ba = self.bytes
-
-        # Decode header
-        header = list(ba[:etherbone_packet_header.length])
-        for k, v in sorted(etherbone_packet_header.fields.items()):
-            setattr(self, k, get_field_data(v, header))
-        offset = etherbone_packet_header.length
-
-        # Decode records
-        length = len(ba)
-        while length > offset:
-            record = EtherboneRecord(addr_size=self.addr_size, init=ba[offset:])
-            record.decode()
-            self.records.append(record)
-            offset += etherbone_record_header.length
-            if record.wcount:
-                offset += (4*record.wcount) + self.addr_size
-            if record.rcount:
-                offset += (record.rcount + 1) * self.addr_size
+        header, records = decode_etherbone_packet(self.bytes)
+        for k, v in header.items():
+            setattr(self, k, v)
+        self.records += [EtherboneRecord.from_data(record, self.addr_size) for record in records]
 
         self.encoded = False
 
@@ -362,16 +416,12 @@ class EtherbonePacket(Packet):
         if self.encoded:
             raise ValueError
 
-        ba = bytearray()
-
-        # Encode header
-        header = 0
-        for k, v in sorted(etherbone_packet_header.fields.items()):
-            value = int.from_bytes(getattr(self, k).to_bytes(math.ceil(v.width/8), "big"), "little")
-            header += (value << v.offset+(v.byte*8))
-        ba += header.to_bytes(etherbone_packet_header.length, "little")
-
-        # Encode records
+        ba = bytearray(encode_etherbone_packet_header(
+            addr_size = self.addr_size,
+            port_size = self.port_size,
+            nr        = self.nr,
+            pr        = self.pr,
+            pf        = self.pf))
         for record in self.records:
             record.encode()
             ba += record.bytes
@@ -392,40 +442,90 @@ class EtherbonePacket(Packet):
                 r += record.__repr__(i)
         return r
 
+# Etherbone Single Record Packets ------------------------------------------------------------------
+
+def encode_etherbone_reads(addr_width, base_ret_addr, addr, length, burst="incr"):
+    """Encodes a packet reading length words from addr."""
+    addrs = range(addr, addr + 4*length, 4) if burst == "incr" else [addr]*length
+    return encode_etherbone_packet(addr_width, [
+        encode_etherbone_record(addr_width//8, base_ret_addr=base_ret_addr, addrs=addrs)])
+
+def encode_etherbone_writes(addr_width, base_addr, datas):
+    """Encodes a packet writing datas (words or bytes of big-endian 32-bit words) to base_addr."""
+    return encode_etherbone_packet(addr_width, [
+        encode_etherbone_record(addr_width//8, base_addr=base_addr, datas=datas)])
+
+def decode_etherbone_writes(packet, addr_size):
+    """Decodes a single record writes packet, returns (base_addr, datas as big-endian 32-bit words)."""
+    offset = etherbone_packet_header_length + etherbone_record_header_length
+    wcount = packet[offset - 2]
+    base_addr = int.from_bytes(packet[offset:offset + addr_size], "big")
+    offset += addr_size
+    return base_addr, packet[offset:offset + 4*wcount]
+
 # Etherbone IPC ------------------------------------------------------------------------------------
 
 class EtherboneIPC:
+    """Etherbone packets over a stream socket.
+
+    The stream does not carry the length of the packets: a packet is framed as its packet header
+    followed by the number of records given in the header (see encode_etherbone_packet's framed),
+    or by a single record when not given.
+    """
     def send_packet(self, socket, packet):
         socket.sendall(packet.bytes)
 
+    @staticmethod
+    def _records_count(packet_header):
+        return max(struct.unpack(">H", packet_header[4:6])[0], 1)
+
+    @staticmethod
+    def _record_length(record_header, addr_size):
+        wcount, rcount = struct.unpack(">BB", record_header[2:4])
+        record_length = etherbone_record_header_length
+        if wcount != 0:
+            record_length += 4 * (wcount) + addr_size
+        if rcount != 0:
+            record_length += (rcount + 1) * addr_size
+        return record_length
+
     def receive_packet(self, socket, addr_size):
         assert addr_size in [1, 2, 4, 8]
-        header_length = etherbone_packet_header_length + etherbone_record_header_length
-        packet = bytes()
-        try:
-            while len(packet) < header_length:
-                chunk = socket.recv(header_length - len(packet))
+        packet = bytearray()
+        def receive(length):
+            length += len(packet)
+            while len(packet) < length:
+                chunk = socket.recv(length - len(packet))
                 if len(chunk) == 0:
+                    return False
+                packet.extend(chunk)
+            return True
+        try:
+            if not receive(etherbone_packet_header_length):
+                return 0
+            for n in range(self._records_count(packet)):
+                if not receive(etherbone_record_header_length):
                     return 0
-                else:
-                    packet += chunk
-
-            wcount, rcount = struct.unpack(">BB", packet[header_length - 2:])
-            counts = wcount + rcount
-            packet_size = header_length
-            if wcount != 0:
-                packet_size += 4 * (wcount) + addr_size
-            if rcount != 0:
-                packet_size += (rcount + 1) * addr_size
-
-            while len(packet) < packet_size:
-                chunk = socket.recv(packet_size - len(packet))
-                if len(chunk) == 0:
+                record_header = packet[-etherbone_record_header_length:]
+                if not receive(self._record_length(record_header, addr_size) - etherbone_record_header_length):
                     return 0
-                else:
-                    packet += chunk
-
-            return packet
+            return bytes(packet)
 
         except TimeoutError:
-            return 0
\ No newline at end of file
+            return 0
+
+    async def receive_packet_async(self, reader, addr_size):
+        """asyncio variant of receive_packet, reading from an asyncio.StreamReader."""
+        import asyncio
+        assert addr_size in [1, 2, 4, 8]
+        try:
+            packet = [await reader.readexactly(etherbone_packet_header_length)]
+            for n in range(self._records_count(packet[0])):
+                record_header = await reader.readexactly(etherbone_record_header_length)
+                packet.append(record_header)
+                packet.append(await reader.readexactly(
+                    self._record_length(record_header, addr_size) - etherbone_record_header_length))
+            return b"".join(packet)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return 0
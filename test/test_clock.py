@@ -0,0 +1,38 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+
+from litex.soc.cores.clock import *
+
+
+class TestClock(unittest.TestCase):
+    def compute_config(self, pll, clkin_freq, clkout_freq):
+        pll.register_clkin(Signal(), clkin_freq)
+        pll.create_clkout(ClockDomain("sys"), clkout_freq)
+        return pll.compute_config()
+
+    # PFD range.
+    def test_s7pll_pfd_range(self):
+        config = self.compute_config(S7PLL(speedgrade=-1), 50e6, 148.5e6)
+        self.assertGreaterEqual(50e6/config["divclk_divide"], 19e6)
+
+    def test_ice40pll_pfd_range(self):
+        config = self.compute_config(iCE40PLL(), 25e6, 40e6)
+        self.assertGreaterEqual(25e6/(config["divr"] + 1), 10e6)
+        self.assertEqual(config["divr"], 1)
+
+    # Margins.
+    def test_uspmmcm_margin(self):
+        # USPMMCM accepts outputs within their margin of the generated frequency (math.isclose).
+        pll = USPMMCM(speedgrade=-2)
+        pll.register_clkin(Signal(), 125e6)
+        for n, freq in enumerate([150e6, 100e6, 148.5e6]):
+            pll.create_clkout(ClockDomain(f"clk{n}"), freq, margin=1e-2)
+        config = pll.compute_config()
+        self.assertEqual(config["vco"], 1500e6)
+        self.assertEqual(config["clkout2_freq"], 150e6)
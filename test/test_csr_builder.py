@@ -0,0 +1,44 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex.tools.remote.csr_builder import CSRMap
+
+
+class TestCSRMap(unittest.TestCase):
+    def load(self, filename):
+        CSRMap._maps.clear()
+        return CSRMap.load(filename)
+
+    # Sidecar.
+    def test_load_sidecar(self):
+        with tempfile.TemporaryDirectory() as d:
+            filename = os.path.join(d, "csr.csv")
+            with open(filename, "w") as f:
+                f.write("memory_region,sram,0x10000000,8192,cached\n")
+                f.write("csr_register,ctrl_reset,0xf0000000,1,rw\n")
+            csr_map = self.load(filename)
+            self.assertTrue(os.path.exists(filename + ".cache.json"))
+
+            # Loaded from the sidecar (also when only the modification time changed).
+            for mtime in [None, 1]:
+                if mtime is not None:
+                    os.utime(filename, ns=(mtime, mtime))
+                cached = self.load(filename)
+                self.assertEqual(cached.to_dict(), csr_map.to_dict())
+                self.assertEqual(cached.memories["sram"], (0x10000000, 8192, "cached"))
+
+            # Stale sidecar.
+            with open(filename, "a") as f:
+                f.write("csr_register,ctrl_scratch,0xf0000004,1,rw\n")
+            self.assertEqual(self.load(filename).names, ["ctrl_reset", "ctrl_scratch"])
+
+            # Invalid sidecar.
+            with open(filename + ".cache.json", "w") as f:
+                f.write("{")
+            self.assertEqual(self.load(filename).names, ["ctrl_reset", "ctrl_scratch"])
@@ -0,0 +1,91 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import socket
+import asyncio
+import unittest
+
+from litex.tools.remote.etherbone import *
+from litex.tools.litex_server import RemoteServer
+
+
+class MemoryComm:
+    def __init__(self):
+        self.mem = {}
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def read(self, addr, length=None, burst="incr"):
+        length = 1 if length is None else length
+        return [self.mem.get(addr + (4*i if burst == "incr" else 0), 0) for i in range(length)]
+
+    def write(self, addr, datas):
+        for i, data in enumerate(datas):
+            self.mem[addr + 4*i] = data
+
+
+def two_records_packet(framed=True):
+    # Write 2 words then read them back.
+    return encode_etherbone_packet(32, [
+        encode_etherbone_record(4, base_addr=0x100, datas=[0x12345678, 0x9abcdef0]),
+        encode_etherbone_record(4, base_ret_addr=0x200, addrs=[0x100, 0x104]),
+    ], framed=framed)
+
+
+class TestEtherbone(unittest.TestCase):
+    # Packet framing.
+    def test_receive_packet_records(self):
+        packet = two_records_packet()
+        a, b   = socket.socketpair()
+        with a, b:
+            a.sendall(packet + packet)
+            for i in range(2):
+                self.assertEqual(EtherboneIPC().receive_packet(b, 4), packet)
+        header, records = decode_etherbone_packet(packet)
+        self.assertEqual(header["records"], 2)
+        self.assertEqual(len(records), 2)
+
+    def test_receive_packet_async_records(self):
+        packet = two_records_packet()
+        async def receive():
+            reader = asyncio.StreamReader()
+            reader.feed_data(packet + packet)
+            reader.feed_eof()
+            packets = [await EtherboneIPC().receive_packet_async(reader, 4) for i in range(3)]
+            return packets
+        self.assertEqual(asyncio.run(receive()), [packet, packet, 0])
+
+    def test_receive_packet_unframed(self):
+        # Packets without number of records (other Etherbone implementations) have a single record.
+        packet = encode_etherbone_reads(32, 0x200, 0x100, 2)
+        self.assertEqual(decode_etherbone_packet_header(packet)["records"], 0)
+        a, b = socket.socketpair()
+        with a, b:
+            a.sendall(packet + packet)
+            for i in range(2):
+                self.assertEqual(EtherboneIPC().receive_packet(b, 4), packet)
+
+    # Server.
+    def test_server_records(self):
+        server = RemoteServer(MemoryComm(), "127.0.0.1", bind_port=0)
+        server.open()
+        server.start()
+        try:
+            port = server.socket.getsockname()[1]
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as s:
+                info = "MemoryComm:127.0.0.1:0".encode()
+                while len(info):
+                    info = info[len(s.recv(len(info))):]
+                s.sendall(two_records_packet())
+                header, records = decode_etherbone_packet(EtherboneIPC().receive_packet(s, 4))
+                self.assertEqual(len(records), 1)
+                self.assertEqual(records[0].base_addr, 0x200)
+                self.assertEqual(records[0].datas.tolist(), [0x12345678, 0x9abcdef0])
+        finally:
+            server.close()
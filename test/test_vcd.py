@@ -0,0 +1,53 @@
+#
+# This file is part of LiteX.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import tempfile
+import unittest
+
+from migen import *
+from migen.genlib.fifo import SyncFIFO
+
+from litex.gen.sim import run_simulation
+
+
+class FIFOTestBench(Module):
+    def __init__(self):
+        self.counter = Signal(8)
+        self.sync += self.counter.eq(self.counter + 1)
+        self.submodules.fifo = SyncFIFO(8, 4)
+        self.comb += [
+            self.fifo.din.eq(self.counter),
+            self.fifo.we.eq(1),
+        ]
+
+
+class TestVCD(unittest.TestCase):
+    def traced_signals(self, vcd_filter):
+        def generator():
+            for i in range(8):
+                yield
+        with tempfile.TemporaryDirectory() as d:
+            vcd_name = os.path.join(d, "sim.vcd")
+            run_simulation(FIFOTestBench(), generator(), vcd_name=vcd_name, vcd_filter=vcd_filter)
+            with open(vcd_name) as f:
+                return set(re.findall(r"\$var wire \d+ \S+ (\S+) \$end", f.read()))
+
+    # Signal filtering.
+    def test_filter_submodule(self):
+        signals = self.traced_signals(["fifo"])
+        for name in ["level", "produce", "consume", "din", "we"]:
+            self.assertTrue(any(name in s for s in signals), name)
+        self.assertFalse(any("counter" in s for s in signals))
+
+    def test_filter_callable(self):
+        paths = []
+        def vcd_filter(path):
+            paths.append(path)
+            return path.endswith("_counter")
+        signals = self.traced_signals(vcd_filter)
+        self.assertEqual(signals, {"counter"})
+        self.assertTrue(any("_fifo_syncfifo_level" in path for path in paths))